@@ -3,18 +3,18 @@
 
 # -*- coding: utf-8 -*-
 
-import io
+import asyncio
 import json
 import os
 import urllib.parse
 import urllib.request
 import uuid
+from contextlib import asynccontextmanager
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
-import requests  # 🔹 네이버 TTS 호출용
 from dotenv import load_dotenv
 from fastapi import (
     Depends,
@@ -24,17 +24,29 @@ from fastapi import (
     Request,
     APIRouter,
     Body,  # ✅ set-phone용
+    WebSocket,
+    WebSocketDisconnect,
 )
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, StreamingResponse  # 🔹 음성 스트리밍 응답
+from fastapi.responses import FileResponse, Response, StreamingResponse  # 🔹 음성 스트리밍 응답
 from openai import OpenAI
 from pydantic import BaseModel, Field
 from core.report_pdf import build_staff_report_pdf
-from speaker.stt_whisper import transcribe_bytes
+from speaker.stt_whisper import (
+    transcribe_bytes,
+    transcribe_fileobj,
+    transcribe_detect_language,
+    pcm16_to_wav_bytes,
+)
+from speaker.vad import StreamingEndpointer
+from speaker.audio_preprocess import preprocess_for_stt_async, AudioTooLongError
+from starlette.formparsers import MultiPartException, MultiPartParser
 from brain import minwon_engine  # (다른 곳에서 쓰일 가능성 있어 유지)
-from brain.text_session_state import TextSessionState
+from brain.text_session_state import TextSessionState, ClarificationChain
 from brain.turn_router import choose_issue_for_followup
 from brain.minwon_engine import run_pipeline_once, decide_stage_and_text
+from brain import phrase_catalog
 
 import db.models
 from sqlalchemy.orm import Session
@@ -50,22 +62,23 @@ router = APIRouter()
 from core.config import (
     LOG_DIR,
     WEATHER_API_KEY,
-    KASI_SERVICE_KEY,
-    WEATHER_API_URL,
-    KASI_LUNAR_URL,
-    KASI_24DIV_URL,
-    NAVER_API_KEY_ID,
-    NAVER_API_KEY,
-    NAVER_TTS_URL,
     OPENAI_API_KEY,
-    WHISPER_MODEL,
     CHAT_MODEL,
+    STT_MAX_UPLOAD_BYTES,
+    TTS_CACHE_MAX_AGE,
+    TTS_DEFAULT_SPEAKER,
+    TTS_DEFAULT_SPEED,
 )
 
 from core.logging import logger, log_event
+from core import http_client
 
 # 🔹 날씨+절기 통합 서비스
-from services.today_info import get_today_info, TodayInfo
+from services.today_info import get_today_info, fetch_season_info, TodayInfo
+from services import today_info, korean_calendar
+# 🔹 로컬 언어 식별 (다국어 STT 언어 감지 LLM 호출 줄이기)
+from services.lang_detect import identify_language
+from services import clova_tts, tts_cache, tts_prefetch, tts_prewarm, tts_stream
 
 print("🔥 Loaded app_fastapi from:", os.path.abspath(__file__))
 
@@ -106,6 +119,29 @@ def get_state(session_id: str) -> TextSessionState:
 # FastAPI 앱 기본 세팅
 # ============================================================
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """
+    앱 수명 동안 유지할 자원.
+    - 외부 API 공용 HTTP 연결 풀 (날씨 / KASI / TTS)
+    - 키오스크 지역 날씨 백그라운드 갱신 (헤더는 마지막 성공 값만 읽음)
+    - 고정 안내 문구 TTS 사전 생성 스레드
+    """
+    await http_client.startup()
+    today_info.start_weather_refresher()
+    if clova_tts.is_configured():
+        tts_prewarm.start(clova_tts.synthesize)
+    else:
+        logger.info("TTS prewarm 건너뜀: NAVER API 키 없음")
+
+    yield
+
+    tts_prewarm.stop()
+    clova_tts.close()
+    await today_info.stop_weather_refresher()
+    await http_client.shutdown()
+
+
 app = FastAPI(
     title="간편민원접수 백엔드 API",
     description="""
@@ -120,6 +156,7 @@ app = FastAPI(
   을 수행합니다.
 """,
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS: 개발 단계에서는 * 허용, 배포 시에는 도메인 제한 권장
@@ -150,6 +187,7 @@ class TextTurnRequest(BaseModel):
     텍스트 한 턴 입력용 요청 바디 모델.
     - session_id: 기존 대화 세션 ID (없으면 새로 생성됨)
     - text: STT 결과나 키보드 입력 등, 한 번에 처리할 민원 문장
+    - with_tts: True면 안내 음성을 바로 합성 시작하고 응답에 음성 주소(tts_audio)를 넣음
     """
     session_id: Optional[str] = Field(
         default=None,
@@ -163,6 +201,11 @@ class TextTurnRequest(BaseModel):
         examples=["우리집 앞에 나무가 쓰러져서 대문을 막았어"],
     )
 
+    with_tts: bool = Field(
+        default=False,
+        description="True면 summary_tts/result_tts 음성을 미리 합성하고 /tts/audio 주소를 함께 반환",
+    )
+
 
 class TextTurnResponse(BaseModel):
     """
@@ -192,6 +235,10 @@ class TextTurnResponse(BaseModel):
             "- staff_payload: 담당자용 요약 정보"
         ),
     )
+    tts_audio: Optional[Dict[str, str]] = Field(
+        default=None,
+        description="with_tts=True일 때 user_facing 음성 필드 → 음성 주소 (예: {\"result_tts\": \"/tts/audio/...\"})",
+    )
 
 
 # ============================================================
@@ -219,6 +266,8 @@ class HeaderStatusResponse(BaseModel):
     weather: Optional[WeatherInfo] = None
     lunar: Optional[LunarInfo] = None
     holiday: str = ""     # 공휴일 이름 (없으면 빈 문자열)
+    weather_age_sec: Optional[int] = None   # 날씨를 마지막으로 받아 온 뒤 지난 시간(초)
+    weather_stale: bool = False             # 갱신이 계속 실패해 오래된 날씨면 True
 
 
 # ============================================================
@@ -272,151 +321,47 @@ async def analyze_minwon(req: MinwonAnalyzeRequest):
 # 대기 화면용 보조 함수들 (실제 외부 API 연동)
 # ============================================================
 
-async def fetch_weather(location: str = "Gwangju") -> WeatherInfo:
-    """
-    WeatherAPI current 정보를 가져와서 헤더에 쓸 간단한 날씨 요약을 만든다.
-    """
-    print("🔥 [DEBUG] WEATHER_API_KEY in fetch_weather:", repr(WEATHER_API_KEY))
-
-    print("DEBUG WEATHER API KEY inside fetch_weather:", WEATHER_API_KEY)
-    print("[DEBUG] WEATHER location param:", location)
-
-    if not WEATHER_API_KEY:
-        logger.error("❌ [WeatherAPI] API 키가 없습니다. .env 파일을 확인하세요.")
-        raise RuntimeError("WEATHER_API_KEY가 설정되지 않았습니다.")
-
-    url = WEATHER_API_URL
-
-    params = {
-        "key": WEATHER_API_KEY,
-        "q": location,
-        "lang": "ko",
-        "aqi": "no",
-    }
-
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            res = await client.get(url, params=params)
-            print("[DEBUG] WEATHER status:", res.status_code)
-            print("[DEBUG] WEATHER body:", res.text[:200])
-
-            if res.status_code != 200:
-                logger.error(f"❌ [WeatherAPI] 호출 실패: {res.status_code} - {res.text}")
-                res.raise_for_status()
-
-            data = res.json()
-
-        current = data["current"]
-
-        logger.info(f"✅ [WeatherAPI] 날씨 조회 성공: {location}")
-
-        return WeatherInfo(
-            temp=round(current["temp_c"]),
-            max_temp=round(current["temp_c"]),  # current만 쓸 거면 일단 동일 값
-            min_temp=round(current["temp_c"]),
-            condition=current["condition"]["text"],
-            location=data["location"]["name"],
-            feels_like=round(current.get("feelslike_c", current["temp_c"])),
-        )
-
-    except Exception as e:
-        logger.warning(f"⚠️ [WeatherAPI] 처리 중 에러 발생: {e}")
-        raise HTTPException(status_code=500, detail=f"Weather API error: {e}")
-
-
-async def _fetch_lunar_date(today: date) -> str:
-    """
-    양력 today 기준 음력 날짜(YYYY-MM-DD)를 반환.
-    """
-    if not KASI_SERVICE_KEY:
-        raise RuntimeError("KASI_SERVICE_KEY가 설정되지 않았습니다.")
-
-    params = {
-        "solYear": today.strftime("%Y"),
-        "solMonth": today.strftime("%m"),
-        "solDay": today.strftime("%d"),
-        "ServiceKey": KASI_SERVICE_KEY,
-        "_type": "json",
-    }
-
-    async with httpx.AsyncClient(timeout=5.0) as client:
-        res = await client.get(KASI_LUNAR_URL, params=params)
-        res.raise_for_status()
-        data = res.json()
-
-    body = data["response"]["body"]
-    if int(body.get("totalCount", 0)) == 0:
-        return ""
-
-    item = body["items"]["item"]  # 하루 데이터 1개라고 가정
-    lun_year = int(item["lunYear"])
-    lun_month = int(item["lunMonth"])
-    lun_day = int(item["lunDay"])
-
-    return f"{lun_year:04d}-{lun_month:02d}-{lun_day:02d}"
-
-
-async def _fetch_seasonal_term(today: date) -> str:
+async def fetch_weather(location: str = "Gwangju") -> Optional[WeatherInfo]:
     """
-    오늘 날짜에 해당하는 24절기 이름을 반환. 없으면 빈 문자열.
+    헤더에 쓸 간단한 날씨 요약을 만든다.
+    외부 API를 기다리지 않고 services.today_info의 "마지막 성공 값"을 바로 사용하며,
+    아직 받은 적이 없으면 None (갱신은 백그라운드에서 진행).
     """
-    if not KASI_SERVICE_KEY:
-        raise RuntimeError("KASI_SERVICE_KEY가 설정되지 않았습니다.")
-
-    params = {
-        "solYear": today.strftime("%Y"),
-        "solMonth": today.strftime("%m"),
-        "ServiceKey": KASI_SERVICE_KEY,
-        "_type": "json",
-        "numOfRows": "50",
-        "pageNo": "1",
-    }
-
-    async with httpx.AsyncClient(timeout=5.0) as client:
-        res = await client.get(KASI_24DIV_URL, params=params)
-        res.raise_for_status()
-        data = res.json()
-
-    body = data["response"]["body"]
-    if int(body.get("totalCount", 0)) == 0:
-        return ""
-
-    items = body["items"]["item"]
-    if isinstance(items, dict):
-        items = [items]
-
-    today_str = today.strftime("%Y%m%d")
-    for item in items:
-        if str(item["locdate"]) == today_str:
-            return str(item["dateName"])
+    data, _age = today_info.get_weather_json(location)
+    if data is None:
+        return None
 
-    return ""
+    current = data.get("current") or {}
+    if current.get("temp_c") is None:
+        return None
+    forecast_day = (
+        (data.get("forecast") or {}).get("forecastday") or [{}]
+    )[0].get("day") or {}
+
+    return WeatherInfo(
+        temp=round(current["temp_c"]),
+        max_temp=round(forecast_day.get("maxtemp_c", current["temp_c"])),
+        min_temp=round(forecast_day.get("mintemp_c", current["temp_c"])),
+        condition=(current.get("condition") or {}).get("text", ""),
+        location=(data.get("location") or {}).get("name", location),
+        feels_like=round(current.get("feelslike_c", current["temp_c"])),
+    )
 
 
 async def get_lunar_and_seasonal(today: Optional[date] = None) -> LunarInfo:
     """
-    오늘 기준 음력 날짜 + 절기 이름을 한 번에 반환.
+    오늘(한국 날짜) 기준 음력 날짜 + 절기 이름을 한 번에 반환.
+    (services.today_info → 로컬 계산, 네트워크 없음)
     """
     if today is None:
-        today = date.today()
+        today = korean_calendar.today_kst()
 
-    lunar_date = ""
-    seasonal_term = ""
-
-    try:
-        lunar_date = await _fetch_lunar_date(today)
-    except Exception as e:
-        logger.warning(f"Lunar API error: {e}")
-
-    try:
-        seasonal_term = await _fetch_seasonal_term(today)
-    except Exception as e:
-        logger.warning(f"Seasonal-term API error: {e}")
+    season = await fetch_season_info(today)
 
     return LunarInfo(
         solar_date=today.isoformat(),
-        lunar_date=lunar_date,
-        seasonal_term=seasonal_term,
+        lunar_date=season.lunar_date or "",
+        seasonal_term=season.solar_term or "",
     )
 
 
@@ -490,48 +435,110 @@ def start_text_session():
 # STT 요청 공통 처리 유틸
 # ============================================================
 
+class _UploadTooLarge(MultiPartException):
+    """
+    업로드 본문이 제한을 넘음.
+    MultiPartException으로 던져야 Starlette 파서가 이미 만든 스풀 임시 파일을 닫는다.
+    """
+
+
+async def _capped_body_stream(request: Request, limit: int):
+    """
+    요청 본문을 흘려보내면서 누적 크기를 세고,
+    limit를 넘는 순간 바로 끊는 스트림 래퍼. (_parse_stt_request가 413으로 변환)
+    """
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > limit:
+            raise _UploadTooLarge(
+                f"오디오 업로드가 너무 큽니다. (최대 {limit // (1024 * 1024)}MB)"
+            )
+        yield chunk
+
+
 async def _parse_stt_request(request: Request) -> Dict[str, Any]:
     """
     /stt 관련 엔드포인트에서 공통으로 사용하는
-    - multipart/form-data 파싱
+    - multipart/form-data 파싱 (크기 제한 + 임시 파일 스풀링)
     - session_id 추출(폼/헤더/쿼리)
-    - 오디오 바이트/파일명 추출
+    - 오디오 파일 객체/파일명 추출
+    - STT 업로드 전 오디오 전처리(speaker.audio_preprocess)
     로직을 한 곳에 모은 함수입니다.
+
+    업로드는 메모리에 통째로 올리지 않고
+    Starlette 파서가 SpooledTemporaryFile(1MB 넘으면 디스크)로 받으며,
+    STT_MAX_UPLOAD_BYTES를 넘으면 다 받기 전에 413으로 거절합니다.
+    반환된 "form"은 처리 후 _close_stt_request로 닫아 임시 파일을 정리해야 합니다.
     """
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > STT_MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"오디오 업로드가 너무 큽니다. (최대 {STT_MAX_UPLOAD_BYTES // (1024 * 1024)}MB)",
+        )
+
     try:
-        form = await request.form()
+        parser = MultiPartParser(
+            request.headers,
+            _capped_body_stream(request, STT_MAX_UPLOAD_BYTES),
+            max_files=2,
+            max_fields=20,
+        )
+        form = await parser.parse()
+    except _UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"폼 파싱 오류: {e}")
 
-    # session_id 는 있으면 쓰고, 없으면 새로 생성
-    session_id_raw = (
-        form.get("session_id")
-        or request.headers.get("X-Session-ID")
-        or request.query_params.get("session_id")
-    )
-    session_id = (session_id_raw or "").strip() or str(uuid.uuid4())
+    # 정상 반환하면 임시 파일 정리는 호출 측(_close_stt_request) 몫,
+    # 그 전에 예외로 빠져나가면 여기서 닫는다.
+    handed_off = False
+    try:
+        # session_id 는 있으면 쓰고, 없으면 새로 생성
+        session_id_raw = (
+            form.get("session_id")
+            or request.headers.get("X-Session-ID")
+            or request.query_params.get("session_id")
+        )
+        session_id = (session_id_raw or "").strip() or str(uuid.uuid4())
 
-    # 오디오 파일 추출 (audio 또는 file 필드)
-    upload = form.get("audio") or form.get("file")
-    if upload is None:
-        raise HTTPException(status_code=400, detail="오디오 파일이 없습니다.")
+        # 오디오 파일 추출 (audio 또는 file 필드)
+        upload = form.get("audio") or form.get("file")
+        if upload is None or not hasattr(upload, "file"):
+            raise HTTPException(status_code=400, detail="오디오 파일이 없습니다.")
 
-    try:
-        audio_bytes = await upload.read()
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"오디오 읽기 오류: {e}")
+        if not upload.size:
+            raise HTTPException(status_code=400, detail="비어 있는 오디오입니다.")
 
-    if not audio_bytes:
-        raise HTTPException(status_code=400, detail="비어 있는 오디오입니다.")
+        filename = getattr(upload, "filename", None) or "record.webm"
 
-    filename = getattr(upload, "filename", None) or "record.webm"
+        # STT 업로드 전 16kHz mono 변환 + 무음 제거 + 재인코딩 (워커 풀에서 실행)
+        try:
+            audio_file, filename, preprocess_stats = await preprocess_for_stt_async(upload.file, filename)
+        except AudioTooLongError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        logger.info(f"[audio_preprocess] {preprocess_stats}")
+
+        handed_off = True
+        return {
+            "session_id": session_id,
+            "audio_file": audio_file,
+            "filename": filename,
+            "form": form,
+            "preprocess": preprocess_stats,
+        }
+    finally:
+        if not handed_off:
+            await form.close()
 
-    return {
-        "session_id": session_id,
-        "audio_bytes": audio_bytes,
-        "filename": filename,
-        "form": form,
-    }
+
+async def _close_stt_request(parsed: Dict[str, Any]) -> None:
+    """_parse_stt_request가 만든 업로드 임시 파일을 정리합니다."""
+    try:
+        await parsed["form"].close()
+    except Exception as e:
+        logger.warning(f"업로드 임시 파일 정리 실패: {e}")
 
 
 # ============================================================
@@ -566,15 +573,16 @@ def process_text_turn(
 
     session = TEXT_TURN_SESSIONS[session_id]
     history: List[Dict[str, str]] = session["history"]
-    pending = session["pending_clarification"]
+    pending: Optional[ClarificationChain] = session["pending_clarification"]
 
     original_text = body.text.strip()
 
-    # 2) clarification 결합 처리
+    # 2) clarification 결합 처리 (원래 민원 + 답변 목록을 한 줄로 렌더링)
     if pending is not None:
-        prev_text = pending["original_text"]
-        use_text = f"{prev_text} 추가 위치 정보: {original_text}"
+        chain = pending.extended(original_text)
+        use_text = chain.render()
     else:
+        chain = None
         use_text = original_text
 
     # 3) 민원 엔진 호출
@@ -585,7 +593,7 @@ def process_text_turn(
 
     # 5) clarification 상태 업데이트
     if engine_result.get("stage") == "clarification":
-        session["pending_clarification"] = {"original_text": use_text}
+        session["pending_clarification"] = chain or ClarificationChain(base=use_text)
     else:
         session["pending_clarification"] = None
 
@@ -600,11 +608,12 @@ def process_text_turn(
         },
     )
 
-    # 7) 응답
+    # 7) 응답 (with_tts면 안내 음성 합성을 응답 전에 시작)
     return TextTurnResponse(
         session_id=session_id,
         used_text=use_text,
         engine_result=engine_result,
+        tts_audio=_prefetch_turn_tts(engine_result) if body.with_tts else None,
     )
 
 
@@ -763,9 +772,12 @@ async def get_header_status(
 
     date_display = now.strftime("%Y년 %m월 %d일 (%a)")
 
-    # 헤더용 날씨 + 음력/절기
-    weather = await fetch_weather(location)
-    lunar = await get_lunar_and_seasonal(now.date())
+    # 헤더용 날씨 + 음력/절기 (둘 다 로컬 조회 → 외부 API 상태와 무관하게 즉시 응답)
+    weather_age = today_info.weather_age_sec(location)
+    weather, lunar = await asyncio.gather(
+        fetch_weather(location),
+        get_lunar_and_seasonal(now.date()),
+    )
 
     return HeaderStatusResponse(
         now_iso=now.isoformat(),
@@ -773,6 +785,8 @@ async def get_header_status(
         weather=weather,
         lunar=lunar,
         holiday="",
+        weather_age_sec=weather_age,
+        weather_stale=bool(WEATHER_API_KEY) and today_info.is_stale(weather_age),
     )
 
 
@@ -780,44 +794,53 @@ async def get_header_status(
 # 다국어 STT + 번역 유틸
 # ============================================================
 
-def stt_multilang_bytes(audio_bytes: bytes, file_name: str = "recording.webm") -> str:
+def stt_multilang_detect_fileobj(file_obj, file_name: str = "recording.webm") -> Tuple[str, Optional[str]]:
     """
-    Whisper에 language 파라미터를 주지 않고 호출해서
-    언어 자동 감지 + 텍스트 변환을 수행한다.
+    언어 자동 감지 STT를 하면서 STT가 감지한 언어 코드도 함께 받는다.
+    (OpenAI 백엔드는 verbose_json의 language 사용, 같은 오디오는 캐시 재사용)
+
+    :return: (텍스트, 감지 언어 코드 또는 None)
     """
-    if not audio_bytes:
-        logger.warning("[WARN] stt_multilang_bytes에 빈 바이트가 전달되었습니다.")
-        return ""
+    return transcribe_detect_language(file_obj, file_name=file_name)
 
-    bio = io.BytesIO(audio_bytes)
-    if file_name:
-        try:
-            bio.name = file_name  # type: ignore[attr-defined]
-        except Exception:
-            pass
 
-    try:
-        resp = openai_client.audio.transcriptions.create(
-            model=WHISPER_MODEL,
-            file=bio,
-            response_format="text",  # 순수 텍스트
-        )
-        if isinstance(resp, str):
-            return resp.strip()
-        text = getattr(resp, "text", "") or str(resp)
-        return text.strip()
-    except Exception as e:
-        logger.warning(f"Whisper multilang STT 호출 중 오류 발생: {e}")
-        return ""
+# 텍스트 문자와 맞지 않으면 STT 감지 언어보다 우선하는 스크립트 기반 언어
+_SCRIPT_DECISIVE_LANGS = ("ko", "ja", "zh")
+
+
+def resolve_language_without_llm(text: str, stt_language: Optional[str] = None) -> Optional[str]:
+    """
+    LLM 없이 언어를 정한다. 결론이 없으면 None.
+
+    1) STT가 감지한 언어(stt_language)가 있으면 사용
+       (단, 텍스트 문자가 분명히 ko/ja/zh이고 서로 다르면 문자 쪽을 따름)
+    2) 로컬 문자 기반 식별기(services.lang_detect)
+    """
+    local = identify_language(text)
+
+    if stt_language:
+        if local in _SCRIPT_DECISIVE_LANGS and local != stt_language:
+            logger.info(f"[lang] STT={stt_language}, 문자 기준={local} → {local}")
+            return local
+        return stt_language
+
+    return local
 
 
-def detect_language(text: str) -> str:
+def detect_language(text: str, stt_language: Optional[str] = None) -> str:
     """
     입력 텍스트의 언어를 ISO 639-1 코드(ko, en, ja, zh 등)로 감지.
+
+    STT 감지 언어 / 로컬 식별기(resolve_language_without_llm)로 결론이 없을 때만 LLM 호출.
     """
     if not text:
         return "ko"
 
+    lang = resolve_language_without_llm(text, stt_language)
+    if lang:
+        return lang
+
+    logger.info("[lang] STT/로컬 식별 모두 불확실 → LLM 언어 감지")
     try:
         resp = openai_client.chat.completions.create(
             model=CHAT_MODEL,
@@ -879,6 +902,124 @@ def translate_text(text: str, target_lang: str) -> str:
         return text
 
 
+def _chat_json(system_prompt: str, payload: Dict[str, Any], max_tokens: int) -> Dict[str, Any]:
+    """JSON 모드로 한 번 호출하고 결과 dict를 돌려준다. (실패 시 예외)"""
+    resp = openai_client.chat.completions.create(
+        model=CHAT_MODEL,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": json.dumps(payload, ensure_ascii=False)},
+        ],
+        temperature=0.2,
+        max_tokens=max_tokens,
+        response_format={"type": "json_object"},
+    )
+    return json.loads(resp.choices[0].message.content or "{}")
+
+
+def translate_batch(texts: List[str], target_lang: str) -> List[str]:
+    """
+    여러 문장을 한 번의 JSON 요청으로 target_lang 언어로 번역.
+
+    - 같은 문장은 한 번만 번역 (tts_summary == summary_tts 같은 중복 필드)
+    - 결과는 입력과 같은 순서/개수로 돌려줌
+    - 응답 형식이 어긋나면 빠진 문장만 translate_text로 하나씩 번역
+    """
+    unique: List[str] = []
+    for text in texts:
+        if isinstance(text, str) and text.strip() and text not in unique:
+            unique.append(text)
+
+    if not unique:
+        return list(texts)
+
+    translated: Dict[str, str] = {}
+    try:
+        data = _chat_json(
+            (
+                f'입력 JSON의 "items" 배열에 있는 각 문장을 {target_lang} 언어로 자연스럽게 번역하세요. '
+                '같은 순서, 같은 개수로 {"items": ["번역1", "번역2", ...]} 형태의 JSON만 출력하세요. '
+                "숫자, 전화번호, 고유명사는 그대로 두세요."
+            ),
+            {"items": unique},
+            max_tokens=min(4000, 200 + 150 * len(unique)),
+        )
+        items = data.get("items")
+        if isinstance(items, list) and len(items) == len(unique):
+            for src, dst in zip(unique, items):
+                if isinstance(dst, str) and dst.strip():
+                    translated[src] = dst.strip()
+        else:
+            logger.warning(f"일괄 번역 응답 개수 불일치: 요청 {len(unique)} / 응답 {len(items or [])}")
+    except Exception as e:
+        logger.warning(f"일괄 번역 중 오류 발생: {e}")
+
+    for src in unique:
+        if src not in translated:
+            translated[src] = translate_text(src, target_lang=target_lang)
+
+    return [translated.get(t, t) if isinstance(t, str) else t for t in texts]
+
+
+def translate_user_facing(user_facing: Dict[str, Any], target_lang: str) -> Dict[str, Any]:
+    """
+    user_facing dict의 문자열 필드만 골라 한 번에 번역하고 같은 키에 다시 채운다.
+    (문자열이 아니거나 빈 값은 그대로)
+    """
+    keys = [k for k, v in user_facing.items() if isinstance(v, str) and v.strip()]
+    translated = translate_batch([user_facing[k] for k in keys], target_lang=target_lang)
+
+    result = dict(user_facing)
+    result.update(zip(keys, translated))
+    return result
+
+
+def render_localized_user_facing(template: Dict[str, Any], target_lang: str) -> Dict[str, Any]:
+    """
+    엔진이 남긴 user_facing 템플릿 스펙을 phrase_catalog로 target_lang 문구로 렌더링.
+
+    고정 문구는 카탈로그 번역을 그대로 쓰고, 자유 문장(안내 문구 guide)과
+    사용자가 말한 위치(location)만 한 번의 일괄 번역으로 처리한다.
+    (공식 접수 + 위치 없음처럼 자유 문장이 없으면 LLM 호출 없음)
+    """
+    spec = dict(template)
+    free_keys = [k for k in ("guide", "location") if (spec.get(k) or "").strip()]
+    if free_keys:
+        translated = translate_batch([spec[k] for k in free_keys], target_lang=target_lang)
+        spec.update(zip(free_keys, translated))
+
+    return phrase_catalog.render_user_facing(spec, target_lang, guide=spec.get("guide"))
+
+
+def detect_and_translate_to_ko(text: str) -> Tuple[str, str]:
+    """
+    언어 감지가 불확실할 때, 감지와 한국어 번역을 한 번의 호출로 처리.
+
+    :return: (언어 코드, 한국어 텍스트). 실패 시 detect_language + translate_text로 대체
+    """
+    try:
+        data = _chat_json(
+            (
+                '입력 JSON의 "text" 문장의 언어를 ISO 639-1 두 글자 소문자 코드로 감지하고, '
+                "한국어로 자연스럽게 번역하세요. "
+                '{"lang": "en", "ko": "한국어 번역"} 형태의 JSON만 출력하세요. '
+                '이미 한국어면 "ko"에 원문을 그대로 넣으세요.'
+            ),
+            {"text": text},
+            max_tokens=600,
+        )
+        lang = str(data.get("lang") or "").strip().lower()[:2]
+        ko_text = str(data.get("ko") or "").strip()
+        if lang.isalpha() and len(lang) == 2 and ko_text:
+            return lang, (text if lang == "ko" else ko_text)
+        logger.warning(f"언어 감지+번역 응답 형식 오류: {data}")
+    except Exception as e:
+        logger.warning(f"언어 감지+번역 중 오류 발생: {e}")
+
+    lang = detect_language(text)
+    return lang, (text if lang == "ko" else translate_text(text, target_lang="ko"))
+
+
 # ============================================================
 # 4-A. 음성(STT) + 민원 엔진 — 싱글턴 모드
 # ============================================================
@@ -895,11 +1036,15 @@ async def stt_and_minwon_single(
 
     parsed = await _parse_stt_request(request)
     session_id = parsed["session_id"]
-    audio_bytes = parsed["audio_bytes"]
     filename = parsed["filename"]
 
-    # 1) Whisper STT
-    text = transcribe_bytes(audio_bytes, language="ko", file_name=filename)
+    # 1) Whisper STT (업로드 임시 파일을 그대로 전달, 이벤트 루프를 막지 않도록 스레드에서)
+    try:
+        text = await run_in_threadpool(
+            transcribe_fileobj, parsed["audio_file"], language="ko", file_name=filename
+        )
+    finally:
+        await _close_stt_request(parsed)
     original = (text or "").strip()
     logger.info(f"[STT(single) 결과] {original}")
 
@@ -914,7 +1059,7 @@ async def stt_and_minwon_single(
         }
 
     # 2) 싱글턴이므로 history/clarification 합치기 없이 그대로 엔진에 넣음
-    engine_result = run_pipeline_once(original, history=[])
+    engine_result = await run_in_threadpool(run_pipeline_once, original, history=[])
 
     # 3) 로그 기록
     log_event(
@@ -943,6 +1088,60 @@ async def stt_and_minwon_single(
 # 4-B. 음성(STT) + 민원 엔진 — 멀티턴 모드
 # ============================================================
 
+def _run_multi_turn(session_id: str, original: str, source: str = "http") -> Dict[str, Any]:
+    """
+    STT 결과 텍스트 한 턴을 멀티턴 세션(TextSessionState)에 태워
+    민원 엔진 결과 + 로그까지 처리하는 공통 로직.
+    (/stt/multi 와 /ws/stt/multi 에서 함께 사용)
+    """
+    if not original:
+        return {
+            "session_id": session_id,
+            "issue_id": None,
+            "text": "",
+            "used_text": "",
+            "engine_result": None,
+            "user_facing": {},
+            "staff_payload": {},
+        }
+
+    state = get_state(session_id)
+
+    effective_text = state.build_effective_text(original)
+
+    engine_result = run_pipeline_once(effective_text, [])
+
+    turn = state.register_turn(
+        user_raw=original,
+        effective_text=effective_text,
+        engine_result=engine_result,
+    )
+    issue_id = turn.issue_id
+
+    log_event(
+        session_id,
+        {
+            "type": "stt_turn",
+            "issue_id": issue_id,
+            "route_source": turn.route_source,
+            "input_text": original,
+            "used_text": effective_text,
+            "engine_result": engine_result,
+            "source": source,
+        },
+    )
+
+    return {
+        "session_id": session_id,
+        "issue_id": issue_id,
+        "text": original,
+        "used_text": effective_text,
+        "engine_result": engine_result,
+        "user_facing": engine_result.get("user_facing", {}),
+        "staff_payload": engine_result.get("staff_payload", {}),
+    }
+
+
 @app.post("/stt/multi", summary="...", tags=["stt"])
 async def stt_and_minwon_multi(
     request: Request,
@@ -951,67 +1150,142 @@ async def stt_and_minwon_multi(
     try:
         parsed = await _parse_stt_request(request)
         session_id = parsed["session_id"]
-        audio_bytes = parsed["audio_bytes"]
         filename = parsed["filename"]
 
         logger.info(f"[session_id] {session_id}")
+        with_tts = _is_truthy(
+            request.query_params.get("with_tts") or parsed["form"].get("with_tts")
+        )
 
-        state = get_state(session_id)
-
-        text = transcribe_bytes(audio_bytes, language="ko", file_name=filename)
+        try:
+            text = await run_in_threadpool(
+                transcribe_fileobj, parsed["audio_file"], language="ko", file_name=filename
+            )
+        finally:
+            await _close_stt_request(parsed)
         original = (text or "").strip()
         logger.info(f"[STT(multi) 결과] {original}")
 
-        if not original:
-            return {
-                "session_id": session_id,
-                "issue_id": None,
-                "text": "",
-                "used_text": "",
-                "engine_result": None,
-                "user_facing": {},
-                "staff_payload": {},
-            }
-
-        effective_text = state.build_effective_text(original)
-
-        engine_result = run_pipeline_once(effective_text, [])
-
-        turn = state.register_turn(
-            user_raw=original,
-            effective_text=effective_text,
-            engine_result=engine_result,
-        )
-        issue_id = turn.issue_id
-
-        log_event(
-            session_id,
-            {
-                "type": "stt_turn",
-                "issue_id": issue_id,
-                "input_text": original,
-                "used_text": effective_text,
-                "engine_result": engine_result,
-            },
-        )
+        result = await run_in_threadpool(_run_multi_turn, session_id, original)
+        if with_tts and result.get("engine_result"):
+            result["tts_audio"] = _prefetch_turn_tts(result["engine_result"])
 
         logger.info("=== 🟩 STT(multi) 응답 완료 ===")
 
-        return {
-            "session_id": session_id,
-            "issue_id": issue_id,
-            "text": original,
-            "used_text": effective_text,
-            "engine_result": engine_result,
-            "user_facing": engine_result.get("user_facing", {}),
-            "staff_payload": engine_result.get("staff_payload", {}),
-        }
+        return result
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception("💥 STT(multi) 처리 중 예외 발생")
         raise HTTPException(status_code=500, detail=f"STT(multi) 내부 오류: {e}")
 
 
+# ============================================================
+# 4-B'. 음성(STT) 스트리밍 + 민원 엔진 — 멀티턴 WebSocket
+# ============================================================
+
+# 스트리밍 PCM으로 받는 표본화율 (그 외 값은 연결 거부)
+_WS_SAMPLE_RATES = (8000, 11025, 16000, 22050, 24000, 32000, 44100, 48000)
+
+
+@app.websocket("/ws/stt/multi")
+async def stt_and_minwon_multi_ws(websocket: WebSocket):
+    """
+    주민이 말하는 동안 오디오 조각을 계속 받아서
+    서버에서 발화 끝을 감지하는 즉시 STT → 멀티턴 엔진을 돌리는 WebSocket 엔드포인트.
+
+    프로토콜:
+    - 접속: /ws/stt/multi?session_id=...&sample_rate=16000
+        (sample_rate는 8000~48000Hz 표준값만, 그 외에는 error를 보내고 연결 종료)
+    - 클라이언트 → 서버
+        - binary: 16bit little-endian mono PCM 조각
+        - text "end": 지금까지 받은 소리를 발화 끝으로 보고 바로 처리
+                      (발화가 없었으면 이벤트/결과 없음)
+    - 서버 → 클라이언트 (JSON)
+        - {"type": "ready", "session_id": ...}
+        - {"type": "speech_start"}
+        - {"type": "speech_end"}
+        - {"type": "result", ...}  ← /stt/multi 응답과 같은 구조
+        - {"type": "error", "detail": ...}
+
+    한 연결에서 여러 번 발화해도 되며, 결과를 보낸 뒤 다음 발화를 다시 기다립니다.
+    """
+    await websocket.accept()
+
+    session_id = (websocket.query_params.get("session_id") or "").strip() or str(uuid.uuid4())
+    raw_rate = (websocket.query_params.get("sample_rate") or "16000").strip()
+    sample_rate = int(raw_rate) if raw_rate.isdigit() else 0
+    if sample_rate not in _WS_SAMPLE_RATES:
+        await websocket.send_json({
+            "type": "error",
+            "detail": f"지원하지 않는 sample_rate입니다: {raw_rate} "
+                      f"(가능: {', '.join(str(r) for r in _WS_SAMPLE_RATES)})",
+        })
+        await websocket.close(code=1008)
+        return
+
+    endpointer = StreamingEndpointer(sample_rate=sample_rate)
+    logger.info(f"=== 🟦 STT(ws) 연결 === session_id={session_id}, sample_rate={sample_rate}")
+    await websocket.send_json({"type": "ready", "session_id": session_id})
+
+    async def _finish_utterance() -> None:
+        pcm = endpointer.utterance_pcm()
+        endpointer.reset()
+        await websocket.send_json({"type": "speech_end"})
+
+        if not pcm:
+            result = await run_in_threadpool(_run_multi_turn, session_id, "", "ws")
+            await websocket.send_json({"type": "result", **result})
+            return
+
+        wav_bytes = pcm16_to_wav_bytes(pcm, sample_rate=sample_rate)
+        text = await run_in_threadpool(
+            transcribe_bytes, wav_bytes, language="ko", file_name="stream.wav"
+        )
+        original = (text or "").strip()
+        logger.info(f"[STT(ws) 결과] {original}")
+
+        result = await run_in_threadpool(_run_multi_turn, session_id, original, "ws")
+        await websocket.send_json({"type": "result", **result})
+
+    async def _handle_events(events: List[str]) -> None:
+        for event in events:
+            if event == "speech_start":
+                await websocket.send_json({"type": "speech_start"})
+            elif event == "speech_end":
+                await _finish_utterance()
+
+    try:
+        while True:
+            message = await websocket.receive()
+            if message.get("type") == "websocket.disconnect":
+                break
+
+            chunk = message.get("bytes")
+            if chunk:
+                await _handle_events(endpointer.feed(chunk))
+                continue
+
+            if (message.get("text") or "").strip().lower() == "end":
+                # 진행 중인 발화를 끝내고, 쌓여 있던 발화까지 모두 처리 (소리가 없었으면 아무것도 안 보냄)
+                events = endpointer.finish()
+                while events:
+                    await _handle_events(events)
+                    events = endpointer.finish()
+
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.exception("💥 STT(ws) 처리 중 예외 발생")
+        try:
+            await websocket.send_json({"type": "error", "detail": f"STT(ws) 내부 오류: {e}"})
+        except Exception:
+            pass
+
+    logger.info(f"=== 🟩 STT(ws) 연결 종료 === session_id={session_id}")
+
+
 # ============================================================
 # 4-C. 레거시 /stt 엔드포인트 (현재는 /stt/multi와 동일)
 # ============================================================
@@ -1040,15 +1314,42 @@ class TtsRequest(BaseModel):
     """
     text: str = Field(..., description="읽어 줄 문장")
     speaker: str = Field(
-        default="nara",
+        default=TTS_DEFAULT_SPEAKER,
         description="CLOVA Voice speaker 이름 (예: nara, jinho 등)",
     )
     speed: int = Field(
-        default=2,
+        default=TTS_DEFAULT_SPEED,
         ge=-5,
         le=5,
         description="말하기 속도 (-5=매우 느림, 0=보통, 5=매우 빠름)",
     )
+    sentence_stream: bool = Field(
+        default=False,
+        description="True면 문장 단위로 나눠 병렬 합성 후 순서대로 스트리밍 (긴 안내문용)",
+    )
+
+
+def _tts_cache_headers(key: str, cache_status: str) -> Dict[str, str]:
+    """
+    같은 (문장, 목소리, 속도, 음성 버전)이면 같은 MP3 → 키를 그대로 ETag로 사용.
+    """
+    return {
+        "ETag": f'"{key}"',
+        "Cache-Control": f"public, max-age={TTS_CACHE_MAX_AGE}",
+        "X-TTS-Cache": cache_status,
+    }
+
+
+def _tts_stream_headers(cache_status: str) -> Dict[str, str]:
+    """
+    CLOVA를 중계하는 스트리밍 응답용 헤더.
+    중간에 끊기면 잘린 MP3가 되므로 ETag 없이 no-store
+    (다음 요청부터는 캐시 적중 응답이 ETag/장기 캐시 헤더를 붙여 준다).
+    """
+    return {
+        "Cache-Control": "no-store",
+        "X-TTS-Cache": cache_status,
+    }
 
 
 @app.post(
@@ -1056,22 +1357,22 @@ class TtsRequest(BaseModel):
     summary="네이버 CLOVA Voice TTS (텍스트 → 음성)",
     tags=["tts"],
 )
-def tts(req: TtsRequest):
-    print("🔥 [DEBUG] TTS 요청 speed:", req.speed)
+async def tts(req: TtsRequest, request: Request):
     """
     텍스트를 네이버 CLOVA TTS로 변환하여 MP3 스트리밍으로 반환합니다.
-    """
-    if not NAVER_API_KEY_ID or not NAVER_API_KEY:
-        raise HTTPException(
-            status_code=500,
-            detail="NAVER_API_KEY_ID 또는 NAVER_API_KEY 환경변수가 설정되지 않았습니다.",
-        )
 
+    - 같은 (문장, 목소리, 속도)는 디스크 캐시(services/tts_cache)에서 바로 반환
+    - 캐시 미스면 CLOVA 응답을 받는 대로 청크 단위로 중계하고, 다 받으면 캐시에 저장
+    - sentence_stream=True면 문장별로 병렬 합성(문장마다 캐시)해서 순서대로 이어 보냄
+    - 클라이언트가 If-None-Match로 같은 ETag를 보내면 304 (본문 없음)
+    - ETag/장기 캐시 헤더는 캐시 적중 응답에만 붙임 (중계/문장 스트리밍은 no-store)
+    """
+    logger.debug(f"TTS 요청 speed={req.speed}")
     text = (req.text or "").strip()
     if not text:
         raise HTTPException(status_code=400, detail="text 파라미터가 비어 있습니다.")
 
-    speaker = (req.speaker or "nara").strip() or "nara"
+    speaker = (req.speaker or TTS_DEFAULT_SPEAKER).strip() or TTS_DEFAULT_SPEAKER
 
     speed_int = req.speed
     if speed_int < -5:
@@ -1079,32 +1380,147 @@ def tts(req: TtsRequest):
     if speed_int > 5:
         speed_int = 5
 
-    headers = {
-        "X-NCP-APIGW-API-KEY-ID": NAVER_API_KEY_ID,
-        "X-NCP-APIGW-API-KEY": NAVER_API_KEY,
-    }
+    key = tts_cache.make_key(text, speaker, speed_int)
 
-    data = {
-        "speaker": speaker,
-        "speed": str(speed_int),
-        "text": text,
-    }
+    # 브라우저가 이미 같은 음성을 갖고 있으면 본문 없이 304
+    if_none_match = request.headers.get("if-none-match") or ""
+    if key in if_none_match:
+        return Response(status_code=304, headers=_tts_cache_headers(key, "REVALIDATED"))
 
-    try:
-        res = requests.post(NAVER_TTS_URL, headers=headers, data=data, timeout=10)
-    except Exception as e:
-        raise HTTPException(
-            status_code=502,
-            detail=f"TTS 요청 중 네트워크 오류: {e}",
+    audio = await run_in_threadpool(tts_cache.get, key)
+    if audio is not None:
+        return Response(
+            content=audio,
+            media_type="audio/mpeg",
+            headers=_tts_cache_headers(key, "HIT"),
         )
 
-    if res.status_code != 200:
-        raise HTTPException(
-            status_code=502,
-            detail=f"TTS API 응답 오류: {res.status_code}, {res.text}",
-        )
+    if req.sentence_stream:
+        sentences = tts_stream.split_sentences(text)
+        if len(sentences) > 1:
+            return await _tts_sentence_response(sentences, speaker, speed_int)
 
-    return StreamingResponse(io.BytesIO(res.content), media_type="audio/mpeg")
+    try:
+        upstream = await clova_tts.open_stream(text, speaker, speed_int)
+    except clova_tts.ClovaTTSError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+    async def relay():
+        chunks: List[bytes] = []
+        complete = False
+        try:
+            async for chunk in upstream.aiter_bytes():
+                chunks.append(chunk)
+                yield chunk
+            complete = True
+        except httpx.HTTPError as e:
+            logger.warning(f"TTS 스트리밍 중단: {e}")
+        finally:
+            await upstream.aclose()
+            # 끝까지 받은 음성만 캐시에 저장 (중간에 끊긴 MP3는 저장하지 않음)
+            if complete:
+                await run_in_threadpool(tts_cache.put, key, b"".join(chunks))
+
+    return StreamingResponse(
+        relay(),
+        media_type="audio/mpeg",
+        headers=_tts_stream_headers("MISS"),
+    )
+
+
+async def _tts_sentence_response(sentences: List[str], speaker: str, speed: int):
+    """
+    문장 단위 스트리밍 응답.
+    첫 문장은 응답 전에 받아 두어, 첫 문장부터 실패하면 일반 오류(502 등)로 돌려준다.
+    본문은 문장별 MP3를 이어 붙인 것이라 전체 문장 키(ETag)와 다른 바이트이므로 캐시 헤더를 붙이지 않는다.
+    """
+    chunks = tts_stream.stream_sentences(sentences, speaker, speed)
+    try:
+        first = await chunks.__anext__()
+    except clova_tts.ClovaTTSError as e:
+        await chunks.aclose()
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+    async def relay():
+        try:
+            yield first
+            async for chunk in chunks:
+                yield chunk
+        except clova_tts.ClovaTTSError as e:
+            logger.warning(f"문장 단위 TTS 중단: {e.detail}")
+        finally:
+            await chunks.aclose()
+
+    return StreamingResponse(
+        relay(),
+        media_type="audio/mpeg",
+        headers=_tts_stream_headers("SENTENCES"),
+    )
+
+
+# 턴 응답과 함께 미리 합성할 user_facing 음성 필드
+TURN_TTS_FIELDS = ("summary_tts", "result_tts", "tts_summary", "tts_result")
+
+
+def _is_truthy(value: Any) -> bool:
+    return str(value or "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _prefetch_turn_tts(engine_result: Dict[str, Any]) -> Dict[str, str]:
+    """
+    엔진 결과의 안내 음성 필드 합성을 바로 시작하고, 필드 → 음성 주소를 돌려준다.
+    (같은 문장은 같은 키라서 합성은 한 번만 진행)
+    """
+    user_facing = engine_result.get("user_facing") or {}
+    audio_urls: Dict[str, str] = {}
+    for field in TURN_TTS_FIELDS:
+        text = (user_facing.get(field) or "").strip()
+        if not text:
+            continue
+        key = tts_prefetch.prefetch(text, TTS_DEFAULT_SPEAKER, TTS_DEFAULT_SPEED)
+        audio_urls[field] = f"/tts/audio/{key}"
+    return audio_urls
+
+
+@app.get(
+    "/tts/audio/{key}",
+    summary="미리 합성된 안내 음성 (턴 응답의 tts_audio 주소)",
+    tags=["tts"],
+)
+async def tts_audio(key: str, request: Request):
+    """
+    턴 응답의 tts_audio 주소로 MP3를 반환합니다.
+    합성이 아직 진행 중이면 끝날 때까지 기다렸다가 반환합니다.
+    """
+    if len(key) != 40 or any(c not in "0123456789abcdef" for c in key):
+        raise HTTPException(status_code=400, detail="잘못된 음성 키입니다.")
+
+    if_none_match = request.headers.get("if-none-match") or ""
+    if key in if_none_match:
+        return Response(status_code=304, headers=_tts_cache_headers(key, "REVALIDATED"))
+
+    try:
+        audio = await tts_prefetch.get_audio(key)
+    except clova_tts.ClovaTTSError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+    if audio is None:
+        raise HTTPException(status_code=404, detail="음성을 찾을 수 없습니다. /tts로 다시 요청해 주세요.")
+
+    return Response(
+        content=audio,
+        media_type="audio/mpeg",
+        headers=_tts_cache_headers(key, "HIT"),
+    )
+
+
+@app.get(
+    "/tts/cache/stats",
+    summary="TTS 캐시 적중률 / 용량 지표",
+    tags=["tts"],
+)
+def tts_cache_stats():
+    return {**tts_cache.stats(), "prewarm": tts_prewarm.status()}
 
 
 # ============================================================
@@ -1117,37 +1533,18 @@ def tts(req: TtsRequest):
     tags=["stt", "minwon"],
 )
 async def stt_and_minwon_multilang(request: Request):
-    # 1) multipart/form-data 파싱
-    try:
-        form = await request.form()
-    except Exception as e:
-        raise HTTPException(
-            status_code=400,
-            detail=f"폼 데이터를 읽는 중 오류가 발생했습니다: {e}",
-        )
-
-    upload = form.get("audio") or form.get("file")
-    if upload is None or not hasattr(upload, "read"):
-        raise HTTPException(
-            status_code=400,
-            detail="폼 데이터에 'audio' 또는 'file' 필드가 없거나 잘못되었습니다.",
-        )
+    # 1) multipart/form-data 파싱 (크기 제한 + 임시 파일 스풀링 + 전처리)
+    parsed = await _parse_stt_request(request)
+    filename = parsed["filename"]
 
+    # 2) 다국어 Whisper STT (업로드 임시 파일을 그대로 전달, 감지 언어도 함께)
+    #    STT/LLM 호출은 모두 블로킹 → 이벤트 루프를 막지 않도록 스레드에서
     try:
-        audio_bytes = await upload.read()
-    except Exception as e:
-        raise HTTPException(
-            status_code=400,
-            detail=f"업로드된 파일을 읽는 중 오류가 발생했습니다: {e}",
+        original_text, stt_lang = await run_in_threadpool(
+            stt_multilang_detect_fileobj, parsed["audio_file"], file_name=filename
         )
-
-    if not audio_bytes:
-        raise HTTPException(status_code=400, detail="비어 있는 오디오 파일입니다.")
-
-    filename = getattr(upload, "filename", None) or "recording.webm"
-
-    # 2) 다국어 Whisper STT
-    original_text = stt_multilang_bytes(audio_bytes, file_name=filename)
+    finally:
+        await _close_stt_request(parsed)
 
     if not original_text:
         return {
@@ -1160,17 +1557,18 @@ async def stt_and_minwon_multilang(request: Request):
             "staff_payload": None,
         }
 
-    # 3) 언어 감지
-    lang = detect_language(original_text)
-
-    # 4) 한국어로 변환해 민원 엔진에 넣을 텍스트 준비
-    if lang == "ko":
+    # 3) 언어 감지 (STT 감지 언어 → 로컬 식별) + 4) 한국어로 변환해 민원 엔진에 넣을 텍스트 준비
+    #    둘 다 불확실하면 LLM 한 번으로 감지 + 번역을 같이 처리
+    lang = resolve_language_without_llm(original_text, stt_language=stt_lang)
+    if lang is None:
+        lang, text_for_engine = await run_in_threadpool(detect_and_translate_to_ko, original_text)
+    elif lang == "ko":
         text_for_engine = original_text
     else:
-        text_for_engine = translate_text(original_text, target_lang="ko")
+        text_for_engine = await run_in_threadpool(translate_text, original_text, target_lang="ko")
 
     history: List[Dict[str, str]] = []
-    engine_result = run_pipeline_once(text_for_engine, history)
+    engine_result = await run_in_threadpool(run_pipeline_once, text_for_engine, history)
     if not isinstance(engine_result, dict):
         engine_result = {}
 
@@ -1178,15 +1576,18 @@ async def stt_and_minwon_multilang(request: Request):
     staff_payload = engine_result.get("staff_payload") or {}
 
     # 5) 사용자에게 보여줄 언어 쪽 user_facing 생성
+    #    고정 문구는 다국어 카탈로그(phrase_catalog), 카탈로그에 없는 언어만 전체 번역
+    template = engine_result.get("user_facing_template")
     if lang == "ko":
         user_facing_for_user = user_facing_ko
+    elif template and phrase_catalog.supports(lang):
+        user_facing_for_user = await run_in_threadpool(
+            render_localized_user_facing, template, target_lang=lang
+        )
     else:
-        user_facing_for_user = {}
-        for key, value in user_facing_ko.items():
-            if isinstance(value, str) and value.strip():
-                user_facing_for_user[key] = translate_text(value, target_lang=lang)
-            else:
-                user_facing_for_user[key] = value
+        user_facing_for_user = await run_in_threadpool(
+            translate_user_facing, user_facing_ko, target_lang=lang
+        )
 
     # 6) 세션/로그 기록
     session_id = str(uuid.uuid4())
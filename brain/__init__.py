@@ -21,6 +21,7 @@ brain 패키지
 - summarizer      : 주민용·담당자용 요약 생성
 - handling        : simple_guide / contact_only / official_ticket 결정
 - builders        : user_facing / staff_payload 형태로 결과 조립
+- phrase_catalog  : user_facing 고정 문구 다국어 카탈로그 (슬롯: 카테고리/위치)
 - text_session_state, turn_router : 멀티턴 대화/이슈 A,B,C 관리
 """
 
@@ -16,6 +16,7 @@ from brain.rules_pension import build_pension_message
 from .classifier import detect_minwon_type
 from .summarizer import summarize_for_user, summarize_for_staff, build_fallback_summary
 from .clarification_agent import decide_clarification_with_llm
+from .phrase_catalog import CATALOG_VERSION, render_user_facing
 
 # ------------------------------
 # 기본 패턴 / 기본 위치
@@ -95,17 +96,9 @@ def need_clarification(summary: Dict[str, Any], category: str, text: str, needs_
 # 3) Clarification 응답 생성
 # =============================================================================
 def build_clarification_response(text: str, category: str, needs_visit: bool, risk_level: str) -> Dict[str, Any]:
-    uf = {
-        "short_title": "추가 정보 확인",
-        "main_message": "죄송하지만, 정확한 위치를 한 번만 더 알려 주시면 좋겠습니다.",
-        "next_action_guide": "예를 들어 ○○동 ○○아파트 앞, ○○리 마을회관 앞 골목처럼 말씀해 주세요.",
-        "phone_suggestion": "",
-        "confirm_question": "",
-        "tts_listening": "죄송하지만, 정확한 위치를 한 번만 더 알려 주시면 좋겠습니다.",
-        "tts_summary": "죄송하지만, 정확한 위치를 한 번만 더 알려 주시면 좋겠습니다.",
-        "tts_result": "",
-        "answer_core": "추가 위치 정보 확인이 필요합니다.",
-    }
+    # 고정 문구는 phrase_catalog에서 (다국어 엔드포인트가 같은 스펙으로 재렌더링)
+    template = {"version": CATALOG_VERSION, "kind": "clarification", "category": category}
+    uf = render_user_facing(template, "ko")
 
     sp = {
         "summary": text,
@@ -127,6 +120,7 @@ def build_clarification_response(text: str, category: str, needs_visit: bool, ri
         "need_call_transfer": False,
         "need_official_ticket": needs_visit,
         "user_facing": uf,
+        "user_facing_template": template,
         "staff_payload": sp,
     }
 
@@ -313,63 +307,22 @@ def run_pipeline_once(text: str, history: List[Dict[str, str]]) -> Dict[str, Any
     raw_location = staff.get("location", "")
     cleaned_location = clean_location_for_user(raw_location)
 
-    if cleaned_location:
-        summary_text = f"{cleaned_location} {category} 고장"
-    else:
-        summary_text = f"{category} 관련 민원"
-
-    if cleaned_location:
-        summary_tts = (
-            f"말씀해 주신 내용은 {cleaned_location}에 있는 {category} 문제가 맞으실까요? "
-        )
-    else:
-        summary_tts = (
-            f"말씀해 주신 내용은 {category} 관련 민원이 맞으실까요? "
-        )
-
-    empathy = "말씀해 주셔서 감사합니다. 많이 불편하셨겠습니다. "
-
-    if handling["handling_type"] == "official_ticket":
-        result_text = "담당 부서에서 현장을 확인해 조치할 예정입니다."
-
-        if cleaned_location:
-            result_tts = (
-                f"{empathy}{cleaned_location}에 있는 {category} 문제는 "
-                "담당 부서에서 현장을 확인해 조치할 예정입니다. "
-                "확인 후 화면 아무 곳이나 눌러 주세요."
-            )
-        else:
-            result_tts = (
-                f"{empathy}{category} 관련 민원은 "
-                "담당 부서에서 내용을 확인해 조치할 예정입니다. "
-                "확인 후 화면 아무 곳이나 눌러 주세요."
-            )
-    else:
-        guide_text = summarize_for_user(original, category, handling)
-        result_text = guide_text
-        result_tts = (
-            f"{empathy}{guide_text} "
-            "확인 후 화면 아무 곳이나 눌러 주세요."
-        )
+    # 고정 문구는 phrase_catalog 템플릿 + 슬롯(카테고리/위치)으로 렌더링하고,
+    # 자유 문장은 안내 문구(guide) 하나뿐 → 다국어 응답에서는 이것만 번역하면 됨
+    template = {
+        "version": CATALOG_VERSION,
+        "kind": "result",
+        "category": category,
+        "location": cleaned_location,
+        "handling_type": handling["handling_type"],
+    }
+    if handling["handling_type"] != "official_ticket":
+        template["guide"] = summarize_for_user(original, category, handling)
 
     # -------------------------------------------------
     # 8) user_facing / staff_payload 구성
     # -------------------------------------------------
-    user_facing = {
-        "short_title": f"{category} 관련 문의",
-        "summary_text": summary_text,
-        "summary_tts": summary_tts,
-        "result_text": result_text,
-        "result_tts": result_tts,
-        "main_message": empathy + f"{category} 관련 민원으로 접수하겠습니다.",
-        "next_action_guide": result_text,
-        "phone_suggestion": "",
-        "confirm_question": "요약 내용이 맞으시면 예 버튼을 눌러 주세요.",
-        "tts_listening": summary_tts,
-        "tts_summary": summary_tts,
-        "tts_result": result_tts,
-        "answer_core": f"{category} 관련 문의 요약 안내입니다.",
-    }
+    user_facing = render_user_facing(template, "ko")
 
     staff_payload = {
         "summary": staff.get("summary") or build_fallback_summary(original, category),
@@ -392,6 +345,7 @@ def run_pipeline_once(text: str, history: List[Dict[str, str]]) -> Dict[str, Any
         "need_call_transfer": handling["need_call_transfer"],
         "need_official_ticket": handling["need_official_ticket"],
         "user_facing": user_facing,
+        "user_facing_template": template,
         "staff_payload": staff_payload,
     }
 
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""
+brain.phrase_catalog
+
+민원 엔진이 user_facing에 쓰는 "고정 문구" 다국어 카탈로그.
+
+역할
+----
+- TEMPLATES: 문구 키 → {언어: 템플릿} (슬롯: {category}, {location}, {guide}, {empathy})
+- CATEGORY_NAMES: 엔진 카테고리(도로, 시설물 ...) → 언어별 이름
+- render_user_facing(spec, lang): 엔진이 남긴 템플릿 스펙으로 user_facing 전체를 해당 언어로 렌더링
+- CATALOG_VERSION: 문구를 고치면 올린다. (TTS 캐시/로그에서 어떤 문구 버전인지 구분용)
+
+엔진(run_pipeline_once / build_clarification_response)은 한국어 user_facing도
+이 카탈로그(lang="ko")로 만들기 때문에, 문구의 원본은 이 파일 하나다.
+자유 문장(안내 문구 guide)만 호출 측에서 번역해서 넘긴다.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+CATALOG_VERSION = "2026.10-1"
+
+SUPPORTED_LANGS = ("ko", "en", "ja", "zh", "vi")
+
+
+# ------------------------------------------------------------
+# 1. 카테고리 이름
+# ------------------------------------------------------------
+
+CATEGORY_NAMES: Dict[str, Dict[str, str]] = {
+    "도로": {"en": "road", "ja": "道路", "zh": "道路", "vi": "đường sá"},
+    "시설물": {"en": "public facility", "ja": "公共施設", "zh": "公共设施", "vi": "công trình công cộng"},
+    "연금/복지": {"en": "pension/welfare", "ja": "年金・福祉", "zh": "养老金/福利", "vi": "lương hưu/phúc lợi"},
+    "심리지원": {"en": "counseling support", "ja": "心理支援", "zh": "心理支持", "vi": "hỗ trợ tâm lý"},
+    "생활민원": {"en": "daily-life", "ja": "生活", "zh": "生活", "vi": "đời sống"},
+    "기타": {"en": "general", "ja": "その他", "zh": "其他", "vi": "khác"},
+}
+
+
+# ------------------------------------------------------------
+# 2. 문구 템플릿
+# ------------------------------------------------------------
+
+TEMPLATES: Dict[str, Dict[str, str]] = {
+    # --- 위치 추가 질문(clarification) ---
+    "clar_title": {
+        "ko": "추가 정보 확인",
+        "en": "Additional information needed",
+        "ja": "追加情報の確認",
+        "zh": "需要补充信息",
+        "vi": "Cần thêm thông tin",
+    },
+    "clar_prompt": {
+        "ko": "죄송하지만, 정확한 위치를 한 번만 더 알려 주시면 좋겠습니다.",
+        "en": "Sorry, could you tell me the exact location once more?",
+        "ja": "恐れ入りますが、正確な場所をもう一度教えていただけますか。",
+        "zh": "不好意思，请再告诉我一次准确的位置。",
+        "vi": "Xin lỗi, bạn có thể cho biết lại vị trí chính xác một lần nữa không?",
+    },
+    "clar_example": {
+        "ko": "예를 들어 ○○동 ○○아파트 앞, ○○리 마을회관 앞 골목처럼 말씀해 주세요.",
+        "en": "For example, say something like \"in front of ○○ Apartment in ○○-dong\" "
+              "or \"the alley in front of the ○○-ri village hall\".",
+        "ja": "例えば「○○洞の○○アパート前」「○○里の村の会館前の路地」のようにお話しください。",
+        "zh": "例如：“○○洞○○公寓前”、“○○里村会馆前的小巷”这样说就可以。",
+        "vi": "Ví dụ: \"trước chung cư ○○ ở phường ○○\" hoặc \"con hẻm trước nhà văn hóa thôn ○○\".",
+    },
+    "clar_answer_core": {
+        "ko": "추가 위치 정보 확인이 필요합니다.",
+        "en": "We need more information about the location.",
+        "ja": "場所について追加の確認が必要です。",
+        "zh": "需要确认更详细的位置信息。",
+        "vi": "Cần xác nhận thêm thông tin vị trí.",
+    },
+
+    # --- 접수 결과 ---
+    "empathy": {
+        "ko": "말씀해 주셔서 감사합니다. 많이 불편하셨겠습니다. ",
+        "en": "Thank you for letting us know. That must have been very inconvenient. ",
+        "ja": "お知らせいただきありがとうございます。大変ご不便だったと思います。",
+        "zh": "感谢您告诉我们。给您带来了很多不便。",
+        "vi": "Cảm ơn bạn đã cho chúng tôi biết. Chắc hẳn bạn đã rất bất tiện. ",
+    },
+    "short_title": {
+        "ko": "{category} 관련 문의",
+        "en": "{category} inquiry",
+        "ja": "{category}に関するお問い合わせ",
+        "zh": "{category}相关咨询",
+        "vi": "Yêu cầu về {category}",
+    },
+    "summary_text_loc": {
+        "ko": "{location} {category} 고장",
+        "en": "{category} problem at {location}",
+        "ja": "{location}の{category}の不具合",
+        "zh": "{location}的{category}故障",
+        "vi": "Sự cố {category} tại {location}",
+    },
+    "summary_text": {
+        "ko": "{category} 관련 민원",
+        "en": "{category} complaint",
+        "ja": "{category}に関する苦情",
+        "zh": "{category}相关投诉",
+        "vi": "Khiếu nại về {category}",
+    },
+    "summary_tts_loc": {
+        "ko": "말씀해 주신 내용은 {location}에 있는 {category} 문제가 맞으실까요? ",
+        "en": "Is this about a {category} problem at {location}? ",
+        "ja": "お話しの内容は、{location}の{category}の問題でよろしいでしょうか。",
+        "zh": "您说的是{location}的{category}问题，对吗？",
+        "vi": "Nội dung bạn nói là sự cố {category} tại {location}, đúng không ạ? ",
+    },
+    "summary_tts": {
+        "ko": "말씀해 주신 내용은 {category} 관련 민원이 맞으실까요? ",
+        "en": "Is this a {category} complaint? ",
+        "ja": "お話しの内容は、{category}に関する苦情でよろしいでしょうか。",
+        "zh": "您说的是{category}相关的投诉，对吗？",
+        "vi": "Nội dung bạn nói là khiếu nại về {category}, đúng không ạ? ",
+    },
+    "result_text_visit": {
+        "ko": "담당 부서에서 현장을 확인해 조치할 예정입니다.",
+        "en": "The responsible department will inspect the site and take action.",
+        "ja": "担当部署が現場を確認し、対応する予定です。",
+        "zh": "负责部门将到现场确认并进行处理。",
+        "vi": "Bộ phận phụ trách sẽ kiểm tra hiện trường và xử lý.",
+    },
+    "result_tts_visit_loc": {
+        "ko": "{empathy}{location}에 있는 {category} 문제는 "
+              "담당 부서에서 현장을 확인해 조치할 예정입니다. "
+              "확인 후 화면 아무 곳이나 눌러 주세요.",
+        "en": "{empathy}The responsible department will inspect the {category} problem "
+              "at {location} and take action. "
+              "When you are done, please touch anywhere on the screen.",
+        "ja": "{empathy}{location}の{category}の問題は、担当部署が現場を確認し、対応する予定です。"
+              "ご確認後、画面のどこかを押してください。",
+        "zh": "{empathy}{location}的{category}问题，负责部门将到现场确认并进行处理。"
+              "确认后请点击屏幕任意位置。",
+        "vi": "{empathy}Bộ phận phụ trách sẽ kiểm tra sự cố {category} tại {location} và xử lý. "
+              "Sau khi xem xong, vui lòng chạm vào bất kỳ chỗ nào trên màn hình.",
+    },
+    "result_tts_visit": {
+        "ko": "{empathy}{category} 관련 민원은 "
+              "담당 부서에서 내용을 확인해 조치할 예정입니다. "
+              "확인 후 화면 아무 곳이나 눌러 주세요.",
+        "en": "{empathy}The responsible department will review your {category} complaint "
+              "and take action. "
+              "When you are done, please touch anywhere on the screen.",
+        "ja": "{empathy}{category}に関する苦情は、担当部署が内容を確認し、対応する予定です。"
+              "ご確認後、画面のどこかを押してください。",
+        "zh": "{empathy}{category}相关投诉，负责部门将确认内容并进行处理。"
+              "确认后请点击屏幕任意位置。",
+        "vi": "{empathy}Bộ phận phụ trách sẽ xem xét khiếu nại về {category} và xử lý. "
+              "Sau khi xem xong, vui lòng chạm vào bất kỳ chỗ nào trên màn hình.",
+    },
+    "result_tts_guide": {
+        "ko": "{empathy}{guide} 확인 후 화면 아무 곳이나 눌러 주세요.",
+        "en": "{empathy}{guide} When you are done, please touch anywhere on the screen.",
+        "ja": "{empathy}{guide} ご確認後、画面のどこかを押してください。",
+        "zh": "{empathy}{guide} 确认后请点击屏幕任意位置。",
+        "vi": "{empathy}{guide} Sau khi xem xong, vui lòng chạm vào bất kỳ chỗ nào trên màn hình.",
+    },
+    "main_message": {
+        "ko": "{empathy}{category} 관련 민원으로 접수하겠습니다.",
+        "en": "{empathy}We will register this as a {category} complaint.",
+        "ja": "{empathy}{category}に関する苦情として受け付けます。",
+        "zh": "{empathy}我们将按{category}相关投诉受理。",
+        "vi": "{empathy}Chúng tôi sẽ tiếp nhận đây là khiếu nại về {category}.",
+    },
+    "confirm_question": {
+        "ko": "요약 내용이 맞으시면 예 버튼을 눌러 주세요.",
+        "en": "If the summary is correct, please press the Yes button.",
+        "ja": "要約の内容が正しければ、「はい」ボタンを押してください。",
+        "zh": "如果摘要内容正确，请按“是”按钮。",
+        "vi": "Nếu nội dung tóm tắt đúng, vui lòng nhấn nút Có.",
+    },
+    "answer_core": {
+        "ko": "{category} 관련 문의 요약 안내입니다.",
+        "en": "Here is a summary of your {category} inquiry.",
+        "ja": "{category}に関するお問い合わせの要約です。",
+        "zh": "这是您的{category}相关咨询摘要。",
+        "vi": "Đây là phần tóm tắt yêu cầu về {category} của bạn.",
+    },
+}
+
+
+# ------------------------------------------------------------
+# 3. 렌더링
+# ------------------------------------------------------------
+
+def supports(lang: str) -> bool:
+    """카탈로그에 해당 언어 문구가 있는지."""
+    return lang in SUPPORTED_LANGS
+
+
+def category_name(category: str, lang: str) -> str:
+    """엔진 카테고리 이름을 해당 언어로. (없으면 원문 그대로)"""
+    if lang == "ko":
+        return category
+    return CATEGORY_NAMES.get(category, {}).get(lang, category)
+
+
+def render(key: str, lang: str, **slots: str) -> str:
+    """문구 하나를 렌더링. 해당 언어가 없으면 한국어 문구를 사용."""
+    templates = TEMPLATES[key]
+    template = templates.get(lang) or templates["ko"]
+    return template.format(**slots)
+
+
+def render_user_facing(spec: Dict[str, Any],
+                       lang: str = "ko",
+                       guide: Optional[str] = None) -> Dict[str, Any]:
+    """
+    엔진이 남긴 템플릿 스펙으로 user_facing 전체를 렌더링한다.
+
+    spec 예:
+        {"version": CATALOG_VERSION, "kind": "result", "category": "도로",
+         "location": "○○리 마을회관 앞", "handling_type": "official_ticket", "guide": "..."}
+        {"version": CATALOG_VERSION, "kind": "clarification", "category": "도로"}
+
+    :param lang: 렌더링 언어 (supports(lang)가 False면 한국어 문구)
+    :param guide: 자유 문장 안내(guide)의 번역본. 없으면 spec["guide"] 원문 사용
+    """
+    if spec.get("kind") == "clarification":
+        prompt = render("clar_prompt", lang)
+        return {
+            "short_title": render("clar_title", lang),
+            "main_message": prompt,
+            "next_action_guide": render("clar_example", lang),
+            "phone_suggestion": "",
+            "confirm_question": "",
+            "tts_listening": prompt,
+            "tts_summary": prompt,
+            "tts_result": "",
+            "answer_core": render("clar_answer_core", lang),
+        }
+
+    category = category_name(spec.get("category") or "기타", lang)
+    location = spec.get("location") or ""
+    empathy = render("empathy", lang)
+    slots = {"category": category, "location": location, "empathy": empathy}
+
+    if location:
+        summary_text = render("summary_text_loc", lang, **slots)
+        summary_tts = render("summary_tts_loc", lang, **slots)
+    else:
+        summary_text = render("summary_text", lang, **slots)
+        summary_tts = render("summary_tts", lang, **slots)
+
+    if spec.get("handling_type") == "official_ticket":
+        result_text = render("result_text_visit", lang)
+        key = "result_tts_visit_loc" if location else "result_tts_visit"
+        result_tts = render(key, lang, **slots)
+    else:
+        guide_text = guide if guide is not None else (spec.get("guide") or "")
+        result_text = guide_text
+        result_tts = render("result_tts_guide", lang, guide=guide_text, **slots)
+
+    return {
+        "short_title": render("short_title", lang, **slots),
+        "summary_text": summary_text,
+        "summary_tts": summary_tts,
+        "result_text": result_text,
+        "result_tts": result_tts,
+        "main_message": render("main_message", lang, **slots),
+        "next_action_guide": result_text,
+        "phone_suggestion": "",
+        "confirm_question": render("confirm_question", lang),
+        "tts_listening": summary_tts,
+        "tts_summary": summary_tts,
+        "tts_result": result_tts,
+        "answer_core": render("answer_core", lang, **slots),
+    }
@@ -15,10 +15,14 @@ brain.text_session_state
 - build_effective_text(user_raw):
   직전 턴이 clarification(추가 질문)이었는지 등을 확인해서
   '추가 위치 정보: ...' 형식으로 문장을 합쳐주는 기능.
+  (ClarificationChain이 "원래 민원 + 답변 목록"을 따로 들고 있다가
+   매번 마커 하나짜리 짧은 문장으로 다시 렌더링하므로,
+   재질문이 여러 번 반복되어도 엔진 입력 길이가 늘어나지 않는다)
 
 - register_turn(...):
   새 턴을 어떤 이슈(A/B/C)로 묶을지 결정하고,
   turn_router와 함께 "민원 묶음 단위"를 만들어 준다.
+  (어떤 방식으로 이슈를 골랐는지는 Turn.route_source에 남긴다)
 
 FastAPI의 /stt 엔드포인트에서 session_id와 함께 사용됩니다.
 """
@@ -30,7 +34,8 @@ import re
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
 
-from brain.turn_router import choose_issue_for_followup
+from brain.turn_router import route_issue_for_followup
+from brain.utils_text import normalize_korean
 
 
 # ---------------------------------------------------------
@@ -48,6 +53,10 @@ class Turn:
     engine_result: Dict[str, Any]
     issue_id: str  # A, B, C ...
 
+    # 이슈를 어떻게 골랐는지 (로그 분석용)
+    # "active_issue" | "first_issue" | "rule_match" | "rule_new" | "llm"
+    route_source: str = ""
+
 
 @dataclass
 class Issue:
@@ -68,6 +77,56 @@ class Issue:
     brief: str = ""
 
 
+# 재질문 답변은 몇 개만 유지 (엔진 프롬프트 길이 고정용)
+# 첫 답변(보통 가장 구체적인 위치)은 항상 남기고, 나머지는 최근 것으로 채운다.
+MAX_CLARIFICATION_ANSWERS = 2
+
+ADDITIONAL_LOCATION_MARKER = "추가 위치 정보:"
+
+
+@dataclass
+class ClarificationChain:
+    """
+    clarification(추가 질문) 체인 누적기.
+
+    예전에는 f"{prev} 추가 위치 정보: {answer}" 로 문장을 계속 이어 붙여서
+    재질문이 반복될수록 "추가 위치 정보:" 마커가 중첩되고 텍스트가 불어났다.
+    여기서는 원래 민원(base)과 답변 목록(answers)을 따로 들고 있다가
+    render()로 매번 "base 추가 위치 정보: 답1 / 답2" 형태 한 줄로 만든다.
+    """
+    base: str
+    answers: List[str] = field(default_factory=list)
+
+    def extended(self, answer: str) -> "ClarificationChain":
+        """
+        답변 하나를 추가한 새 체인을 반환합니다. (원본은 그대로 둠)
+
+        - 기존 답변과 완전히 같은 답(공백 차이 무시)만 추가하지 않음
+          ("네"나 base에 이미 나온 동 이름도 답변으로는 의미가 있으므로 유지)
+        - 답변은 첫 답변 + 최근 답변으로 MAX_CLARIFICATION_ANSWERS개까지 유지
+        """
+        answer = (answer or "").strip()
+        answers = list(self.answers)
+
+        key = normalize_korean(answer).replace(" ", "")
+        if key:
+            seen = {normalize_korean(a).replace(" ", "") for a in answers}
+            if key not in seen:
+                answers.append(answer)
+
+        if len(answers) > MAX_CLARIFICATION_ANSWERS:
+            keep_latest = max(MAX_CLARIFICATION_ANSWERS - 1, 0)
+            answers = answers[:1] + (answers[-keep_latest:] if keep_latest else [])
+
+        return ClarificationChain(base=self.base, answers=answers)
+
+    def render(self) -> str:
+        """엔진에 넣을 텍스트 한 줄로 렌더링."""
+        if not self.answers:
+            return self.base
+        return f"{self.base} {ADDITIONAL_LOCATION_MARKER} {' / '.join(self.answers)}"
+
+
 # ---------------------------------------------------------
 # 메인 클래스
 # ---------------------------------------------------------
@@ -78,7 +137,8 @@ class TextSessionState:
 
     - 한 세션 안에 여러 이슈(A/B/...)가 존재할 수 있음
     - Clarification인 경우, 다음 턴에서 문장을 합쳐서 엔진에 보냄
-    - 이슈 간 라우팅은 brain.turn_router의 LLM을 사용
+    - 이슈 간 라우팅은 brain.turn_router 사용
+      (규칙으로 뻔한 경우는 바로 결정, 애매할 때만 LLM 호출)
     """
 
     def __init__(self):
@@ -92,8 +152,12 @@ class TextSessionState:
         self.active_issue_id: Optional[str] = None
 
         # 직전 턴이 clarification 이었을 때,
-        # "기본이 되는 문장"을 저장 (다음 입력과 합치기 용도)
-        self._pending_clarification_text: Optional[str] = None
+        # "원래 민원 + 지금까지의 답변"을 저장 (다음 입력과 합치기 용도)
+        self._clarification: Optional[ClarificationChain] = None
+
+        # build_effective_text가 이번 턴용으로 만든 체인
+        # (register_turn에서 clarification이 이어지면 그대로 채택)
+        self._next_clarification: Optional[ClarificationChain] = None
 
         # A, B, C ... 발급용 카운터
         self._issue_counter: int = 0
@@ -119,14 +183,16 @@ class TextSessionState:
     def build_effective_text(self, user_raw: str) -> str:
         """
         직전 턴이 clarification이면 기본적으로
-        이전 문장 + "추가 위치 정보: {user_raw}"를 합쳐서 반환한다.
+        원래 민원 + "추가 위치 정보: {답변들}"을 합쳐서 반환한다.
 
         다만, 이번 발화가 연금/복지, 심리지원 등
         '완전히 다른 주제'로 보이면
         - 더 이상 위치 답변이 아니라 새 민원으로 간주하고
         - 합치지 않고 user_raw 그대로 반환한다.
         """
-        if not self._pending_clarification_text:
+        self._next_clarification = None
+
+        if self._clarification is None:
             return user_raw
 
         # 👉 현재 발화가 '새로운 민원 주제'처럼 보이는지 간단히 체크
@@ -134,13 +200,13 @@ class TextSessionState:
         t = user_raw.replace(" ", "")
         if re.search(r"(연금|국민연금|기초연금|복지|수급자|우울|불안|상담|죽고싶)", t):
             # clarification 체인 끊기: 다음 턴은 새 이슈로 처리
-            self._pending_clarification_text = None
+            self._clarification = None
             self.active_issue_id = None
             return user_raw
 
         # 그 외에는 "추가 위치 정보"로 보고 합친다.
-        base = self._pending_clarification_text
-        return f"{base} 추가 위치 정보: {user_raw}"
+        self._next_clarification = self._clarification.extended(user_raw)
+        return self._next_clarification.render()
 
 
     # -----------------------------------------------------
@@ -179,6 +245,7 @@ class TextSessionState:
             router_issues[issue_id] = {
                 "status": iss.status,
                 "category": iss.category,
+                "location": iss.location,
                 "brief": iss.brief or "",
             }
 
@@ -190,15 +257,18 @@ class TextSessionState:
         if self.active_issue_id is not None:
             # 이미 clarification 등으로 진행 중인 이슈가 있으면 그대로 사용
             issue_id = self.active_issue_id
+            route_source = "active_issue"
         else:
-            # 진행 중인 이슈가 없고, 기존 이슈는 있을 때 → LLM 라우터 사용
+            # 진행 중인 이슈가 없고, 기존 이슈는 있을 때
+            # → 규칙 기반 1차 라우터, 애매하면 LLM 라우터
             if router_issues:
-                chosen = choose_issue_for_followup(
+                chosen, route_source = route_issue_for_followup(
                     current_text=user_raw,
                     issues_for_router=router_issues,
                 )
             else:
                 chosen = None
+                route_source = "first_issue"
 
             if chosen is not None:
                 issue_id = chosen
@@ -240,6 +310,7 @@ class TextSessionState:
             effective_text=effective_text,
             engine_result=engine_result,
             issue_id=issue_id,
+            route_source=route_source,
         )
         self.turns.append(turn)
 
@@ -248,14 +319,20 @@ class TextSessionState:
         # -----------------------------
         if stage == "clarification":
             # 다음 입력에서 문장 합치기를 위해 저장
-            self._pending_clarification_text = effective_text
+            # (이번 입력이 이미 답변이었다면 그 체인을 이어 감)
+            chain = self._next_clarification
+            if chain is None or chain.render() != effective_text:
+                chain = ClarificationChain(base=effective_text)
+            self._clarification = chain
             issue.status = "open"
         else:
             # 이 이슈는 일단 한 번 마무리된 것으로 간주
-            self._pending_clarification_text = None
+            self._clarification = None
             issue.status = "closed"
             self.active_issue_id = None
 
+        self._next_clarification = None
+
         return turn
 
     # -----------------------------------------------------
@@ -14,7 +14,10 @@ brain.turn_router
 - choose_issue_for_followup(...):
     새로 들어온 발화를 기존 이슈 중 어디에 붙일지,
     아니면 새 이슈로 만들지 결정하는 로직.
-- (필요 시) similarity / 규칙 기반 매칭.
+- pre_route_issue(...):
+    카테고리 불일치 / 키워드·위치 겹침 / 대명사 단서로
+    뻔한 경우는 LLM 없이 바로 결정하는 규칙 기반 1차 라우터.
+    애매한 구간에서만 LLM 라우터를 호출한다.
 
 이 모듈의 결과인 issue_id(A/B/C)는
 로그 분석·어드민 통계에서 "민원 단위"로 활용할 수 있습니다.
@@ -25,11 +28,15 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Dict, Optional
+import re
+from typing import Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 from openai import OpenAI
 
+from brain.classifier import detect_minwon_type
+from brain.utils_text import extract_keywords, normalize_korean
+
 load_dotenv()
 
 API_KEY = os.getenv("OPENAI_API_KEY")
@@ -42,6 +49,25 @@ client = OpenAI(api_key=API_KEY)
 MODEL = os.getenv("OPENAI_MODEL_ROUTER", "gpt-4o")
 TEMP_ROUTER = 0.2
 
+# 규칙 기반 1차 라우터 점수 기준
+# - ROUTE_MATCH_SCORE 이상이고 2등과 ROUTE_MARGIN 이상 차이 나면 → 해당 이슈로 확정
+# - 모든 이슈가 ROUTE_NEW_SCORE 미만이면 → 새 이슈로 확정
+# - 그 사이(애매한 구간)만 LLM 라우터 호출
+ROUTE_MATCH_SCORE = 0.6
+ROUTE_NEW_SCORE = 0.2
+ROUTE_MARGIN = 0.3
+
+# 이전 민원을 가리키는 대명사/지시 표현
+PRONOUN_CUES = [
+    "그거", "그것", "그건", "그게",
+    "아까", "방금", "저번", "지난번",
+    "그때", "거기", "그쪽",
+    "그 나무", "그 길", "그 도로", "그 가로등", "그 쓰레기",
+]
+
+# 키워드 비교 시 떼어낼 조사
+_PARTICLE_RE = re.compile(r"(에서|으로|이랑|하고|은|는|이|가|을|를|에|로|도|의|와|과|랑)$")
+
 
 def _build_issues_description(issues: Dict[str, dict]) -> str:
     """
@@ -61,6 +87,126 @@ def _build_issues_description(issues: Dict[str, dict]) -> str:
     return "\n".join(lines)
 
 
+def _strip_particles(tokens: List[str]) -> set:
+    """'나무가', '나무는' 처럼 조사만 다른 토큰을 같은 키워드로 본다."""
+    out = set()
+    for tok in tokens:
+        stem = _PARTICLE_RE.sub("", tok)
+        if len(stem) >= 2:
+            out.add(stem)
+    return out
+
+
+def has_pronoun_cue(text: str) -> bool:
+    """'그거', '아까' 같이 이전 민원을 가리키는 표현이 있는지 여부."""
+    norm = normalize_korean(text)
+    return any(cue in norm for cue in PRONOUN_CUES)
+
+
+def _score_issue(
+    current_category: str,
+    current_keywords: set,
+    current_norm: str,
+    info: dict,
+) -> float:
+    """
+    현재 발화와 기존 이슈 하나의 연관도를 0.0 ~ 1.0 사이로 대략 계산한다.
+
+    - 카테고리가 둘 다 확실한데 서로 다르면 0.0 (명백히 다른 민원)
+    - 카테고리 일치 +0.5
+    - 요약(brief)과 겹치는 키워드 1개당 +0.2 (최대 +0.4)
+    - 이슈 위치가 현재 발화에 그대로 등장하면 +0.4
+    """
+    issue_category = info.get("category") or "기타"
+
+    if (
+        current_category != "기타"
+        and issue_category != "기타"
+        and current_category != issue_category
+    ):
+        return 0.0
+
+    score = 0.0
+    if current_category != "기타" and current_category == issue_category:
+        score += 0.5
+
+    issue_keywords = _strip_particles(extract_keywords(info.get("brief", ""), max_keywords=20))
+    score += min(0.2 * len(current_keywords & issue_keywords), 0.4)
+
+    location = normalize_korean(info.get("location") or "")
+    if location and location.replace(" ", "") in current_norm.replace(" ", ""):
+        score += 0.4
+
+    return min(score, 1.0)
+
+
+def pre_route_issue(
+    current_text: str,
+    issues_for_router: Dict[str, dict],
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    LLM을 부르기 전에 규칙만으로 라우팅을 시도합니다.
+
+    반환: (issue_id, source)
+      - ("A", "rule_match") → 규칙으로 이슈 A의 후속이라고 확정
+      - (None, "rule_new")  → 규칙으로 새 민원이라고 확정
+      - (None, None)        → 애매함 → LLM 라우터에 맡김
+    """
+    if not issues_for_router:
+        return None, "rule_new"
+
+    current_category = detect_minwon_type(current_text)
+    current_norm = normalize_korean(current_text)
+    current_keywords = _strip_particles(extract_keywords(current_text, max_keywords=20))
+    pronoun = has_pronoun_cue(current_text)
+
+    scores = {
+        issue_id: _score_issue(current_category, current_keywords, current_norm, info)
+        for issue_id, info in issues_for_router.items()
+    }
+
+    # 대명사 단서는 대부분 "가장 최근 이슈"를 가리킨다.
+    # 카테고리/키워드 근거가 있을 때만 가산한다. (후보가 하나뿐이면 크게, 여럿이면 작게)
+    # 근거가 전혀 없으면(점수 0) 확정하지 않고 작은 가산만 해서 LLM에 맡긴다.
+    # (카테고리가 명백히 다르면 가산하지 않음 → 다른 민원에 억지로 붙지 않도록)
+    if pronoun:
+        last_id = list(issues_for_router)[-1]
+        if scores[last_id] > 0.0:
+            bonus = 0.6 if len(issues_for_router) == 1 else 0.3
+            scores[last_id] = min(scores[last_id] + bonus, 1.0)
+        elif current_category == "기타":
+            scores[last_id] = min(scores[last_id] + 0.3, 1.0)
+
+    ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+    best_id, best = ranked[0]
+    second = ranked[1][1] if len(ranked) > 1 else 0.0
+
+    if best < ROUTE_NEW_SCORE and not pronoun:
+        return None, "rule_new"
+
+    if best >= ROUTE_MATCH_SCORE and best - second >= ROUTE_MARGIN:
+        return best_id, "rule_match"
+
+    return None, None
+
+
+def route_issue_for_followup(
+    current_text: str,
+    issues_for_router: Dict[str, dict],
+) -> Tuple[Optional[str], str]:
+    """
+    규칙 기반 1차 라우터 → (애매할 때만) LLM 라우터 순서로 이슈를 고릅니다.
+
+    반환: (issue_id 또는 None, source)
+      source: "rule_match" | "rule_new" | "llm"
+    """
+    chosen, source = pre_route_issue(current_text, issues_for_router)
+    if source is not None:
+        return chosen, source
+
+    return _choose_issue_with_llm(current_text, issues_for_router), "llm"
+
+
 def choose_issue_for_followup(
     current_text: str,
     issues_for_router: Dict[str, dict],
@@ -69,6 +215,24 @@ def choose_issue_for_followup(
     현재 발화가 기존 이슈들 중 하나의 '후속 발화'인지,
     아니면 완전히 새로운 민원인지 판별합니다.
 
+    뻔한 경우는 규칙으로 결정하고, 애매할 때만 LLM을 호출합니다.
+    (결정 출처까지 필요하면 route_issue_for_followup 사용)
+
+    반환:
+      - "A", "B" 등 issues_for_router에 존재하는 key → 해당 이슈의 후속
+      - None → 새로운 민원으로 처리
+    """
+    chosen, _source = route_issue_for_followup(current_text, issues_for_router)
+    return chosen
+
+
+def _choose_issue_with_llm(
+    current_text: str,
+    issues_for_router: Dict[str, dict],
+) -> Optional[str]:
+    """
+    LLM(gpt-4o)에게 현재 발화가 어느 이슈의 후속인지 묻습니다.
+
     issues_for_router 예시:
     {
       "A": {"category": "도로", "brief": "우리집 앞에 나무가 쓰러져서 통행이 어려워", "status": "closed"},
@@ -143,6 +143,8 @@ _ADDITIONAL_LOC_MARKERS = [
     "추가위치 정보:",
 ]
 
+_ADDITIONAL_LOC_RE = re.compile("|".join(re.escape(m) for m in _ADDITIONAL_LOC_MARKERS))
+
 
 def split_additional_location(text: str) -> Tuple[str, str]:
     """
@@ -153,16 +155,25 @@ def split_additional_location(text: str) -> Tuple[str, str]:
     같은 형태로 붙이기 때문에,
     여기서는 위 패턴을 기준으로 앞부분(원래 민원)과 뒷부분(추가 위치)을 나눈다.
 
+    예전 방식으로 여러 번 이어 붙여 마커가 중첩된 텍스트도
+    첫 마커 앞을 본문으로, 나머지 조각들은 중복 없이 " / "로 합쳐 추가 위치로 본다.
+
     return: (main_text, extra_location)
     """
     if not text:
         return "", ""
 
-    for marker in _ADDITIONAL_LOC_MARKERS:
-        if marker in text:
-            main, extra = text.split(marker, 1)
-            return main.strip(), extra.strip()
+    parts = _ADDITIONAL_LOC_RE.split(text)
+    if len(parts) == 1:
+        # 마커가 없으면 전체를 본문으로 간주
+        return text.strip(), ""
+
+    main = parts[0].strip()
+    extras: List[str] = []
+    for part in parts[1:]:
+        part = part.strip()
+        if part and part not in extras:
+            extras.append(part)
 
-    # 마커가 없으면 전체를 본문으로 간주
-    return text.strip(), ""
+    return main, " / ".join(extras)
 
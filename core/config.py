@@ -61,4 +61,143 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
 # Whisper / 번역용 모델 (환경변수 없으면 기본값 사용)
 WHISPER_MODEL = os.getenv("WHISPER_MODEL", "gpt-4o-mini-transcribe")
-CHAT_MODEL = os.getenv("OPENAI_TRANSLATION_MODEL", "gpt-4o-mini")
\ No newline at end of file
+CHAT_MODEL = os.getenv("OPENAI_TRANSLATION_MODEL", "gpt-4o-mini")
+
+# 5) STT 업로드 전 오디오 전처리 (speaker/audio_preprocess.py)
+#    - 16kHz mono 변환 + 앞/뒤 무음 제거 + 작은 포맷으로 재인코딩
+AUDIO_PREPROCESS_ENABLED = os.getenv("AUDIO_PREPROCESS_ENABLED", "true").lower() == "true"
+AUDIO_PREPROCESS_WORKERS = int(os.getenv("AUDIO_PREPROCESS_WORKERS", "2"))
+AUDIO_PREPROCESS_FORMAT = os.getenv("AUDIO_PREPROCESS_FORMAT", "ogg")
+AUDIO_PREPROCESS_CODEC = os.getenv("AUDIO_PREPROCESS_CODEC", "libopus")
+AUDIO_PREPROCESS_BITRATE = os.getenv("AUDIO_PREPROCESS_BITRATE", "24k")
+
+# 6) STT 업로드 제한
+#    - 업로드 본문 최대 크기(바이트), 초과 시 스트리밍 도중 바로 413
+#    - 디코딩된 오디오 최대 길이(초), 초과 시 STT 호출 없이 413
+STT_MAX_UPLOAD_BYTES = int(os.getenv("STT_MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+STT_MAX_AUDIO_SECONDS = float(os.getenv("STT_MAX_AUDIO_SECONDS", "120"))
+
+# 7) STT 결과 캐시 (speaker/stt_cache.py)
+#    - 같은 오디오 바이트 + 언어 + 모델이면 API를 다시 부르지 않음
+#    - 메모리 LRU(항목 수) + 디스크(JSON, 전체 크기) 2단 구성
+STT_CACHE_ENABLED = os.getenv("STT_CACHE_ENABLED", "true").lower() == "true"
+STT_CACHE_DIR = Path(os.getenv("STT_CACHE_DIR", str(BASE_DIR / "data" / "stt_cache")))
+STT_CACHE_MAX_ENTRIES = int(os.getenv("STT_CACHE_MAX_ENTRIES", "512"))
+STT_CACHE_MAX_BYTES = int(os.getenv("STT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# 8) STT 백엔드 선택 (speaker/stt_backends.py)
+#    - openai : OpenAI 전사 API (WHISPER_MODEL)
+#    - local  : CPU 로컬 엔진 (faster-whisper / CTranslate2, 별도 설치 필요)
+#    - fake   : 테스트용 결정적 가짜 엔진 (네트워크/모델 없음)
+STT_BACKEND = os.getenv("STT_BACKEND", "openai").lower()
+LOCAL_STT_MODEL = os.getenv("LOCAL_STT_MODEL", "small")
+LOCAL_STT_COMPUTE_TYPE = os.getenv("LOCAL_STT_COMPUTE_TYPE", "int8")
+LOCAL_STT_CPU_THREADS = int(os.getenv("LOCAL_STT_CPU_THREADS", "0"))
+LOCAL_STT_NUM_WORKERS = int(os.getenv("LOCAL_STT_NUM_WORKERS", "1"))
+STT_FAKE_TEXT = os.getenv("STT_FAKE_TEXT", "")
+# 단어 시각(verbose_json)이 필요한 전사에 쓸 OpenAI 모델 (whisper 계열만 지원)
+STT_TIMESTAMP_MODEL = os.getenv("STT_TIMESTAMP_MODEL", "whisper-1")
+# 다국어 STT에서 전사와 함께 감지 언어를 받을지 (OpenAI: STT_TIMESTAMP_MODEL + verbose_json)
+#  - 기본 false: WHISPER_MODEL로 텍스트만 받고 언어는 로컬 식별기/LLM으로 판단
+#  - true로 켜면 다국어 전사 모델이 WHISPER_MODEL에서 STT_TIMESTAMP_MODEL(기본 whisper-1)로 바뀜
+#    (verbose_json은 whisper 계열만 지원하므로, 전사 품질이 WHISPER_MODEL보다 낮을 수 있음)
+STT_MULTILANG_VERBOSE = os.getenv("STT_MULTILANG_VERBOSE", "false").lower() == "true"
+
+# 9) 구간 STT 동시 처리 (speaker/stt_backends.py 공용 워커 풀, speaker/speaker.py에서 사용)
+#    - transcribe_batch 항목을 워커 풀에서 병렬로 돌리고, 초당 요청 수를 제한
+#    - SPEAKER_STT_MAX_RPS <= 0 이면 속도 제한 없음
+SPEAKER_STT_WORKERS = int(os.getenv("SPEAKER_STT_WORKERS", "4"))
+SPEAKER_STT_MAX_RPS = float(os.getenv("SPEAKER_STT_MAX_RPS", "5"))
+#    - segment : 화자 구간마다 STT (구간 수만큼 호출)
+#    - aligned : 녹음 전체를 단어 시각과 함께 1회 STT + 화자 분리와 동시에 실행 후 단어를 구간에 배정
+SPEAKER_STT_MODE = os.getenv("SPEAKER_STT_MODE", "segment").lower()
+#    - STT 전에 화자 분리 구간 정리: 같은 화자의 가까운 구간 합치기 / 짧은 조각 버리기 / 최대 길이 제한
+SPEAKER_MERGE_GAP_SEC = float(os.getenv("SPEAKER_MERGE_GAP_SEC", "0.6"))
+SPEAKER_MIN_SEGMENT_SEC = float(os.getenv("SPEAKER_MIN_SEGMENT_SEC", "0.4"))
+SPEAKER_MAX_SEGMENT_SEC = float(os.getenv("SPEAKER_MAX_SEGMENT_SEC", "30"))
+
+# 10) 화자 분리 (speaker/diarization_pyannote.py)
+#    - 모델은 처음 쓸 때(또는 warm_up 호출 시) 한 번만 로드
+#    - 같은 오디오 + 모델이면 diarization 결과를 재사용 (메모리 LRU + 디스크 JSON, 디스크는 전체 크기 제한)
+DIARIZATION_MODEL = os.getenv("DIARIZATION_MODEL", "pyannote/speaker-diarization")
+DIARIZATION_CACHE_ENABLED = os.getenv("DIARIZATION_CACHE_ENABLED", "true").lower() == "true"
+DIARIZATION_CACHE_DIR = Path(os.getenv("DIARIZATION_CACHE_DIR", str(BASE_DIR / "data" / "diarization_cache")))
+DIARIZATION_CACHE_MAX_ENTRIES = int(os.getenv("DIARIZATION_CACHE_MAX_ENTRIES", "128"))
+DIARIZATION_CACHE_MAX_BYTES = int(os.getenv("DIARIZATION_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+# 11) TTS 음성 캐시 (services/tts_cache.py)
+#    - (문장, 목소리, 속도, 음성 버전)이 같으면 CLOVA를 다시 부르지 않고 저장된 MP3 재사용
+#    - 디스크 총 용량이 TTS_CACHE_MAX_BYTES를 넘으면 오래 안 쓴 것부터 삭제
+#    - CLOVA 목소리/설정이 바뀌면 TTS_VOICE_VERSION을 올려서 캐시를 무효화
+TTS_CACHE_ENABLED = os.getenv("TTS_CACHE_ENABLED", "true").lower() == "true"
+TTS_CACHE_DIR = Path(os.getenv("TTS_CACHE_DIR", str(BASE_DIR / "data" / "tts_cache")))
+TTS_CACHE_MAX_BYTES = int(os.getenv("TTS_CACHE_MAX_BYTES", str(200 * 1024 * 1024)))
+TTS_CACHE_MAX_AGE = int(os.getenv("TTS_CACHE_MAX_AGE", str(30 * 24 * 3600)))
+TTS_VOICE_VERSION = os.getenv("TTS_VOICE_VERSION", "clova-premium-1")
+
+# 12) TTS 사전 생성(prewarm) (services/tts_prewarm.py)
+#    - 서버 시작 시 고정 안내 문구(카탈로그 + 키오스크 화면 문구 + 인사말)를 미리 합성해 캐시에 저장
+#    - 이후 TTS_PREWARM_RECHECK_SEC마다 문구가 바뀌었거나 캐시에서 빠진 것만 다시 합성
+#    - CLOVA 호출은 초당 TTS_PREWARM_MAX_RPS회로 제한
+#    - 키오스크 화면 문구는 프론트가 import하는 JSON(KIOSK_TTS_PHRASES_FILE)을 그대로 읽음
+TTS_DEFAULT_SPEAKER = os.getenv("TTS_DEFAULT_SPEAKER", "nara")
+TTS_DEFAULT_SPEED = int(os.getenv("TTS_DEFAULT_SPEED", "2"))
+TTS_PREWARM_ENABLED = os.getenv("TTS_PREWARM_ENABLED", "true").lower() == "true"
+TTS_PREWARM_MAX_RPS = float(os.getenv("TTS_PREWARM_MAX_RPS", "2"))
+TTS_PREWARM_RECHECK_SEC = int(os.getenv("TTS_PREWARM_RECHECK_SEC", "600"))
+KIOSK_GREETING_FILE = Path(os.getenv("KIOSK_GREETING_FILE", str(BASE_DIR / "temp.json")))
+KIOSK_TTS_PHRASES_FILE = Path(os.getenv(
+    "KIOSK_TTS_PHRASES_FILE",
+    str(BASE_DIR / "frontend" / "src" / "assets" / "kiosk_tts_phrases.json"),
+))
+
+# 13) CLOVA TTS HTTP 연결 (services/clova_tts.py)
+#    - 타임아웃은 비동기(공용 풀) / 동기(백그라운드 스레드) 호출 모두 적용
+#    - 연결 수 / keep-alive 는 동기 클라이언트(tts_prewarm, tts_prefetch) 전용
+TTS_HTTP_TIMEOUT_SEC = float(os.getenv("TTS_HTTP_TIMEOUT_SEC", "10"))
+TTS_HTTP_CONNECT_TIMEOUT_SEC = float(os.getenv("TTS_HTTP_CONNECT_TIMEOUT_SEC", "3"))
+TTS_HTTP_MAX_CONNECTIONS = int(os.getenv("TTS_HTTP_MAX_CONNECTIONS", "10"))
+TTS_HTTP_KEEPALIVE_SEC = float(os.getenv("TTS_HTTP_KEEPALIVE_SEC", "30"))
+
+# 14) 문장 단위 TTS 스트리밍 (services/tts_stream.py)
+#    - 긴 안내문을 문장으로 나눠 동시에 최대 TTS_SENTENCE_CONCURRENCY개 합성, 순서대로 이어서 전송
+#    - TTS_SENTENCE_MIN_CHARS보다 짧은 문장은 앞/뒤 문장과 합쳐서 호출 수를 줄임
+TTS_SENTENCE_CONCURRENCY = int(os.getenv("TTS_SENTENCE_CONCURRENCY", "3"))
+TTS_SENTENCE_MIN_CHARS = int(os.getenv("TTS_SENTENCE_MIN_CHARS", "8"))
+
+# 15) 턴 응답과 함께 TTS 미리 합성 (services/tts_prefetch.py)
+#    - with_tts 옵션을 켠 턴 요청은 엔진 결과가 나오는 즉시 안내 음성 합성을 시작하고
+#      응답에 /tts/audio/{key} 주소를 넣어 준다. (키오스크 ↔ 서버 왕복 1회 절약)
+#    - 합성이 끝난 결과(성공/실패)는 TTS 캐시와 별도로 TTS_PREFETCH_RESULT_TTL_SEC 동안
+#      최대 TTS_PREFETCH_RESULT_MAX개 보관 (TTS 캐시를 꺼도 주소가 404가 되지 않도록)
+TTS_PREFETCH_WORKERS = int(os.getenv("TTS_PREFETCH_WORKERS", "2"))
+TTS_PREFETCH_RESULT_TTL_SEC = float(os.getenv("TTS_PREFETCH_RESULT_TTL_SEC", "300"))
+TTS_PREFETCH_RESULT_MAX = int(os.getenv("TTS_PREFETCH_RESULT_MAX", "64"))
+
+# 16) 대기 화면 정보 캐시 (services/today_info.py)
+#    - 날씨는 지역별로 몇 분(이후엔 마지막 값을 주면서 백그라운드 갱신), 음력/절기는 날짜별로 하루 동안 재사용
+#    - 동시에 들어온 같은 조회는 외부 API 호출 1번을 같이 기다림
+WEATHER_CACHE_TTL_SEC = int(os.getenv("WEATHER_CACHE_TTL_SEC", "600"))
+CALENDAR_CACHE_TTL_SEC = int(os.getenv("CALENDAR_CACHE_TTL_SEC", str(24 * 3600)))
+TODAY_INFO_CACHE_MAX_ENTRIES = int(os.getenv("TODAY_INFO_CACHE_MAX_ENTRIES", "256"))
+
+# 17) 음력 / 24절기 (services/korean_calendar.py)
+#    - 기본은 로컬 천문 계산(네트워크 없음). "kasi"로 두면 예전처럼 KASI API 조회
+#    - CALENDAR_VERIFY_WITH_KASI=true면 날짜마다 한 번 KASI와 비교해서 다르면 경고 로그
+CALENDAR_SOURCE = os.getenv("CALENDAR_SOURCE", "local").lower()
+CALENDAR_VERIFY_WITH_KASI = os.getenv("CALENDAR_VERIFY_WITH_KASI", "false").lower() == "true"
+
+# 18) 외부 API 공용 HTTP 연결 풀 (core/http_client.py)
+#    - 날씨 / KASI / CLOVA TTS 가 앱 수명 동안 하나의 httpx.AsyncClient를 공유
+#    - 타임아웃은 호출마다 따로 지정 (날씨/KASI 5초, TTS는 TTS_HTTP_TIMEOUT_SEC)
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "50"))
+HTTP_KEEPALIVE_SEC = float(os.getenv("HTTP_KEEPALIVE_SEC", "30"))
+EXTERNAL_API_TIMEOUT_SEC = float(os.getenv("EXTERNAL_API_TIMEOUT_SEC", "5"))
+
+# 19) 대기 화면 날씨 stale-while-revalidate (services/today_info.py)
+#    - 헤더는 항상 "마지막으로 성공한 날씨"를 바로 돌려주고, 갱신은 백그라운드에서
+#    - KIOSK_LOCATIONS(쉼표 구분) 지역은 WEATHER_REFRESH_SEC마다 미리 갱신
+#      (외부 API는 이 지역들만 호출 → 다른 location으로 요청하면 날씨 없이 weather_stale=True)
+#    - 마지막 성공 후 WEATHER_CACHE_TTL_SEC가 지나면 응답에 weather_stale=True + 경과 시간
+KIOSK_LOCATIONS = [loc.strip() for loc in os.getenv("KIOSK_LOCATIONS", "Gwangju").split(",") if loc.strip()]
+WEATHER_REFRESH_SEC = int(os.getenv("WEATHER_REFRESH_SEC", "300"))
@@ -0,0 +1,225 @@
+# core/file_cache.py
+# -*- coding: utf-8 -*-
+"""
+내용 해시 키 → 결과를 저장하는 공용 2단 캐시 (메모리 LRU + 디스크 파일).
+
+STT 결과(speaker/stt_cache), 화자 분리 결과(speaker/diarization_pyannote),
+TTS 음성(services/tts_cache)이 같은 구조를 쓴다.
+
+- 디스크: directory/ab/<key><suffix>, 임시 파일에 쓴 뒤 replace (쓰는 도중 읽혀도 안전)
+- 디스크 인덱스(key → 파일 크기, LRU 순서)는 처음 쓸 때 디렉터리를 한 번 훑어서 구성하고,
+  전체 크기가 max_bytes를 넘으면 가장 오래 안 쓴 파일부터 삭제
+- memory_entries > 0 이면 디코딩한 값을 메모리 LRU에도 보관 (0이면 디스크만)
+- 값 ↔ 바이트 변환은 encode/decode로 지정 (기본: bytes 그대로, JSON은 encode_json/decode_json)
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from core.logging import logger
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def encode_json(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+def decode_json(data: bytes) -> Any:
+    return json.loads(data.decode("utf-8"))
+
+
+class FileCache:
+    """
+    메모리 LRU + 디스크 파일 2단 캐시.
+
+    decode가 예외를 던지거나 None을 돌려주면(깨진 파일 등) 미스로 보고 인덱스에서 뺀다.
+    반환값은 메모리에 보관한 객체 그대로이므로, 수정할 값이면 호출 측에서 복사해서 쓸 것.
+    """
+
+    def __init__(self,
+                 name: str,
+                 directory: Path,
+                 suffix: str,
+                 max_bytes: int,
+                 memory_entries: int = 0,
+                 encode: Callable[[Any], bytes] = _identity,
+                 decode: Callable[[bytes], Any] = _identity,
+                 enabled: bool = True):
+        self.name = name
+        self.directory = Path(directory)
+        self.suffix = suffix
+        self.max_bytes = max_bytes
+        self.memory_entries = max(0, memory_entries)
+        self.encode = encode
+        self.decode = decode
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._index: "OrderedDict[str, int]" = OrderedDict()   # key → 파일 크기 (LRU 순서)
+        self._total_bytes = 0
+        self._loaded = False
+        self._stats: Dict[str, int] = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "bytes_read": 0,
+        }
+
+    # ============================================================
+    # 경로 / 인덱스
+    # ============================================================
+
+    def path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{self.suffix}"
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+
+        entries = []
+        if self.directory.exists():
+            for path in self.directory.glob(f"*/*{self.suffix}"):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, path.name[:-len(self.suffix)], st.st_size))
+
+        # 오래된 것 → 최근 것 순서로 넣어 LRU 순서를 맞춤
+        for _mtime, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+
+        self._loaded = True
+        self._evict_locked()
+
+    def _drop_locked(self, key: str) -> None:
+        size = self._index.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+        self._memory.pop(key, None)
+
+    def _evict_locked(self) -> None:
+        while self._total_bytes > self.max_bytes and self._index:
+            key, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            self._memory.pop(key, None)
+            self._stats["evictions"] += 1
+            try:
+                self.path(key).unlink()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"{self.name} 캐시 파일 삭제 실패: {key} ({e})")
+
+    def _remember_locked(self, key: str, value: Any) -> None:
+        if not self.memory_entries:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    # ============================================================
+    # 조회 / 저장
+    # ============================================================
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시에 있으면 값, 없으면 None."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            self._ensure_loaded()
+            on_disk = key in self._index
+            if on_disk:
+                self._index.move_to_end(key)
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return self._memory[key]
+            if not on_disk:
+                self._stats["misses"] += 1
+                return None
+
+        value = None
+        path = self.path(key)
+        try:
+            data = path.read_bytes()
+            value = self.decode(data)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"{self.name} 캐시 파일 읽기 실패: {path} ({e})")
+
+        with self._lock:
+            if value is None:
+                # 디스크에서 지워졌거나 깨진 파일 → 인덱스 정리
+                self._drop_locked(key)
+                self._stats["misses"] += 1
+                return None
+            self._remember_locked(key, value)
+            self._stats["disk_hits"] += 1
+            self._stats["bytes_read"] += len(data)
+        return value
+
+    def put(self, key: str, value: Any) -> bool:
+        """값을 메모리 + 디스크에 저장하고, 용량을 넘으면 오래된 것부터 삭제. 저장했으면 True."""
+        if not self.enabled or value is None:
+            return False
+
+        path = self.path(key)
+        try:
+            data = self.encode(value)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            tmp.replace(path)
+        except Exception as e:
+            logger.warning(f"{self.name} 캐시 파일 저장 실패: {path} ({e})")
+            return False
+
+        with self._lock:
+            self._ensure_loaded()
+            self._drop_locked(key)
+            self._index[key] = len(data)
+            self._total_bytes += len(data)
+            self._remember_locked(key, value)
+            self._stats["stores"] += 1
+            self._evict_locked()
+        return True
+
+    def contains(self, key: str) -> bool:
+        """지표를 건드리지 않고 캐시 존재 여부만 확인."""
+        if not self.enabled:
+            return False
+        with self._lock:
+            self._ensure_loaded()
+            return key in self._index
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 캐시 지표."""
+        with self._lock:
+            self._ensure_loaded()
+            hits = self._stats["memory_hits"] + self._stats["disk_hits"]
+            lookups = hits + self._stats["misses"]
+            return {
+                **self._stats,
+                "hits": hits,
+                "hit_rate_pct": round(hits * 100 / lookups, 1) if lookups else 0,
+                "memory_entries": len(self._memory),
+                "entries": len(self._index),
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+            }
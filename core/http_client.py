@@ -0,0 +1,54 @@
+# core/http_client.py
+# -*- coding: utf-8 -*-
+"""
+외부 API(날씨 / KASI / CLOVA TTS) 공용 httpx.AsyncClient.
+
+요청마다 AsyncClient를 새로 만들면 매번 TCP/TLS 연결을 다시 맺는다.
+앱 lifespan에서 한 번 열고(startup) 닫으며(shutdown),
+그 사이 모든 비동기 외부 호출은 get_client()로 같은 keep-alive 연결 풀을 쓴다.
+"""
+
+from typing import Optional
+
+import httpx
+
+from .config import (
+    HTTP_MAX_CONNECTIONS,
+    HTTP_KEEPALIVE_SEC,
+    EXTERNAL_API_TIMEOUT_SEC,
+)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _new_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=EXTERNAL_API_TIMEOUT_SEC,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_SEC,
+        ),
+    )
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    공용 클라이언트를 반환한다.
+    lifespan 밖(스크립트, 테스트)에서 불려도 동작하도록 없으면 만든다.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _new_client()
+    return _client
+
+
+async def startup() -> None:
+    get_client()
+
+
+async def shutdown() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -3,6 +3,7 @@ import { useNavigate } from "react-router-dom";
 import { useEffect, useRef } from "react";
 import Layout from "../components/Layout.js";
 import { requestTts } from "../services/ttsService";
+import kioskPhrases from "../assets/kiosk_tts_phrases.json";
 import { playTtsUrl, stopTts } from "../services/audioManager";
 
 export default function ComplaintPage() {
@@ -17,8 +18,7 @@ export default function ComplaintPage() {
 
     const speakIntro = async () => {
       try {
-        const text =
-          "안녕하세요. 화면 어디든 터치 후 민원을 말씀해 주세요.";
+        const text = kioskPhrases.greeting;
         console.log("🎧 calling TTS intro:", text);
 
         const blob = await requestTts(text);
@@ -3,6 +3,7 @@ import { useNavigate } from "react-router-dom";
 import { useEffect, useRef } from "react";
 import PlusLayout from "../components/PlusLayout.js";
 import { requestTts } from "../services/ttsService";
+import kioskPhrases from "../assets/kiosk_tts_phrases.json";
 import { playTtsUrl, stopTts } from "../services/audioManager";
 
 export default function FinishPage() {
@@ -20,8 +21,7 @@ export default function FinishPage() {
         spokenRef.current = true;
 
         try {
-          const text =
-            "필요하시면 또 불러 주세요. 화면은 자동으로 처음 화면으로 넘어가요. 또 봬요.";
+          const text = kioskPhrases.finish;
           const blob = await requestTts(text);
           const url = URL.createObjectURL(blob);
 
@@ -4,6 +4,7 @@ import { useEffect, useRef, useState } from "react";
 // 언니 여기예요1🦊🐰
 import { sttAndMinwon, type SttMinwonResponse } from "../services/sttService";
 import { requestTts } from "../services/ttsService";
+import kioskPhrases from "../assets/kiosk_tts_phrases.json";
 import SpeakerImg from "../assets/speaker.png";
 import { saveComplaintFromStt } from "../services/complaintService";
 
@@ -182,8 +183,7 @@ export default function ListeningPage() {
 
     const speakAndStart = async () => {
       try {
-        const text =
-          "말씀을 듣고 있어요. 말씀이 끝나면 화면 어디든 눌러 주세요.";
+        const text = kioskPhrases.listening;
         console.log("[ListeningPage] 안내 TTS:", text);
         const blob = await requestTts(text);
         const url = URL.createObjectURL(blob);
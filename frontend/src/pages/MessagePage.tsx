@@ -3,6 +3,7 @@ import { useNavigate } from "react-router-dom";
 import { useEffect, useRef } from "react";
 import BubbleLayout from "../components/BubbleLayout.js";
 import { requestTts } from "../services/ttsService";
+import kioskPhrases from "../assets/kiosk_tts_phrases.json";
 import { playTtsUrl, stopTts } from "../services/audioManager";
 
 export default function MessagePage() {
@@ -31,10 +32,7 @@ export default function MessagePage() {
 
     const speak = async () => {
       try {
-        const text =
-          "민원 처리 내용을 문자로 받아보시겠어요? " +
-          "네 버튼을 누르시면 연락 받으실 전화번호를 입력하는 화면으로 이동합니다. " +
-          "아니오 버튼을 누르시면 바로 접수 완료 화면으로 이동합니다.";
+        const text = kioskPhrases.message;
         const blob = await requestTts(text);
         const url = URL.createObjectURL(blob);
 
@@ -4,6 +4,7 @@ import { useState, useEffect, useRef } from "react";
 import Layout from "../components/Layout.js";
 import BackIcon from "../assets/back.png";
 import { requestTts } from "../services/ttsService";
+import kioskPhrases from "../assets/kiosk_tts_phrases.json";
 import { updateComplaintPhone } from "../services/complaintService.js";
 import { playTtsUrl, stopTts } from "../services/audioManager";
 
@@ -22,8 +23,7 @@ export default function PhonePage() {
 
     const speak = async () => {
       try {
-        const text =
-          "연락 받으실 번호를 입력해 주세요. 숫자를 누르신 뒤에 확인 버튼을 눌러 주세요.";
+        const text = kioskPhrases.phone;
         const blob = await requestTts(text);
         const url = URL.createObjectURL(blob);
 
@@ -5,6 +5,7 @@ import BubbleLayout from "../components/BubbleLayout.js";
 
 import { playTtsUrl, stopTts } from "../services/audioManager";
 import { requestTts } from "../services/ttsService";
+import kioskPhrases from "../assets/kiosk_tts_phrases.json";
 
 export default function SummaryPage() {
   const navigate = useNavigate();
@@ -62,9 +63,7 @@ export default function SummaryPage() {
 
     const speak = async () => {
       try {
-        const ttsText =
-          summaryTts +
-          " 요약 내용이 맞으시면 예 버튼을 눌러 주세요. 다시 말씀하고 싶으시면 재질문 버튼을 눌러 주세요.";
+        const ttsText = summaryTts + kioskPhrases.summarySuffix;
 
         const blob = await requestTts(ttsText);
         const url = URL.createObjectURL(blob);
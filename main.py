@@ -27,6 +27,7 @@ from typing import List, Dict, Any
 
 # 텍스트 엔진
 from brain.minwon_engine import run_pipeline_once
+from brain.text_session_state import ClarificationChain
 
 # 음성 파이프라인 관련
 # from speaker.session_state import SessionState
@@ -44,7 +45,7 @@ def run_text_mode():
     print("\n[모드 1] 텍스트 민원 엔진 데모 (exit로 종료)")
     history: List[Dict[str, str]] = []
 
-    pending_clarification: Dict[str, Any] | None = None
+    pending_clarification: ClarificationChain | None = None
 
     while True:
         try:
@@ -60,10 +61,10 @@ def run_text_mode():
         # 🔹 직전에 clarification이 있었으면,
         #    이번 발화를 위치/보충 정보로 보고 문장 합치기
         if pending_clarification is not None:
-            prev_text = pending_clarification["original_text"]
-            combined = f"{prev_text} 추가 위치 정보: {text}"
-            use_text = combined
+            chain = pending_clarification.extended(text)
+            use_text = chain.render()
         else:
+            chain = None
             use_text = text
 
         result = run_pipeline_once(use_text, history)
@@ -100,9 +101,7 @@ def run_text_mode():
 
         if result["stage"] == "clarification":
             # 다음 턴을 "보충 정보 기대 상태"로 만들어둠
-            pending_clarification = {
-                "original_text": use_text,
-            }
+            pending_clarification = chain or ClarificationChain(base=use_text)
         else:
             pending_clarification = None
 
@@ -3,6 +3,7 @@ from fastapi import APIRouter, HTTPException
 from typing import Dict, List, Any
 
 from brain.minwon_engine import run_pipeline_once
+from brain.text_session_state import ClarificationChain
 from core.logging import log_event
 from app_fastapi import TEXT_SESSIONS, TextTurnRequest, TextTurnResponse
 
@@ -29,13 +30,14 @@ def process_text_turn(body: TextTurnRequest):
     pending = session["pending_clarification"]
 
     original_text = body.text.strip()
-    use_text = f"{pending['original_text']} 추가 위치 정보: {original_text}" if pending else original_text
+    chain = pending.extended(original_text) if pending else None
+    use_text = chain.render() if chain else original_text
 
     engine_result = run_pipeline_once(use_text, history)
     history.append({"role": "user", "content": use_text})
 
     if engine_result.get("stage") == "clarification":
-        session["pending_clarification"] = {"original_text": use_text}
+        session["pending_clarification"] = chain or ClarificationChain(base=use_text)
     else:
         session["pending_clarification"] = None
 
@@ -1,4 +1,6 @@
 # routers/status.py
+import asyncio
+
 from fastapi import APIRouter
 from datetime import datetime
 from typing import Optional
@@ -6,6 +8,7 @@ from typing import Optional
 from core.logging import logger
 from core.config import WEATHER_API_KEY
 from app_fastapi import fetch_weather, get_lunar_and_seasonal, HeaderStatusResponse
+from services import today_info
 
 router = APIRouter()
 
@@ -19,22 +22,26 @@ async def get_header_status(location: str = "Gwangju"):
     now = datetime.now()
     date_display = now.strftime("%Y년 %m월 %d일 (%a)")
 
-    weather = None
-    lunar = None
-
-    try:
-        weather = await fetch_weather(location)
-    except Exception as e:
-        logger.warning(f"Weather API error: {e}")
+    # 날씨 / 음력·절기는 서로 독립 → 동시에 조회
+    weather_age = today_info.weather_age_sec(location)
+    weather, lunar = await asyncio.gather(
+        fetch_weather(location),
+        get_lunar_and_seasonal(now.date()),
+        return_exceptions=True,
+    )
 
-    try:
-        lunar = await get_lunar_and_seasonal(now.date())
-    except Exception as e:
-        logger.warning(f"Lunar/Seasonal API error: {e}")
+    if isinstance(weather, Exception):
+        logger.warning(f"Weather API error: {weather}")
+        weather = None
+    if isinstance(lunar, Exception):
+        logger.warning(f"Lunar/Seasonal API error: {lunar}")
+        lunar = None
 
     return HeaderStatusResponse(
         now_iso=now.isoformat(),
         date_display=date_display,
         weather=weather,
         lunar=lunar,
+        weather_age_sec=weather_age,
+        weather_stale=bool(WEATHER_API_KEY) and today_info.is_stale(weather_age),
     )
@@ -0,0 +1,152 @@
+# services/clova_tts.py
+# -*- coding: utf-8 -*-
+"""
+네이버 CLOVA Voice TTS 호출 클라이언트.
+
+- 비동기: 앱 공용 httpx.AsyncClient(core.http_client)로 MP3를 받아오며,
+  open_stream()은 응답 본문을 기다리지 않고 바로 돌려줘서 호출 측이 청크 단위로 중계할 수 있다.
+- 동기: 백그라운드 스레드(tts_prewarm)용 공유 httpx.Client.
+
+동기 클라이언트는 처음 쓸 때 만들어지고, 서버 종료 시 close()로 정리한다.
+(공용 비동기 클라이언트는 app lifespan에서 정리)
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, Optional
+
+import httpx
+
+from core.http_client import get_client
+from core.config import (
+    NAVER_API_KEY_ID,
+    NAVER_API_KEY,
+    NAVER_TTS_URL,
+    TTS_HTTP_TIMEOUT_SEC,
+    TTS_HTTP_CONNECT_TIMEOUT_SEC,
+    TTS_HTTP_MAX_CONNECTIONS,
+    TTS_HTTP_KEEPALIVE_SEC,
+)
+
+
+class ClovaTTSError(RuntimeError):
+    """CLOVA 호출 실패. status_code는 API 응답으로 돌려줄 HTTP 코드."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+_sync_client: Optional[httpx.Client] = None
+_sync_lock = threading.Lock()
+
+
+# ============================================================
+# 공통
+# ============================================================
+
+def is_configured() -> bool:
+    return bool(NAVER_API_KEY_ID and NAVER_API_KEY)
+
+
+def _headers() -> Dict[str, str]:
+    if not is_configured():
+        raise ClovaTTSError(
+            500, "NAVER_API_KEY_ID 또는 NAVER_API_KEY 환경변수가 설정되지 않았습니다."
+        )
+    return {
+        "X-NCP-APIGW-API-KEY-ID": NAVER_API_KEY_ID,
+        "X-NCP-APIGW-API-KEY": NAVER_API_KEY,
+    }
+
+
+def _form(text: str, speaker: str, speed: int) -> Dict[str, str]:
+    return {
+        "speaker": speaker,
+        "speed": str(speed),
+        "text": text,
+    }
+
+
+def _client_options() -> Dict[str, object]:
+    return {
+        "timeout": httpx.Timeout(TTS_HTTP_TIMEOUT_SEC, connect=TTS_HTTP_CONNECT_TIMEOUT_SEC),
+        "limits": httpx.Limits(
+            max_connections=TTS_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=TTS_HTTP_MAX_CONNECTIONS,
+            keepalive_expiry=TTS_HTTP_KEEPALIVE_SEC,
+        ),
+    }
+
+
+# ============================================================
+# 비동기 (엔드포인트용)
+# ============================================================
+
+async def open_stream(text: str, speaker: str, speed: int) -> httpx.Response:
+    """
+    CLOVA 요청을 보내고 상태 코드만 확인한 스트리밍 응답을 돌려준다.
+    호출 측은 response.aiter_bytes()로 본문을 중계한 뒤 반드시 aclose()할 것.
+    """
+    client = get_client()
+    request = client.build_request(
+        "POST", NAVER_TTS_URL, headers=_headers(), data=_form(text, speaker, speed),
+        timeout=httpx.Timeout(TTS_HTTP_TIMEOUT_SEC, connect=TTS_HTTP_CONNECT_TIMEOUT_SEC),
+    )
+    try:
+        response = await client.send(request, stream=True)
+    except httpx.HTTPError as e:
+        raise ClovaTTSError(502, f"TTS 요청 중 네트워크 오류: {e}")
+
+    if response.status_code != 200:
+        body = await response.aread()
+        await response.aclose()
+        raise ClovaTTSError(
+            502,
+            f"TTS API 응답 오류: {response.status_code}, {body.decode('utf-8', 'replace')}",
+        )
+    return response
+
+
+async def synthesize_async(text: str, speaker: str, speed: int) -> bytes:
+    """MP3 전체를 받아서 반환."""
+    response = await open_stream(text, speaker, speed)
+    try:
+        return await response.aread()
+    except httpx.HTTPError as e:
+        raise ClovaTTSError(502, f"TTS 응답 수신 중 네트워크 오류: {e}")
+    finally:
+        await response.aclose()
+
+
+# ============================================================
+# 동기 (백그라운드 스레드용, 이벤트 루프 밖이라 공용 비동기 클라이언트를 못 씀)
+# ============================================================
+
+def synthesize(text: str, speaker: str, speed: int) -> bytes:
+    """MP3 전체를 받아서 반환. (이벤트 루프 밖 스레드에서만 호출)"""
+    global _sync_client
+    with _sync_lock:
+        if _sync_client is None or _sync_client.is_closed:
+            _sync_client = httpx.Client(**_client_options())
+        client = _sync_client
+
+    try:
+        res = client.post(NAVER_TTS_URL, headers=_headers(), data=_form(text, speaker, speed))
+    except httpx.HTTPError as e:
+        raise ClovaTTSError(502, f"TTS 요청 중 네트워크 오류: {e}")
+
+    if res.status_code != 200:
+        raise ClovaTTSError(502, f"TTS API 응답 오류: {res.status_code}, {res.text}")
+    return res.content
+
+
+def close() -> None:
+    """서버 종료 시 동기 연결 풀 정리."""
+    global _sync_client
+    with _sync_lock:
+        if _sync_client is not None:
+            _sync_client.close()
+            _sync_client = None
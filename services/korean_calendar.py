@@ -0,0 +1,361 @@
+# services/korean_calendar.py
+# -*- coding: utf-8 -*-
+"""
+네트워크 없이 계산하는 한국 음력(태음태양력) / 24절기.
+
+대기 화면 헤더가 매번 data.go.kr(KASI)에 묻던 "오늘 음력 날짜 / 오늘 절기"는
+천문 계산으로 정해지는 값이므로 로컬에서 계산한다.
+
+- 태양 황경: VSOP87 지구 계열(Meeus, Astronomical Algorithms 부록 III 축약판) + 장동/광행차 보정
+- 합삭(새달): Meeus 49장 (평균 합삭 + 주기항 보정)
+- 시각 기준: 한국 표준시 (1908-04-01~1911-12-31, 1954-03-21~1961-08-09 는 UTC+8:30)
+- 역법 규칙(시헌력):
+    * 합삭이 든 날이 그 달 1일
+    * 동지가 든 달이 11월
+    * 동지~다음 동지 사이에 달이 13개면, 중기(황경 30°배수 절기)가 없는 첫 달이 윤달
+
+연도별 결과는 메모리에 보관하므로 같은 해는 첫 계산 이후 마이크로초 단위로 응답한다.
+KASI 응답은 선택적으로 검증용으로만 쓴다. (services.today_info 참고)
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+
+# ============================================================
+# 상수 / 타입
+# ============================================================
+
+MIN_YEAR = 1900
+MAX_YEAR = 2100
+
+SYNODIC_MONTH = 29.530588861
+TROPICAL_YEAR = 365.2422
+
+# 황경 0°(춘분)부터 15°씩
+SOLAR_TERM_NAMES = (
+    "춘분", "청명", "곡우", "입하", "소만", "망종",
+    "하지", "소서", "대서", "입추", "처서", "백로",
+    "추분", "한로", "상강", "입동", "소설", "대설",
+    "동지", "소한", "대한", "입춘", "우수", "경칩",
+)
+
+
+class LunarDate(NamedTuple):
+    year: int
+    month: int
+    day: int
+    leap: bool = False
+
+    def isoformat(self) -> str:
+        """KASI 응답과 같은 'YYYY-MM-DD' (윤달 여부는 leap로 따로)."""
+        return f"{self.year:04d}-{self.month:02d}-{self.day:02d}"
+
+
+# ============================================================
+# 1) 시간 변환 (JD / ΔT / 한국 표준시)
+# ============================================================
+
+def _jd_from_datetime(year: int, month: int, day: float) -> float:
+    """그레고리력 날짜 → 율리우스일(JD)."""
+    if month <= 2:
+        year -= 1
+        month += 12
+    a = year // 100
+    b = 2 - a + a // 4
+    return math.floor(365.25 * (year + 4716)) + math.floor(30.6001 * (month + 1)) + day + b - 1524.5
+
+
+def _delta_t_seconds(year: float) -> float:
+    """ΔT = TT − UT (Espenak & Meeus 다항식, 1900~2150)."""
+    y = year
+    if y < 1920:
+        t = y - 1900
+        return -2.79 + 1.494119 * t - 0.0598939 * t ** 2 + 0.0061966 * t ** 3 - 0.000197 * t ** 4
+    if y < 1941:
+        t = y - 1920
+        return 21.20 + 0.84493 * t - 0.076100 * t ** 2 + 0.0020936 * t ** 3
+    if y < 1961:
+        t = y - 1950
+        return 29.07 + 0.407 * t - t ** 2 / 233 + t ** 3 / 2547
+    if y < 1986:
+        t = y - 1975
+        return 45.45 + 1.067 * t - t ** 2 / 260 - t ** 3 / 718
+    if y < 2005:
+        t = y - 2000
+        return (63.86 + 0.3345 * t - 0.060374 * t ** 2 + 0.0017275 * t ** 3
+                + 0.000651814 * t ** 4 + 0.00002373599 * t ** 5)
+    if y < 2050:
+        t = y - 2000
+        return 62.92 + 0.32217 * t + 0.005589 * t ** 2
+    return -20 + 32 * ((y - 1820) / 100) ** 2 - 0.5628 * (2150 - y)
+
+
+def _kst_offset_hours(jd_ut: float) -> float:
+    """해당 시각의 한국 표준시 UTC 오프셋 (역사적 변경 반영)."""
+    if jd_ut < _jd_from_datetime(1912, 1, 1) - 8.5 / 24:
+        return 8.5
+    if jd_ut < _jd_from_datetime(1954, 3, 21) - 9 / 24:
+        return 9.0
+    if jd_ut < _jd_from_datetime(1961, 8, 10) - 8.5 / 24:
+        return 8.5
+    return 9.0
+
+
+def _kst_date(jde: float) -> date:
+    """역학시(TT) JDE → 한국 표준시 기준 날짜."""
+    approx_year = 2000 + (jde - 2451545.0) / 365.25
+    jd_ut = jde - _delta_t_seconds(approx_year) / 86400.0
+    jd_local = jd_ut + _kst_offset_hours(jd_ut) / 24.0
+    # JD 1721425.5 = 0001-01-01 00:00
+    return date.fromordinal(int(math.floor(jd_local - 1721425.5)) + 1)
+
+
+# ============================================================
+# 2) 태양 황경 (VSOP87 축약)
+# ============================================================
+
+# (A, B, C) : A * cos(B + C * τ), τ = 율리우스 천년
+_EARTH_L0 = (
+    (175347046, 0, 0), (3341656, 4.6692568, 6283.07585), (34894, 4.6261, 12566.1517),
+    (3497, 2.7441, 5753.3849), (3418, 2.8289, 3.5231), (3136, 3.6277, 77713.7715),
+    (2676, 4.4181, 7860.4194), (2343, 6.1352, 3930.2097), (1324, 0.7425, 11506.7698),
+    (1273, 2.0371, 529.691), (1199, 1.1096, 1577.3435), (990, 5.233, 5884.927),
+    (902, 2.045, 26.298), (857, 3.508, 398.149), (780, 1.179, 5223.694),
+    (753, 2.533, 5507.553), (505, 4.583, 18849.228), (492, 4.205, 775.523),
+    (357, 2.92, 0.067), (317, 5.849, 11790.629), (284, 1.899, 796.298),
+    (271, 0.315, 10977.079), (243, 0.345, 5486.778), (206, 4.806, 2544.314),
+    (205, 1.869, 5573.143), (202, 2.458, 6069.777), (156, 0.833, 213.299),
+    (132, 3.411, 2942.463), (126, 1.083, 20.775), (115, 0.645, 0.98),
+    (103, 0.636, 4694.003), (102, 0.976, 15720.839), (102, 4.267, 7.114),
+    (99, 6.21, 2146.17), (98, 0.68, 155.42), (86, 5.98, 161000.69),
+    (85, 1.3, 6275.96), (85, 3.67, 71430.7), (80, 1.81, 17260.15),
+    (79, 3.04, 12036.46), (75, 1.76, 5088.63), (74, 3.5, 3154.69),
+    (74, 4.68, 801.82), (70, 0.83, 9437.76), (62, 3.98, 8827.39),
+    (61, 1.82, 7084.9), (57, 2.78, 6286.6), (56, 4.39, 14143.5),
+    (56, 3.47, 6279.55), (52, 0.19, 12139.55), (52, 1.33, 1748.02),
+    (51, 0.28, 5856.48), (49, 0.49, 1194.45), (41, 5.37, 8429.24),
+    (41, 2.4, 19651.05), (39, 6.17, 10447.39), (37, 6.04, 10213.29),
+    (37, 2.57, 1059.38), (36, 1.71, 2352.87), (36, 1.78, 6812.77),
+    (33, 0.59, 17789.85), (30, 0.44, 83996.85), (30, 2.74, 1349.87),
+    (25, 3.16, 4690.48),
+)
+_EARTH_L1 = (
+    (628331966747, 0, 0), (206059, 2.678235, 6283.07585), (4303, 2.6351, 12566.1517),
+    (425, 1.59, 3.523), (119, 5.796, 26.298), (109, 2.966, 1577.344),
+    (93, 2.59, 18849.23), (72, 1.14, 529.69), (68, 1.87, 398.15),
+    (67, 4.41, 5507.55), (59, 2.89, 5223.69), (56, 2.17, 155.42),
+    (45, 0.4, 796.3), (36, 0.47, 775.52), (29, 2.65, 7.11),
+    (21, 5.34, 0.98), (19, 1.85, 5486.78), (19, 4.97, 213.3),
+    (17, 2.99, 6275.96), (16, 0.03, 2544.31), (16, 1.43, 2146.17),
+    (15, 1.21, 10977.08), (12, 2.83, 1748.02), (12, 3.26, 5088.63),
+    (12, 5.27, 1194.45), (12, 2.08, 4694.0), (11, 0.77, 553.57),
+    (10, 1.3, 6286.6), (10, 4.24, 1349.87), (9, 2.7, 242.73),
+    (9, 5.64, 951.72), (8, 5.3, 2352.87), (6, 2.65, 9437.76),
+    (6, 4.67, 4690.48),
+)
+_EARTH_L2 = (
+    (52919, 0, 0), (8720, 1.0721, 6283.0758), (309, 0.867, 12566.152),
+    (27, 0.05, 3.52), (16, 5.19, 26.3), (16, 3.68, 155.42),
+    (10, 0.76, 18849.23), (9, 2.06, 77713.77), (7, 0.83, 775.52),
+    (5, 4.66, 1577.34), (4, 1.03, 7.11), (4, 3.44, 5573.14),
+    (3, 5.14, 796.3), (3, 6.05, 5507.55), (3, 1.19, 242.73),
+    (3, 6.12, 529.69), (3, 0.31, 398.15), (3, 2.28, 553.57),
+    (2, 4.38, 5223.69), (2, 3.75, 0.98),
+)
+_EARTH_L3 = (
+    (289, 5.844, 6283.076), (35, 0, 0), (17, 5.49, 12566.15),
+    (3, 5.2, 155.42), (1, 4.72, 3.52), (1, 5.3, 18849.23), (1, 5.97, 242.73),
+)
+_EARTH_L4 = ((114, 3.142, 0), (8, 4.13, 6283.08), (1, 3.84, 12566.15))
+_EARTH_L5 = ((1, 3.14, 0),)
+
+_EARTH_L = (_EARTH_L0, _EARTH_L1, _EARTH_L2, _EARTH_L3, _EARTH_L4, _EARTH_L5)
+
+
+def solar_longitude(jde: float) -> float:
+    """겉보기 태양 황경(도, 0~360). jde: 역학시 율리우스일."""
+    tau = (jde - 2451545.0) / 365250.0
+    earth_l = 0.0
+    for power, series in enumerate(_EARTH_L):
+        earth_l += sum(a * math.cos(b + c * tau) for a, b, c in series) * tau ** power
+    earth_l /= 1e8
+
+    t = tau * 10.0
+    lon = math.degrees(earth_l) + 180.0          # 지구 일심 → 태양 지심
+    lon -= 0.09033 / 3600.0                      # FK5 보정
+
+    # 장동(경도) + 광행차
+    omega = math.radians(125.04452 - 1934.136261 * t)
+    sun_l = math.radians(280.4665 + 36000.7698 * t)
+    moon_l = math.radians(218.3165 + 481267.8813 * t)
+    nutation = (-17.20 * math.sin(omega) - 1.32 * math.sin(2 * sun_l)
+                - 0.23 * math.sin(2 * moon_l) + 0.21 * math.sin(2 * omega))
+    lon += (nutation - 20.4898) / 3600.0
+    return lon % 360.0
+
+
+def _solar_term_jde(year: int, longitude: float) -> float:
+    """그 해(양력)에 태양 황경이 longitude가 되는 시각(JDE)."""
+    offset = (longitude % 360.0) / 360.0 * TROPICAL_YEAR
+    if longitude >= 270.0 + 15.0:
+        # 소한~경칩은 양력 1~3월 → 그 해 춘분보다 앞
+        offset -= TROPICAL_YEAR
+    jde = _jd_from_datetime(year, 3, 20.5) + offset
+    for _ in range(20):
+        diff = (longitude - solar_longitude(jde) + 180.0) % 360.0 - 180.0
+        jde += diff * TROPICAL_YEAR / 360.0
+        if abs(diff) < 1e-7:
+            break
+    return jde
+
+
+# ============================================================
+# 3) 합삭 (Meeus 49장)
+# ============================================================
+
+_NEW_MOON_TERMS = (
+    # (계수, E 차수, M 계수, M' 계수, F 계수)
+    (-0.40720, 0, 0, 1, 0), (0.17241, 1, 1, 0, 0), (0.01608, 0, 0, 2, 0),
+    (0.01039, 0, 0, 0, 2), (0.00739, 1, -1, 1, 0), (-0.00514, 1, 1, 1, 0),
+    (0.00208, 2, 2, 0, 0), (-0.00111, 0, 0, 1, -2), (-0.00057, 0, 0, 1, 2),
+    (0.00056, 1, 1, 2, 0), (-0.00042, 0, 0, 3, 0), (0.00042, 1, 1, 0, 2),
+    (0.00038, 1, 1, 0, -2), (-0.00024, 1, -1, 2, 0), (-0.00007, 0, 2, 1, 0),
+    (0.00004, 0, 0, 2, -2), (0.00004, 0, 3, 0, 0), (0.00003, 0, 1, 1, -2),
+    (0.00003, 0, 0, 2, 2), (-0.00003, 0, 1, 1, 2), (0.00003, 0, -1, 1, 2),
+    (-0.00002, 0, -1, 1, -2), (-0.00002, 0, 1, 3, 0), (0.00002, 0, 0, 4, 0),
+)
+
+_PLANETARY_TERMS = (
+    (0.000325, 299.77, 0.107408), (0.000165, 251.88, 0.016321),
+    (0.000164, 251.83, 26.651886), (0.000126, 349.42, 36.412478),
+    (0.000110, 84.66, 18.206239), (0.000062, 141.74, 53.303771),
+    (0.000060, 207.14, 2.453732), (0.000056, 154.84, 7.306860),
+    (0.000047, 34.52, 27.261239), (0.000042, 207.19, 0.121824),
+    (0.000040, 291.34, 1.844379), (0.000037, 161.72, 24.198154),
+    (0.000035, 239.56, 25.513099), (0.000023, 331.55, 3.592518),
+)
+
+
+def _new_moon_jde(k: int) -> float:
+    """k번째 합삭 시각(JDE). k=0 → 2000-01-06 부근."""
+    t = k / 1236.85
+    jde = (2451550.09766 + SYNODIC_MONTH * k + 0.00015437 * t ** 2
+           - 0.000000150 * t ** 3 + 0.00000000073 * t ** 4)
+    e = 1 - 0.002516 * t - 0.0000074 * t ** 2
+    m = math.radians(2.5534 + 29.10535670 * k - 0.0000014 * t ** 2 - 0.00000011 * t ** 3)
+    mp = math.radians(201.5643 + 385.81693528 * k + 0.0107582 * t ** 2
+                      + 0.00001238 * t ** 3 - 0.000000058 * t ** 4)
+    f = math.radians(160.7108 + 390.67050284 * k - 0.0016118 * t ** 2
+                     - 0.00000227 * t ** 3 + 0.000000011 * t ** 4)
+    omega = math.radians(124.7746 - 1.56375588 * k + 0.0020672 * t ** 2 + 0.00000215 * t ** 3)
+
+    for coef, e_pow, cm, cmp_, cf in _NEW_MOON_TERMS:
+        jde += coef * e ** e_pow * math.sin(cm * m + cmp_ * mp + cf * f)
+    jde += -0.00017 * math.sin(omega)
+
+    for coef, a0, a1 in _PLANETARY_TERMS:
+        arg = a0 + a1 * k
+        if a0 == 299.77:
+            arg -= 0.009173 * t ** 2
+        jde += coef * math.sin(math.radians(arg))
+    return jde
+
+
+def _new_moon_on_or_before(d: date) -> Tuple[int, date]:
+    """d(한국 날짜) 이전/당일의 가장 가까운 합삭 (k, 합삭 날짜)."""
+    jd = _jd_from_datetime(d.year, d.month, d.day + 0.5)
+    k = math.floor((jd - 2451550.09766) / SYNODIC_MONTH) + 1
+    while _kst_date(_new_moon_jde(k)) > d:
+        k -= 1
+    return k, _kst_date(_new_moon_jde(k))
+
+
+# ============================================================
+# 4) 24절기
+# ============================================================
+
+@lru_cache(maxsize=256)
+def solar_terms(year: int) -> Tuple[Tuple[date, str], ...]:
+    """양력 year의 24절기 (날짜, 이름) 목록, 날짜순."""
+    terms = []
+    for i, name in enumerate(SOLAR_TERM_NAMES):
+        terms.append((_kst_date(_solar_term_jde(year, i * 15.0)), name))
+    return tuple(sorted(terms))
+
+
+def solar_term_on(d: date) -> Optional[str]:
+    """d가 절기 날이면 절기 이름, 아니면 None."""
+    for term_date, name in solar_terms(d.year):
+        if term_date == d:
+            return name
+    return None
+
+
+# ============================================================
+# 5) 음력
+# ============================================================
+
+@lru_cache(maxsize=256)
+def _lunar_months(year: int) -> Tuple[Tuple[date, int, int, bool], ...]:
+    """
+    (year-1)년 동지가 든 11월부터 year년 동지가 든 11월 직전까지의 달 목록.
+    각 항목: (1일 날짜, 음력 연도, 월, 윤달 여부)
+    """
+    solstice_prev = _kst_date(_solar_term_jde(year - 1, 270.0))
+    solstice = _kst_date(_solar_term_jde(year, 270.0))
+    k_start, _ = _new_moon_on_or_before(solstice_prev)
+    k_end, _ = _new_moon_on_or_before(solstice)
+
+    starts = [_kst_date(_new_moon_jde(k)) for k in range(k_start, k_end + 1)]
+    month_count = k_end - k_start
+
+    leap_index = None
+    if month_count == 13:
+        # 중기(황경 30°의 배수)가 없는 첫 달이 윤달
+        principal = [
+            _kst_date(_solar_term_jde(y, lon))
+            for y in (year - 1, year)
+            for lon in range(0, 360, 30)
+        ]
+        for i in range(month_count):
+            if not any(starts[i] <= p < starts[i + 1] for p in principal):
+                leap_index = i
+                break
+
+    months = []
+    number = 11
+    lunar_year = year - 1
+    for i in range(month_count):
+        leap = i == leap_index
+        if i > 0 and not leap:
+            number += 1
+            if number > 12:
+                number = 1
+                lunar_year = year
+        months.append((starts[i], lunar_year, number, leap))
+    return tuple(months)
+
+
+def to_lunar(d: date) -> LunarDate:
+    """양력 날짜 → 음력 날짜 (한국 표준시 기준)."""
+    if not (MIN_YEAR <= d.year <= MAX_YEAR):
+        raise ValueError(f"지원 범위({MIN_YEAR}~{MAX_YEAR}) 밖의 날짜입니다: {d}")
+
+    months = _lunar_months(d.year + 1)
+    if d < months[0][0]:
+        months = _lunar_months(d.year)
+
+    idx = bisect_right([m[0] for m in months], d) - 1
+    start, lunar_year, month, leap = months[idx]
+    return LunarDate(lunar_year, month, (d - start).days + 1, leap)
+
+
+def today_kst() -> date:
+    """서버 시간대와 무관하게 한국 날짜."""
+    return datetime.now(timezone(timedelta(hours=9))).date()
@@ -0,0 +1,123 @@
+# services/lang_detect.py
+# -*- coding: utf-8 -*-
+"""
+문자(유니코드 스크립트) 분포만으로 ko / en / ja / zh / vi 를 빠르게 판별하는 로컬 언어 식별기.
+
+- 다국어 STT 결과 텍스트의 언어를 LLM 호출 없이 판단하기 위한 용도
+- 확신이 없으면 None을 돌려주고, 호출 측(detect_language)이 LLM으로 넘긴다.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Dict, Optional
+
+
+# ============================================================
+# 판별 기준
+# ============================================================
+
+# 주된 스크립트가 전체 글자 중 이 비율 이상이어야 확정
+MIN_SCRIPT_SHARE = 0.6
+# 판단에 필요한 최소 글자 수 (그보다 짧으면 None)
+MIN_LETTERS = 2
+
+# 베트남어에만 쓰이는 라틴 문자 (성조 부호 포함 문자는 아래 범위로 따로 체크)
+_VI_SPECIFIC = set("ăâđêôơưĂÂĐÊÔƠƯ")
+
+# 자주 나오는 영어 기능어 (라틴 문자 텍스트가 영어인지 확인용)
+_EN_WORDS = {
+    "the", "a", "an", "is", "are", "was", "i", "you", "my", "to", "of", "in", "on",
+    "and", "it", "there", "this", "please", "can", "not", "no", "have", "has", "help",
+    "where", "what", "how", "with", "for", "at", "me", "we", "do", "does",
+}
+
+_WORD_RE = re.compile(r"[A-Za-z]+")
+
+
+def _script_of(ch: str) -> Optional[str]:
+    code = ord(ch)
+    if 0xAC00 <= code <= 0xD7A3 or 0x1100 <= code <= 0x11FF or 0x3130 <= code <= 0x318F:
+        return "hangul"
+    if 0x3040 <= code <= 0x30FF or 0x31F0 <= code <= 0x31FF:
+        return "kana"
+    if 0x4E00 <= code <= 0x9FFF or 0x3400 <= code <= 0x4DBF:
+        return "han"
+    if ch.isalpha() and "LATIN" in unicodedata.name(ch, ""):
+        return "latin"
+    if ch.isalpha():
+        return "other"
+    return None
+
+
+def _is_vietnamese_letter(ch: str) -> bool:
+    # Latin Extended Additional 의 베트남어 성조 문자 (ạ, ả, ế, ồ, ự ...)
+    return ch in _VI_SPECIFIC or 0x1EA0 <= ord(ch) <= 0x1EF9
+
+
+# ============================================================
+# 공개 함수
+# ============================================================
+
+def script_counts(text: str) -> Dict[str, int]:
+    """텍스트의 스크립트별 글자 수."""
+    counts: Dict[str, int] = {}
+    for ch in text:
+        script = _script_of(ch)
+        if script:
+            counts[script] = counts.get(script, 0) + 1
+    return counts
+
+
+def identify_language(text: str) -> Optional[str]:
+    """
+    텍스트 언어를 ko / en / ja / zh / vi 중 하나로 판별.
+    확신이 없으면 None.
+
+    - 한글 비율이 높으면 ko
+    - 가나가 조금이라도 섞인 한자/가나 텍스트는 ja, 가나 없는 한자 텍스트는 zh
+    - 라틴 문자: 베트남어 전용 문자 비율이 있으면 vi,
+      악센트 없는 라틴 문자 + 영어 기능어가 있으면 en
+    """
+    if not text:
+        return None
+
+    counts = script_counts(text)
+    total = sum(counts.values())
+    if total < MIN_LETTERS:
+        return None
+
+    hangul = counts.get("hangul", 0)
+    kana = counts.get("kana", 0)
+    han = counts.get("han", 0)
+    latin = counts.get("latin", 0)
+
+    if hangul / total >= MIN_SCRIPT_SHARE:
+        return "ko"
+
+    # 일본어 문장은 보통 한자 + 가나가 섞여 있음
+    if (kana + han) / total >= MIN_SCRIPT_SHARE:
+        if kana and kana / (kana + han) >= 0.1:
+            return "ja"
+        if not kana:
+            return "zh"
+        return None
+
+    if latin / total >= MIN_SCRIPT_SHARE:
+        latin_chars = [ch for ch in text if _script_of(ch) == "latin"]
+        vi_marks = sum(1 for ch in latin_chars if _is_vietnamese_letter(ch))
+        if vi_marks and vi_marks / len(latin_chars) >= 0.05:
+            return "vi"
+
+        non_ascii = sum(1 for ch in latin_chars if ord(ch) > 127)
+        if non_ascii:
+            # é, ñ, ü 등 → 다른 유럽어일 수 있으므로 판단 보류
+            return None
+
+        words = [w.lower() for w in _WORD_RE.findall(text)]
+        if any(w in _EN_WORDS for w in words):
+            return "en"
+        return None
+
+    return None
@@ -3,10 +3,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import OrderedDict
 from datetime import date
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Awaitable, Callable, Hashable, Tuple
 
-import httpx
 from pydantic import BaseModel
 
 from core.config import (
@@ -15,8 +17,90 @@ from core.config import (
     KASI_SERVICE_KEY,
     KASI_LUNAR_URL,
     KASI_24DIV_URL,
+    WEATHER_CACHE_TTL_SEC,
+    CALENDAR_CACHE_TTL_SEC,
+    TODAY_INFO_CACHE_MAX_ENTRIES,
+    CALENDAR_SOURCE,
+    CALENDAR_VERIFY_WITH_KASI,
+    EXTERNAL_API_TIMEOUT_SEC,
+    KIOSK_LOCATIONS,
+    WEATHER_REFRESH_SEC,
 )
+from core.http_client import get_client
 from core.logging import logger
+from services import korean_calendar
+
+
+# ============================================================
+# 0) TTL 캐시 + singleflight
+#    - 키오스크 여러 대가 계속 폴링해도 외부 API는 TTL마다 한 번만 호출
+#    - 같은 키를 동시에 조회하면 진행 중인 호출 하나를 같이 기다림
+#    - 실패(예외)는 캐시하지 않음
+# ============================================================
+
+class _AsyncTTLCache:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}   # key → (만료 시각, 값)
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.stats = {"hits": 0, "misses": 0, "joined": 0, "errors": 0}
+
+    async def get_or_load(self,
+                          key: Hashable,
+                          ttl: float,
+                          loader: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self.stats["hits"] += 1
+            return entry[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.stats["misses"] += 1
+            task = asyncio.ensure_future(self._load(key, ttl, loader))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+        else:
+            self.stats["joined"] += 1
+
+        # 먼저 요청한 쪽이 끊겨도 호출은 계속 진행 (기다리던 다른 요청이 결과를 받도록)
+        return await asyncio.shield(task)
+
+    async def _load(self, key: Hashable, ttl: float, loader: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await loader()
+        except Exception:
+            self.stats["errors"] += 1
+            raise
+        self._entries[key] = (time.monotonic() + ttl, value)
+        if len(self._entries) > self.max_entries:
+            self._prune()
+        return value
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for k in [k for k, (exp, _) in self._entries.items() if exp <= now]:
+            del self._entries[k]
+        # 그래도 넘치면 만료가 가장 가까운 것부터 삭제
+        overflow = len(self._entries) - self.max_entries
+        if overflow > 0:
+            for k, _ in sorted(self._entries.items(), key=lambda kv: kv[1][0])[:overflow]:
+                del self._entries[k]
+
+
+_cache = _AsyncTTLCache(TODAY_INFO_CACHE_MAX_ENTRIES)
+
+
+async def cached(key: Hashable, ttl: float, loader: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    key 결과가 ttl초 안에 있으면 재사용하고, 없으면 loader()를 한 번만 호출한다.
+    (app_fastapi 헤더용 날씨/음력 조회도 같은 캐시를 사용)
+    """
+    return await _cache.get_or_load(key, ttl, loader)
+
+
+def cache_stats() -> Dict[str, int]:
+    return {**_cache.stats, "entries": len(_cache._entries), "inflight": len(_cache._inflight)}
 
 
 # ============================================================
@@ -42,19 +126,137 @@ class SeasonInfo(BaseModel):
 class TodayInfo(BaseModel):
     weather: WeatherInfo
     season: SeasonInfo
+    weather_age_sec: Optional[int] = None   # 마지막으로 날씨 조회에 성공한 뒤 지난 시간(초)
+    weather_stale: bool = False             # WEATHER_CACHE_TTL_SEC보다 오래된 값이면 True
 
 
 # ============================================================
 # 1) 날씨: WeatherAPI.com
 # ============================================================
 
+async def _fetch_weather_json(location: str) -> Dict[str, Any]:
+    """WeatherAPI forecast 원본 JSON. (백그라운드 갱신에서만 호출)"""
+    params = {
+        "key": WEATHER_API_KEY,
+        "q": location,
+        "days": 1,
+        "lang": "ko",
+        "aqi": "no",
+    }
+
+    res = await get_client().get(WEATHER_API_URL, params=params, timeout=EXTERNAL_API_TIMEOUT_SEC)
+    logger.info(
+        f"[WeatherAPI] status={res.status_code}, body[:200]={res.text[:200]}"
+    )
+    res.raise_for_status()
+    return res.json()
+
+
+# ------------------------------------------------------------
+# stale-while-revalidate
+#   - 조회는 항상 "마지막 성공 값"을 즉시 반환 (외부 API를 기다리지 않음)
+#   - 값이 WEATHER_CACHE_TTL_SEC보다 오래됐으면 백그라운드 갱신만 걸어 둠
+#   - 실패는 오류 대신 경과 시간(age)으로 드러남
+#   - 외부 API는 등록된 지역(KIOSK_LOCATIONS + 갱신 작업에 넘긴 지역)만 호출
+#     (요청마다 임의의 location 문자열로 메모리/WeatherAPI 호출이 늘어나지 않도록)
+# ------------------------------------------------------------
+
+# location → (성공 시각, JSON), 최대 TODAY_INFO_CACHE_MAX_ENTRIES개 (오래 안 쓴 것부터 삭제)
+_weather_last_good: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_weather_refreshing: Dict[str, "asyncio.Future[None]"] = {}
+_tracked_locations = set(KIOSK_LOCATIONS)
+_refresher_task: Optional["asyncio.Task[None]"] = None
+
+
+def is_tracked_location(location: str) -> bool:
+    """날씨를 외부 API로 받아 오는 지역인지 여부."""
+    return location in _tracked_locations or location in _weather_last_good
+
+
+async def _refresh_weather(location: str) -> None:
+    try:
+        data = await _fetch_weather_json(location)
+    except Exception as e:
+        age = weather_age_sec(location)
+        logger.warning(
+            f"[WeatherAPI] {location} 갱신 실패: {e} "
+            f"(마지막 성공 값 사용, 경과 {age if age is not None else '-'}초)"
+        )
+        return
+    _weather_last_good[location] = (time.time(), data)
+    _weather_last_good.move_to_end(location)
+    while len(_weather_last_good) > TODAY_INFO_CACHE_MAX_ENTRIES:
+        _weather_last_good.popitem(last=False)
+
+
+def refresh_weather_in_background(location: str) -> "asyncio.Future[None]":
+    """지역 날씨 갱신을 백그라운드로 시작 (이미 진행 중이면 그 작업을 반환)."""
+    task = _weather_refreshing.get(location)
+    if task is None:
+        task = asyncio.ensure_future(_refresh_weather(location))
+        _weather_refreshing[location] = task
+        task.add_done_callback(lambda _t: _weather_refreshing.pop(location, None))
+    return task
+
+
+def weather_age_sec(location: str) -> Optional[int]:
+    entry = _weather_last_good.get(location)
+    if entry is None:
+        return None
+    return int(time.time() - entry[0])
+
+
+def get_weather_json(location: str) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+    """
+    마지막 성공 날씨 JSON과 경과 시간(초)을 바로 반환한다. (없으면 (None, None))
+    TTL이 지났거나 값이 없으면 백그라운드 갱신을 건다. (등록된 지역만)
+    """
+    entry = _weather_last_good.get(location)
+    if entry is not None:
+        _weather_last_good.move_to_end(location)
+    age = None if entry is None else int(time.time() - entry[0])
+    if (WEATHER_API_KEY and (age is None or age >= WEATHER_CACHE_TTL_SEC)
+            and is_tracked_location(location)):
+        refresh_weather_in_background(location)
+    return (entry[1] if entry else None), age
+
+
+def is_stale(age: Optional[int]) -> bool:
+    return age is None or age >= WEATHER_CACHE_TTL_SEC
+
+
+async def _refresher_loop(locations: Tuple[str, ...]) -> None:
+    while True:
+        await asyncio.gather(*(refresh_weather_in_background(loc) for loc in locations))
+        await asyncio.sleep(WEATHER_REFRESH_SEC)
+
+
+def start_weather_refresher(locations=None) -> None:
+    """KIOSK_LOCATIONS 날씨를 주기적으로 미리 갱신하는 작업 시작. (app lifespan에서 호출)"""
+    global _refresher_task
+    locations = tuple(locations or KIOSK_LOCATIONS)
+    _tracked_locations.update(locations)
+    if not WEATHER_API_KEY or not locations:
+        return
+    if _refresher_task is None or _refresher_task.done():
+        _refresher_task = asyncio.ensure_future(_refresher_loop(locations))
+
+
+async def stop_weather_refresher() -> None:
+    global _refresher_task
+    if _refresher_task is not None:
+        _refresher_task.cancel()
+        await asyncio.gather(_refresher_task, return_exceptions=True)
+        _refresher_task = None
+
+
 async def fetch_weather(location: str = "Gwangju") -> WeatherInfo:
     """
     WeatherAPI.com 의 forecast 기능을 사용해서
     - 현재 기온
     - 오늘 최저/최고 기온
     - 체감 온도
-    를 가져온다.
+    를 가져온다. (마지막 성공 값을 즉시 반환, 갱신은 백그라운드)
     """
     # 1) 키가 없을 때: 서버 안 죽게 기본값 리턴
     if not WEATHER_API_KEY:
@@ -69,25 +271,9 @@ async def fetch_weather(location: str = "Gwangju") -> WeatherInfo:
             feelslike_c=None,
         )
 
-    params = {
-        "key": WEATHER_API_KEY,
-        "q": location,
-        "days": 1,
-        "lang": "ko",
-        "aqi": "no",
-    }
-
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            res = await client.get(WEATHER_API_URL, params=params)
-            logger.info(
-                f"[WeatherAPI] status={res.status_code}, body[:200]={res.text[:200]}"
-            )
-            res.raise_for_status()
-            data = res.json()
-    except Exception as e:
-        # 2) 외부 API 호출이 어떤 이유로든 실패해도 서버는 안 죽게
-        logger.warning(f"[WeatherAPI] 호출 중 에러 발생: {e} → 더미 값으로 대체합니다.")
+    data, _age = get_weather_json(location)
+    if data is None:
+        # 2) 아직 한 번도 성공한 적 없음 (첫 갱신 진행 중, 계속 실패, 또는 등록되지 않은 지역) → 빈 값
         return WeatherInfo(
             location=location,
             temp_c=None,
@@ -98,7 +284,7 @@ async def fetch_weather(location: str = "Gwangju") -> WeatherInfo:
             feelslike_c=None,
         )
 
-    # 3) 정상 응답일 때 데이터 파싱
+    # 3) 마지막 성공 응답 파싱
     location_name = data.get("location", {}).get("name", location)
     current = data.get("current", {}) or {}
     forecast_day = (
@@ -119,16 +305,57 @@ async def fetch_weather(location: str = "Gwangju") -> WeatherInfo:
 
 
 # ============================================================
-# 2) 한국천문연구원(KASI) — 음력/절기
-#    (예전에 잘 되던 코드 그대로 옮김)
+# 2) 음력/절기
+#    - 기본: services.korean_calendar 로컬 계산 (네트워크 없음)
+#    - 한국천문연구원(KASI) API: CALENDAR_SOURCE="kasi"이거나 검증용일 때만 호출
 # ============================================================
 
+def local_season_info(target: date) -> SeasonInfo:
+    """로컬 계산으로 음력 날짜 + 절기. (1900~2100 밖이면 ValueError)"""
+    return SeasonInfo(
+        today=target,
+        lunar_date=korean_calendar.to_lunar(target).isoformat(),
+        solar_term=korean_calendar.solar_term_on(target),
+    )
+
+
+async def _verify_with_kasi(local: SeasonInfo) -> bool:
+    """로컬 계산 결과를 KASI 응답과 비교해서 다르면 경고 로그를 남긴다."""
+    remote = await _fetch_season_info_kasi(local.today)
+    if remote.lunar_date is None:
+        # KASI 조회 실패 → 판단 보류
+        return True
+    same = (remote.lunar_date, remote.solar_term) == (local.lunar_date, local.solar_term)
+    if not same:
+        logger.warning(
+            f"[calendar] 로컬 계산과 KASI가 다릅니다: {local.today} "
+            f"local=({local.lunar_date}, {local.solar_term}) "
+            f"kasi=({remote.lunar_date}, {remote.solar_term})"
+        )
+    return same
+
+
+def _schedule_kasi_verification(local: SeasonInfo) -> None:
+    """날짜마다 한 번만 백그라운드로 KASI 검증 (응답은 기다리지 않음)."""
+    task = asyncio.ensure_future(
+        cached(("kasi_verify", local.today), CALENDAR_CACHE_TTL_SEC,
+               lambda: _verify_with_kasi(local))
+    )
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
 async def _fetch_lunar_date(target: date) -> Optional[str]:
     """
     양력 날짜(target)를 기준으로 음력 날짜(YYYY-MM-DD)를 조회해서 돌려준다.
+    (날짜별로 CALENDAR_CACHE_TTL_SEC 동안 캐시)
     """
     if not KASI_SERVICE_KEY:
         raise RuntimeError("KASI_SERVICE_KEY 가 설정되지 않았습니다.")
+    return await cached(("lunar", target), CALENDAR_CACHE_TTL_SEC,
+                        lambda: _fetch_lunar_date_upstream(target))
+
+
+async def _fetch_lunar_date_upstream(target: date) -> Optional[str]:
 
     params = {
         "solYear": target.strftime("%Y"),
@@ -138,10 +365,9 @@ async def _fetch_lunar_date(target: date) -> Optional[str]:
         "_type": "json",
     }
 
-    async with httpx.AsyncClient(timeout=5.0) as client:
-        res = await client.get(KASI_LUNAR_URL, params=params)
-        res.raise_for_status()
-        data = res.json()
+    res = await get_client().get(KASI_LUNAR_URL, params=params, timeout=EXTERNAL_API_TIMEOUT_SEC)
+    res.raise_for_status()
+    data = res.json()
 
     body = data.get("response", {}).get("body", {})
     if int(body.get("totalCount", 0)) == 0:
@@ -162,69 +388,86 @@ async def _fetch_seasonal_term(target: date) -> Optional[str]:
     """
     해당 날짜에 24절기가 있으면 그 이름(예: 입춘, 우수)을 반환.
     없으면 None.
+    (KASI는 한 달치 절기를 한 번에 주므로 월 단위로 캐시)
     """
     if not KASI_SERVICE_KEY:
         raise RuntimeError("KASI_SERVICE_KEY 가 설정되지 않았습니다.")
 
+    terms = await cached(("solar_terms", target.year, target.month), CALENDAR_CACHE_TTL_SEC,
+                         lambda: _fetch_month_terms(target.year, target.month))
+    return terms.get(target.strftime("%Y%m%d"))
+
+
+async def _fetch_month_terms(year: int, month: int) -> Dict[str, str]:
+    """해당 월의 24절기 {YYYYMMDD: 절기 이름}."""
     params = {
-        "solYear": target.strftime("%Y"),
-        "solMonth": target.strftime("%m"),
+        "solYear": f"{year:04d}",
+        "solMonth": f"{month:02d}",
         "ServiceKey": KASI_SERVICE_KEY,
         "_type": "json",
         "numOfRows": "50",
         "pageNo": "1",
     }
 
-    async with httpx.AsyncClient(timeout=5.0) as client:
-        res = await client.get(KASI_24DIV_URL, params=params)
-        res.raise_for_status()
-        data = res.json()
+    res = await get_client().get(KASI_24DIV_URL, params=params, timeout=EXTERNAL_API_TIMEOUT_SEC)
+    res.raise_for_status()
+    data = res.json()
 
     body = data.get("response", {}).get("body", {})
     if int(body.get("totalCount", 0)) == 0:
-        return None
+        return {}
 
     items = body.get("items", {}).get("item")
     if not items:
-        return None
+        return {}
     if isinstance(items, dict):
         items = [items]
 
-    today_str = target.strftime("%Y%m%d")
-
-    for item in items:
-        if str(item.get("locdate")) == today_str:
-            return str(item.get("dateName"))
-
-    return None
+    return {str(item.get("locdate")): str(item.get("dateName")) for item in items}
 
 
 async def fetch_season_info(target_date: Optional[date] = None) -> SeasonInfo:
     """
-    오늘(또는 target_date)에 대한
+    오늘(한국 날짜, 또는 target_date)에 대한
     - 음력 날짜
     - 24절기 이름
     을 한 번에 묶어서 반환.
     """
     if target_date is None:
-        target_date = date.today()
+        target_date = korean_calendar.today_kst()
+
+    if CALENDAR_SOURCE != "kasi":
+        try:
+            info = local_season_info(target_date)
+        except ValueError as e:
+            logger.warning(f"[calendar] 로컬 계산 불가 → KASI 조회: {e}")
+        else:
+            if CALENDAR_VERIFY_WITH_KASI and KASI_SERVICE_KEY:
+                _schedule_kasi_verification(info)
+            return info
 
+    return await _fetch_season_info_kasi(target_date)
+
+
+async def _fetch_season_info_kasi(target_date: date) -> SeasonInfo:
+    """KASI API로 음력 날짜 + 절기 조회. (실패한 항목은 None)"""
     if not KASI_SERVICE_KEY:
         logger.warning("KASI_SERVICE_KEY 가 없어 절기/음력은 비워 둡니다.")
         return SeasonInfo(today=target_date)
 
-    lunar_date: Optional[str] = None
-    solar_term: Optional[str] = None
-
-    try:
-        lunar_date = await _fetch_lunar_date(target_date)
-    except Exception as e:
-        logger.warning(f"Lunar API error: {e}")
+    # 음력 / 절기는 서로 독립 → 동시에 조회
+    lunar_date, solar_term = await asyncio.gather(
+        _fetch_lunar_date(target_date),
+        _fetch_seasonal_term(target_date),
+        return_exceptions=True,
+    )
 
-    try:
-        solar_term = await _fetch_seasonal_term(target_date)
-    except Exception as e:
-        logger.warning(f"Seasonal-term API error: {e}")
+    if isinstance(lunar_date, Exception):
+        logger.warning(f"Lunar API error: {lunar_date}")
+        lunar_date = None
+    if isinstance(solar_term, Exception):
+        logger.warning(f"Seasonal-term API error: {solar_term}")
+        solar_term = None
 
     return SeasonInfo(
         today=target_date,
@@ -239,11 +482,12 @@ async def fetch_season_info(target_date: Optional[date] = None) -> SeasonInfo:
 
 async def _gather_weather_and_season(location: str) -> Tuple[WeatherInfo, SeasonInfo]:
     """
-    필요하면 나중에 asyncio.gather 로 병렬 호출도 가능.
-    지금은 구조를 단순하게 하기 위해 순차 호출.
+    날씨와 절기는 서로 독립 → 동시에 조회 (가장 느린 쪽 시간만 걸림)
     """
-    weather = await fetch_weather(location=location)
-    season = await fetch_season_info()
+    weather, season = await asyncio.gather(
+        fetch_weather(location=location),
+        fetch_season_info(),
+    )
     return weather, season
 
 
@@ -252,5 +496,12 @@ async def get_today_info(location: str = "Gwangju") -> TodayInfo:
     /api/today-info 에서 직접 사용하는 헬퍼:
     날씨 + 절기를 한 번에 가져온다.
     """
+    # 날씨 값과 같은 시점의 경과 시간 (조회 중 백그라운드 갱신이 끝나도 어긋나지 않게 먼저 읽음)
+    age = weather_age_sec(location)
     weather, season = await _gather_weather_and_season(location)
-    return TodayInfo(weather=weather, season=season)
+    return TodayInfo(
+        weather=weather,
+        season=season,
+        weather_age_sec=age,
+        weather_stale=bool(WEATHER_API_KEY) and is_stale(age),
+    )
@@ -0,0 +1,69 @@
+# services/tts_cache.py
+# -*- coding: utf-8 -*-
+"""
+TTS(CLOVA Voice) 결과 MP3 캐시.
+
+- 키: (문장, 목소리, 속도, TTS_VOICE_VERSION)의 해시 → 같은 문장은 CLOVA를 다시 부르지 않음
+- 저장: TTS_CACHE_DIR/ab/abcdef....mp3 (공용 core/file_cache, 디스크만 사용)
+- 정리: 전체 크기가 TTS_CACHE_MAX_BYTES를 넘으면 가장 오래 안 쓴 파일부터 삭제 (LRU)
+- 지표: 적중/미스/저장/삭제 횟수와 캐시에서 읽은 바이트 (stats)
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Dict, Optional
+
+from core.config import (
+    TTS_CACHE_ENABLED,
+    TTS_CACHE_DIR,
+    TTS_CACHE_MAX_BYTES,
+    TTS_VOICE_VERSION,
+)
+from core.file_cache import FileCache
+
+
+# MP3는 크고 재생할 때마다 디스크에서 읽어도 충분히 빨라서 메모리 보관 없이 디스크만 사용
+_cache = FileCache(
+    "TTS",
+    TTS_CACHE_DIR,
+    ".mp3",
+    max_bytes=TTS_CACHE_MAX_BYTES,
+    enabled=TTS_CACHE_ENABLED,
+)
+
+
+# ============================================================
+# 키
+# ============================================================
+
+def make_key(text: str, speaker: str, speed: int) -> str:
+    """(문장, 목소리, 속도, 음성 버전) → 캐시 키 (ETag로도 사용)."""
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{TTS_VOICE_VERSION}\0{speaker}\0{speed}\0{text}".encode("utf-8"))
+    return h.hexdigest()
+
+
+# ============================================================
+# 조회 / 저장
+# ============================================================
+
+def get(key: str) -> Optional[bytes]:
+    """캐시에 있으면 MP3 바이트, 없으면 None."""
+    return _cache.get(key)
+
+
+def put(key: str, data: bytes) -> None:
+    """MP3 바이트를 저장하고, 용량을 넘으면 오래된 것부터 삭제."""
+    if data:
+        _cache.put(key, data)
+
+
+def contains(key: str) -> bool:
+    """지표를 건드리지 않고 캐시 존재 여부만 확인."""
+    return _cache.contains(key)
+
+
+def stats() -> Dict[str, Any]:
+    """모니터링용 캐시 지표."""
+    return _cache.stats()
@@ -0,0 +1,111 @@
+# services/tts_prefetch.py
+# -*- coding: utf-8 -*-
+"""
+턴 응답용 TTS 선합성.
+
+키오스크는 턴 결과(JSON)를 받은 뒤 다시 /tts를 호출해서 안내 음성을 받는다.
+with_tts 옵션을 켜면 엔진 결과가 나오는 즉시 여기서 합성을 시작하고,
+응답에는 음성 주소(/tts/audio/{key})만 넣어 보낸다.
+
+- 같은 키의 합성은 한 번만 진행 (진행 중인 작업을 같이 기다림)
+- 합성 결과는 services/tts_cache에 저장되어 /tts/audio/{key}에서 바로 제공
+- 끝난 결과(성공 음성 / 실패 오류)는 TTS_PREFETCH_RESULT_TTL_SEC 동안 따로 보관
+  (TTS 캐시가 꺼져 있어도 방금 내준 주소가 404가 되지 않고, 실패하면 그 오류를 그대로 돌려줌)
+- 동기(스레드풀) 엔드포인트에서도 부를 수 있도록 전용 스레드풀에서 합성
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+from core.config import (
+    TTS_PREFETCH_WORKERS,
+    TTS_PREFETCH_RESULT_TTL_SEC,
+    TTS_PREFETCH_RESULT_MAX,
+)
+from core.logging import logger
+from services import clova_tts, tts_cache
+
+
+_executor = ThreadPoolExecutor(max_workers=TTS_PREFETCH_WORKERS, thread_name_prefix="tts-prefetch")
+_lock = threading.Lock()
+_inflight: Dict[str, "Future[bytes]"] = {}
+# 끝난 작업: key → (만료 시각, Future)  (오래된 것부터 정리)
+_finished: "OrderedDict[str, Tuple[float, Future[bytes]]]" = OrderedDict()
+
+
+def _synthesize(key: str, text: str, speaker: str, speed: int) -> bytes:
+    audio = clova_tts.synthesize(text, speaker, speed)
+    tts_cache.put(key, audio)
+    return audio
+
+
+def _prune_locked(now: float) -> None:
+    while _finished:
+        key, (expires_at, _fut) = next(iter(_finished.items()))
+        if expires_at > now and len(_finished) <= TTS_PREFETCH_RESULT_MAX:
+            break
+        del _finished[key]
+
+
+def _finish(key: str, fut: "Future[bytes]") -> None:
+    now = time.monotonic()
+    with _lock:
+        if _inflight.get(key) is fut:
+            del _inflight[key]
+        if not fut.cancelled():
+            _finished.pop(key, None)
+            _finished[key] = (now + TTS_PREFETCH_RESULT_TTL_SEC, fut)
+        _prune_locked(now)
+    if not fut.cancelled() and fut.exception() is not None:
+        logger.warning(f"TTS 선합성 실패: {key} ({fut.exception()})")
+
+
+def _lookup_locked(key: str) -> Optional["Future[bytes]"]:
+    """진행 중이거나 최근에 끝난 작업. 없거나 만료됐으면 None."""
+    fut = _inflight.get(key)
+    if fut is not None:
+        return fut
+    _prune_locked(time.monotonic())
+    entry = _finished.get(key)
+    return entry[1] if entry is not None else None
+
+
+def prefetch(text: str, speaker: str, speed: int) -> str:
+    """
+    합성을 백그라운드로 시작하고 캐시 키를 바로 반환한다.
+    이미 캐시에 있거나, 합성 중이거나, 최근에 합성을 마쳤으면 새로 시작하지 않는다.
+    (최근 실패한 키는 다시 시도)
+    """
+    key = tts_cache.make_key(text, speaker, speed)
+    if tts_cache.contains(key):
+        return key
+
+    with _lock:
+        fut = _lookup_locked(key)
+        if fut is not None and (not fut.done() or fut.exception() is None):
+            return key
+        fut = _executor.submit(_synthesize, key, text, speaker, speed)
+        _inflight[key] = fut
+    fut.add_done_callback(lambda f: _finish(key, f))
+    return key
+
+
+async def get_audio(key: str) -> Optional[bytes]:
+    """
+    키에 해당하는 MP3를 반환한다.
+    합성 중이면 끝날 때까지 기다리고, 캐시에도 없고 최근 작업도 없으면 None.
+    (최근 합성이 실패했으면 그 ClovaTTSError)
+    """
+    with _lock:
+        fut = _lookup_locked(key)
+    if fut is not None:
+        return await asyncio.wrap_future(fut)
+    return await run_in_threadpool(tts_cache.get, key)
@@ -0,0 +1,227 @@
+# services/tts_prewarm.py
+# -*- coding: utf-8 -*-
+"""
+고정 안내 문구 TTS 사전 생성(prewarm).
+
+하루 첫 주민이 표준 문구 때문에 CLOVA를 기다리지 않도록,
+서버 시작 시 백그라운드에서 아래 문구를 미리 합성해 services/tts_cache에 넣어 둔다.
+
+- 키오스크 인사말 (KIOSK_GREETING_FILE, 기본 temp.json)
+- 키오스크 화면별 고정 안내 (KIOSK_TTS_PHRASES_FILE, 프론트 화면이 import하는 같은 JSON)
+- 민원 엔진 고정 문구 (brain/phrase_catalog: 위치 추가 질문, 카테고리별 요약/결과 안내, 모든 지원 언어)
+
+문구가 바뀌거나(인사말/화면 문구 파일 수정, 배포로 카탈로그 변경) 캐시에서 밀려난 항목은
+TTS_PREWARM_RECHECK_SEC마다 다시 확인해서 빠진 것만 합성한다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from brain import phrase_catalog
+from core.config import (
+    KIOSK_GREETING_FILE,
+    KIOSK_TTS_PHRASES_FILE,
+    TTS_DEFAULT_SPEAKER,
+    TTS_DEFAULT_SPEED,
+    TTS_PREWARM_ENABLED,
+    TTS_PREWARM_MAX_RPS,
+    TTS_PREWARM_RECHECK_SEC,
+)
+from core.logging import logger
+from services import tts_cache
+
+
+# (text, speaker, speed) → MP3 bytes
+Synthesizer = Callable[[str, str, int], bytes]
+
+_state_lock = threading.Lock()
+_thread: Optional[threading.Thread] = None
+_stop = threading.Event()
+_status: Dict[str, object] = {
+    "fingerprint": None,
+    "phrases": 0,
+    "synthesized": 0,
+    "failed": 0,
+    "last_run_at": None,
+}
+
+
+# ============================================================
+# 문구 수집
+# ============================================================
+
+def load_greeting() -> Optional[str]:
+    """키오스크 인사말 파일({"text": "..."})에서 문장을 읽는다."""
+    try:
+        data = json.loads(KIOSK_GREETING_FILE.read_text(encoding="utf-8-sig"))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"인사말 파일 읽기 실패: {KIOSK_GREETING_FILE} ({e})")
+        return None
+    text = (data.get("text") or "").strip() if isinstance(data, dict) else ""
+    return text or None
+
+
+def load_kiosk_phrases() -> Dict[str, str]:
+    """
+    프론트 화면이 requestTts()로 보내는 고정 문장 파일을 읽는다.
+    (키 → 문장, summarySuffix는 SummaryPage가 summary_tts 뒤에 붙이는 문장)
+    """
+    try:
+        data = json.loads(KIOSK_TTS_PHRASES_FILE.read_text(encoding="utf-8-sig"))
+    except Exception as e:
+        logger.warning(f"키오스크 화면 문구 파일 읽기 실패: {KIOSK_TTS_PHRASES_FILE} ({e})")
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {str(k): v for k, v in data.items() if isinstance(v, str)}
+
+
+def _catalog_phrases(summary_suffix: str = "") -> List[str]:
+    """
+    위치/안내(guide) 같은 자유 슬롯이 없는, 완성된 문장만 모은다.
+    (위치가 들어간 요약/결과 문장은 민원마다 달라서 제외)
+    """
+    render = phrase_catalog.render
+    phrases: List[str] = []
+    for lang in phrase_catalog.SUPPORTED_LANGS:
+        phrases.append(render("clar_prompt", lang))
+        empathy = render("empathy", lang)
+        for category in phrase_catalog.CATEGORY_NAMES:
+            slots = {
+                "category": phrase_catalog.category_name(category, lang),
+                "location": "",
+                "empathy": empathy,
+            }
+            summary_tts = render("summary_tts", lang, **slots)
+            phrases.append(summary_tts)
+            phrases.append(render("result_tts_visit", lang, **slots))
+            if lang == "ko" and summary_suffix:
+                phrases.append(summary_tts + summary_suffix)
+    return phrases
+
+
+def collect_phrases() -> List[str]:
+    """사전 생성 대상 문장 목록 (중복 제거, /tts와 같은 strip 기준)."""
+    candidates: List[str] = []
+    greeting = load_greeting()
+    if greeting:
+        candidates.append(greeting)
+    kiosk = load_kiosk_phrases()
+    summary_suffix = kiosk.pop("summarySuffix", "")
+    candidates.extend(kiosk.values())
+    candidates.extend(_catalog_phrases(summary_suffix))
+
+    seen = set()
+    phrases: List[str] = []
+    for text in candidates:
+        text = text.strip()
+        if text and text not in seen:
+            seen.add(text)
+            phrases.append(text)
+    return phrases
+
+
+def fingerprint(phrases: List[str]) -> str:
+    """문구 목록 + 카탈로그 버전 지문 (바뀌었는지 로그로 구분하는 용도)."""
+    h = hashlib.blake2b(digest_size=8)
+    h.update(phrase_catalog.CATALOG_VERSION.encode("utf-8"))
+    for text in phrases:
+        h.update(b"\0" + text.encode("utf-8"))
+    return h.hexdigest()
+
+
+# ============================================================
+# 합성
+# ============================================================
+
+def prewarm_once(synthesize: Synthesizer,
+                 speaker: str = TTS_DEFAULT_SPEAKER,
+                 speed: int = TTS_DEFAULT_SPEED) -> Dict[str, int]:
+    """
+    캐시에 없는 고정 문구만 합성해서 저장한다. (초당 TTS_PREWARM_MAX_RPS회 제한)
+    """
+    phrases = collect_phrases()
+    fp = fingerprint(phrases)
+    missing = [t for t in phrases if not tts_cache.contains(tts_cache.make_key(t, speaker, speed))]
+
+    with _state_lock:
+        if _status["fingerprint"] not in (None, fp):
+            logger.info(f"TTS prewarm: 고정 문구 변경 감지 ({_status['fingerprint']} → {fp})")
+        _status["fingerprint"] = fp
+        _status["phrases"] = len(phrases)
+
+    interval = 1.0 / TTS_PREWARM_MAX_RPS if TTS_PREWARM_MAX_RPS > 0 else 0.0
+    synthesized = failed = 0
+    next_at = time.monotonic()
+
+    for text in missing:
+        if _stop.is_set():
+            break
+        wait = next_at - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        next_at = time.monotonic() + interval
+
+        try:
+            audio = synthesize(text, speaker, speed)
+        except Exception as e:
+            failed += 1
+            logger.warning(f"TTS prewarm 합성 실패: {text[:30]}... ({e})")
+            continue
+        tts_cache.put(tts_cache.make_key(text, speaker, speed), audio)
+        synthesized += 1
+
+    with _state_lock:
+        _status["synthesized"] = int(_status["synthesized"]) + synthesized
+        _status["failed"] = int(_status["failed"]) + failed
+        _status["last_run_at"] = time.time()
+
+    if missing:
+        logger.info(
+            f"TTS prewarm: 문구 {len(phrases)}개 중 {len(missing)}개 미보유 → "
+            f"합성 {synthesized}, 실패 {failed}"
+        )
+    return {"phrases": len(phrases), "missing": len(missing),
+            "synthesized": synthesized, "failed": failed}
+
+
+def _run(synthesize: Synthesizer) -> None:
+    while not _stop.is_set():
+        try:
+            prewarm_once(synthesize)
+        except Exception as e:
+            logger.warning(f"TTS prewarm 실행 오류: {e}")
+        if TTS_PREWARM_RECHECK_SEC <= 0:
+            break
+        _stop.wait(TTS_PREWARM_RECHECK_SEC)
+
+
+def start(synthesize: Synthesizer) -> bool:
+    """백그라운드 사전 생성 스레드를 시작한다. (이미 돌고 있으면 무시)"""
+    global _thread
+    if not TTS_PREWARM_ENABLED:
+        return False
+    with _state_lock:
+        if _thread is not None and _thread.is_alive():
+            return False
+        _stop.clear()
+        _thread = threading.Thread(target=_run, args=(synthesize,),
+                                   name="tts-prewarm", daemon=True)
+        _thread.start()
+    return True
+
+
+def stop() -> None:
+    _stop.set()
+
+
+def status() -> Dict[str, object]:
+    with _state_lock:
+        return dict(_status)
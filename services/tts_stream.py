@@ -0,0 +1,116 @@
+# services/tts_stream.py
+# -*- coding: utf-8 -*-
+"""
+문장 단위 TTS 파이프라인.
+
+result_tts처럼 여러 문장으로 된 안내문은 CLOVA가 전체를 합성할 때까지 소리가 나지 않는다.
+그래서 문장으로 나눠서
+
+- 문장마다 TTS 캐시(services/tts_cache)를 따로 조회하고, 미스만 CLOVA에 요청
+- 동시에 최대 TTS_SENTENCE_CONCURRENCY개까지 합성
+- 합성이 끝난 순서와 관계없이 "문장 순서대로" MP3를 이어서 전송
+
+첫 소리까지 걸리는 시간이 "짧은 첫 문장 하나 합성 시간"이 된다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from typing import AsyncIterator, List
+
+from fastapi.concurrency import run_in_threadpool
+
+from core.config import TTS_SENTENCE_CONCURRENCY, TTS_SENTENCE_MIN_CHARS
+from services import clova_tts, tts_cache
+
+
+# 문장 끝에서 자름
+# - . ? ! … 뒤에는 공백이 있어야 함 ("3.5km", "1.2.3" 같은 숫자는 자르지 않음)
+# - 중국어/일본어 문장 부호(。？！)는 띄어 쓰지 않으므로 공백 없이도 자름 (닫는 괄호/따옴표는 앞 문장에 포함)
+_SENTENCE_END_RE = re.compile(r"(?<=[.?!…])\s+|[。？！][」』”’）)]*\s*")
+
+
+# ============================================================
+# 문장 분리
+# ============================================================
+
+def split_sentences(text: str, min_chars: int = TTS_SENTENCE_MIN_CHARS) -> List[str]:
+    """
+    안내문을 문장 리스트로 나눈다.
+    min_chars보다 짧은 조각("네.", "감사합니다." 등)은 다음 문장과 합친다.
+    (합칠 때 원문의 띄어쓰기를 그대로 유지 → 공백 없는 CJK 문장에 공백을 끼워 넣지 않음)
+    """
+    text = text or ""
+    pieces: List[str] = []
+    last = 0
+    for m in _SENTENCE_END_RE.finditer(text):
+        pieces.append(text[last:m.end()])
+        last = m.end()
+    pieces.append(text[last:])
+
+    sentences: List[str] = []
+    pending = ""
+    for piece in pieces:
+        pending += piece
+        if len(pending.strip()) >= min_chars:
+            sentences.append(pending)
+            pending = ""
+    if pending.strip():
+        if sentences:
+            sentences[-1] += pending
+        else:
+            sentences.append(pending)
+    return [s.strip() for s in sentences if s.strip()]
+
+
+# ============================================================
+# 합성
+# ============================================================
+
+def _strip_id3(audio: bytes) -> bytes:
+    """
+    MP3 앞의 ID3v2 태그를 떼어낸다.
+    (이어 붙인 두 번째 문장부터 태그가 중간에 끼면 일부 재생기가 끊김)
+    """
+    if len(audio) < 10 or audio[:3] != b"ID3":
+        return audio
+    size = (audio[6] << 21) | (audio[7] << 14) | (audio[8] << 7) | audio[9]
+    return audio[10 + size:]
+
+
+async def fetch_cached(text: str, speaker: str, speed: int) -> bytes:
+    """문장 하나: 캐시에 있으면 그대로, 없으면 CLOVA 합성 후 저장."""
+    key = tts_cache.make_key(text, speaker, speed)
+    audio = await run_in_threadpool(tts_cache.get, key)
+    if audio is None:
+        audio = await clova_tts.synthesize_async(text, speaker, speed)
+        await run_in_threadpool(tts_cache.put, key, audio)
+    return audio
+
+
+async def stream_sentences(sentences: List[str],
+                           speaker: str,
+                           speed: int,
+                           concurrency: int = TTS_SENTENCE_CONCURRENCY) -> AsyncIterator[bytes]:
+    """
+    문장들을 병렬(최대 concurrency개)로 합성하고, 문장 순서대로 MP3 바이트를 내보낸다.
+    중간에 실패하면 ClovaTTSError를 그대로 올리고 남은 작업은 취소한다.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(sentence: str) -> bytes:
+        async with semaphore:
+            return await fetch_cached(sentence, speaker, speed)
+
+    tasks = [asyncio.create_task(run(s)) for s in sentences]
+    try:
+        for i, task in enumerate(tasks):
+            audio = await task
+            yield audio if i == 0 else _strip_id3(audio)
+    finally:
+        # 클라이언트가 끊었거나 오류가 나면 아직 안 끝난 합성은 취소
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
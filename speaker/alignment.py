@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+alignment.py
+
+녹음 전체를 한 번에 전사한 "단어 + 시각" 목록을
+화자 분리(diarization) 구간에 배정하는 모듈입니다.
+
+🎯 역할 요약
+--------------------------------------
+- input :
+    words = [{"start": 0.12, "end": 0.48, "text": "안녕하세요"}, ...]
+    turns = [{"speaker": "SPEAKER_00", "start": 0.0, "end": 3.21}, ...]
+- process:
+    단어마다 시간이 가장 많이 겹치는 구간을 고르고,
+    겹치는 구간이 없으면 단어 중심 시각과 가장 가까운 구간을 고름
+    (단어 수 × 구간 수 겹침 행렬을 NumPy로 한 번에 계산)
+- output:
+    turns와 같은 순서의 구간별 텍스트 리스트 ["...", "", ...]
+    (단어가 하나도 배정되지 않은 구간은 빈 문자열)
+"""
+
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+
+def assign_words_to_turns(words: Sequence[Dict[str, Any]],
+                          turns: Sequence[Dict[str, Any]]) -> np.ndarray:
+    """
+    각 단어가 배정될 구간 인덱스 배열을 반환합니다. (길이 = len(words))
+    """
+    if not words or not turns:
+        return np.empty(0, dtype=np.int64)
+
+    w_start = np.array([float(w["start"]) for w in words])
+    w_end = np.array([float(w["end"]) for w in words])
+    t_start = np.array([float(t["start"]) for t in turns])
+    t_end = np.array([float(t["end"]) for t in turns])
+
+    # (단어, 구간) 겹침 길이
+    overlap = (
+        np.minimum(w_end[:, None], t_end[None, :])
+        - np.maximum(w_start[:, None], t_start[None, :])
+    ).clip(min=0.0)
+    best = overlap.argmax(axis=1)
+
+    # 어느 구간과도 겹치지 않는 단어 → 중심 시각이 가장 가까운 구간
+    orphan = overlap.max(axis=1) <= 0.0
+    if orphan.any():
+        mid = ((w_start + w_end) / 2.0)[orphan]
+        dist = np.maximum(t_start[None, :] - mid[:, None], mid[:, None] - t_end[None, :])
+        best[orphan] = dist.argmin(axis=1)
+
+    return best
+
+
+def align_words_to_turns(words: Sequence[Dict[str, Any]],
+                         turns: Sequence[Dict[str, Any]]) -> List[str]:
+    """
+    단어들을 화자 구간에 배정하고 구간별 텍스트를 만듭니다.
+
+    :param words: [{"start", "end", "text"}, ...] (시간 순)
+    :param turns: [{"speaker", "start", "end"}, ...]
+    :return: turns와 같은 순서의 텍스트 리스트
+    """
+    texts: List[List[str]] = [[] for _ in turns]
+    for word, idx in zip(words, assign_words_to_turns(words, turns).tolist()):
+        texts[idx].append(str(word["text"]).strip())
+    return [" ".join(t for t in parts if t) for parts in texts]
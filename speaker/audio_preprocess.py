@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+audio_preprocess.py
+
+브라우저에서 올라온 녹음(webm 등)을 STT(OpenAI)로 보내기 전에
+한 번 가볍게 다듬어서 업로드 바이트와 전사 시간을 줄이는 모듈입니다.
+
+🎯 역할 요약
+--------------------------------------
+1. 한 번만 디코딩 (pydub + ffmpeg)
+2. 16kHz / mono / 16bit 로 변환
+3. speaker.vad.detect_voiced_range(NumPy 벡터화)로 앞/뒤 무음 제거
+4. 작은 포맷(기본 ogg/opus 24kbps)으로 재인코딩
+5. 단계별 바이트/시간 통계를 함께 반환
+6. 오디오가 STT_MAX_AUDIO_SECONDS보다 길면 AudioTooLongError
+   (ffmpeg에 -t를 넘겨 "최대 길이 + 1초"까지만 디코딩하므로, 작은 저비트레이트
+   파일이 수 GB PCM으로 풀리지 않음. 전처리를 꺼도 길이 검사는 함)
+
+- 입력/출력 모두 파일 객체입니다. (업로드 임시 파일을 bytes로 복사하지 않음)
+- 재인코딩 결과가 원본보다 크면 원본을 그대로 사용합니다.
+- ffmpeg가 없거나 디코딩에 실패해도 예외를 던지지 않고 원본을 돌려줍니다.
+- FastAPI 이벤트 루프를 막지 않도록 preprocess_for_stt_async는
+  전용 워커 풀(AUDIO_PREPROCESS_WORKERS)에서 실행됩니다.
+"""
+
+import asyncio
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+
+import numpy as np
+from pydub import AudioSegment
+from pydub.utils import mediainfo_json
+
+from core.config import (
+    AUDIO_PREPROCESS_ENABLED,
+    AUDIO_PREPROCESS_WORKERS,
+    AUDIO_PREPROCESS_FORMAT,
+    AUDIO_PREPROCESS_CODEC,
+    AUDIO_PREPROCESS_BITRATE,
+    STT_MAX_AUDIO_SECONDS,
+)
+from speaker.vad import detect_voiced_range
+
+# STT에 충분한 목표 포맷
+TARGET_SAMPLE_RATE = 16000
+TARGET_CHANNELS = 1
+TARGET_SAMPLE_WIDTH = 2  # 16bit
+
+# 전처리 전용 워커 풀 (ffmpeg 디코딩/인코딩이 CPU를 쓰므로 개수 제한)
+_executor = ThreadPoolExecutor(
+    max_workers=max(1, AUDIO_PREPROCESS_WORKERS),
+    thread_name_prefix="audio-preprocess",
+)
+
+
+class AudioTooLongError(ValueError):
+    """오디오가 STT_MAX_AUDIO_SECONDS보다 긴 경우."""
+
+
+def _elapsed_ms(t0: float) -> float:
+    return round((time.perf_counter() - t0) * 1000, 1)
+
+
+def _size_of(file_obj: BinaryIO) -> int:
+    file_obj.seek(0, os.SEEK_END)
+    size = file_obj.tell()
+    file_obj.seek(0)
+    return size
+
+
+def _too_long(seconds: Optional[float] = None) -> AudioTooLongError:
+    if seconds is None:
+        return AudioTooLongError(f"오디오 길이가 최대 {STT_MAX_AUDIO_SECONDS:.0f}초를 넘습니다.")
+    return AudioTooLongError(
+        f"오디오 길이 {seconds:.1f}초가 최대 {STT_MAX_AUDIO_SECONDS:.0f}초를 넘습니다."
+    )
+
+
+def _decode_capped(audio_file: BinaryIO, ext: Optional[str]) -> AudioSegment:
+    """
+    STT_MAX_AUDIO_SECONDS + 1초까지만 디코딩합니다. (ffmpeg -t)
+    잘린 결과가 최대 길이를 넘으면 원본도 넘는 것이므로 AudioTooLongError.
+    """
+    if not STT_MAX_AUDIO_SECONDS:
+        return AudioSegment.from_file(audio_file, format=ext)
+
+    audio = AudioSegment.from_file(audio_file, format=ext, duration=STT_MAX_AUDIO_SECONDS + 1)
+    if len(audio) > STT_MAX_AUDIO_SECONDS * 1000:
+        raise _too_long()
+    return audio
+
+
+def _probe_duration_sec(audio_file: BinaryIO) -> Optional[float]:
+    """ffprobe가 알려주는 컨테이너 길이(초). 모르면 None."""
+    try:
+        info = mediainfo_json(audio_file)
+        return float(info["format"]["duration"])
+    except Exception:
+        return None
+    finally:
+        audio_file.seek(0)
+
+
+def check_duration(audio_file: BinaryIO, file_name: str = "recording.webm") -> None:
+    """
+    전처리 없이 원본을 STT로 보낼 때의 길이 검사.
+
+    ffprobe로 길이를 먼저 보고, 길이 정보가 없는 녹음(MediaRecorder webm 등)은
+    제한 길이까지만 디코딩해서 확인합니다. ffmpeg가 없는 등 판단할 수 없으면 통과시킵니다.
+
+    :raises AudioTooLongError: 오디오 길이가 STT_MAX_AUDIO_SECONDS 초과
+    """
+    if not STT_MAX_AUDIO_SECONDS:
+        return
+
+    seconds = _probe_duration_sec(audio_file)
+    if seconds is not None:
+        if seconds > STT_MAX_AUDIO_SECONDS:
+            raise _too_long(seconds)
+        return
+
+    ext = os.path.splitext(file_name or "")[1].lstrip(".").lower() or None
+    try:
+        _decode_capped(audio_file, ext)
+    except AudioTooLongError:
+        raise
+    except Exception as e:
+        print(f"[WARN] 오디오 길이 확인 실패, 검사 생략: {e}")
+    finally:
+        audio_file.seek(0)
+
+
+def preprocess_for_stt(audio_file: BinaryIO,
+                       file_name: str = "recording.webm") -> Tuple[BinaryIO, str, Dict[str, Any]]:
+    """
+    STT 업로드용으로 오디오를 정규화합니다.
+
+    :param audio_file: 업로드된 원본 오디오 파일 객체 (seek 가능)
+    :param file_name: 원본 파일명 (확장자로 디코딩 포맷 추측)
+    :return: (전송할 파일 객체, 전송용 파일명, 단계별 통계 dict)
+             전처리를 건너뛰면 audio_file을 그대로 돌려줍니다.
+    :raises AudioTooLongError: 오디오 길이가 STT_MAX_AUDIO_SECONDS 초과
+    """
+    bytes_in = _size_of(audio_file)
+    stats: Dict[str, Any] = {
+        "applied": False,
+        "bytes_in": bytes_in,
+        "bytes_out": bytes_in,
+    }
+
+    if not bytes_in:
+        stats["reason"] = "empty"
+        return audio_file, file_name, stats
+
+    if not AUDIO_PREPROCESS_ENABLED:
+        check_duration(audio_file, file_name)
+        stats["reason"] = "disabled"
+        return audio_file, file_name, stats
+
+    t_total = time.perf_counter()
+    ext = os.path.splitext(file_name or "")[1].lstrip(".").lower() or None
+
+    try:
+        # 1) 디코딩 (한 번만, 최대 길이 + 1초까지만)
+        t0 = time.perf_counter()
+        audio = _decode_capped(audio_file, ext)
+        stats["decode_ms"] = _elapsed_ms(t0)
+        stats["duration_in_ms"] = len(audio)
+        stats["channels_in"] = audio.channels
+        stats["sample_rate_in"] = audio.frame_rate
+
+        # 2) 16kHz mono 16bit
+        t0 = time.perf_counter()
+        audio = (
+            audio.set_channels(TARGET_CHANNELS)
+            .set_frame_rate(TARGET_SAMPLE_RATE)
+            .set_sample_width(TARGET_SAMPLE_WIDTH)
+        )
+        stats["normalize_ms"] = _elapsed_ms(t0)
+
+        # 3) 앞/뒤 무음 제거 (프레임 에너지 NumPy 일괄 계산)
+        t0 = time.perf_counter()
+        samples = np.frombuffer(audio.raw_data, dtype=np.int16)
+        voiced = detect_voiced_range(samples, sample_rate=TARGET_SAMPLE_RATE)
+        if voiced is not None:
+            start_ms, end_ms = voiced
+            audio = audio[start_ms:end_ms]
+        stats["trim_ms"] = _elapsed_ms(t0)
+        stats["duration_out_ms"] = len(audio)
+
+        # 4) 재인코딩
+        t0 = time.perf_counter()
+        buf = io.BytesIO()
+        audio.export(
+            buf,
+            format=AUDIO_PREPROCESS_FORMAT,
+            codec=AUDIO_PREPROCESS_CODEC or None,
+            bitrate=AUDIO_PREPROCESS_BITRATE or None,
+        )
+        encoded = buf.getvalue()
+        stats["encode_ms"] = _elapsed_ms(t0)
+
+    except AudioTooLongError:
+        raise
+    except Exception as e:
+        stats["reason"] = f"error: {e}"
+        stats["total_ms"] = _elapsed_ms(t_total)
+        print(f"[WARN] 오디오 전처리 실패, 원본 그대로 사용: {e}")
+        audio_file.seek(0)
+        return audio_file, file_name, stats
+
+    stats["total_ms"] = _elapsed_ms(t_total)
+
+    # 재인코딩이 오히려 크면 원본 유지
+    if not encoded or len(encoded) >= bytes_in:
+        stats["reason"] = "not_smaller"
+        audio_file.seek(0)
+        return audio_file, file_name, stats
+
+    stats["applied"] = True
+    stats["bytes_out"] = len(encoded)
+    stats["bytes_saved"] = bytes_in - len(encoded)
+    stats["ms_trimmed"] = stats["duration_in_ms"] - stats["duration_out_ms"]
+
+    out_name = f"{os.path.splitext(file_name or 'recording')[0]}.{AUDIO_PREPROCESS_FORMAT}"
+    return io.BytesIO(encoded), out_name, stats
+
+
+async def preprocess_for_stt_async(audio_file: BinaryIO,
+                                   file_name: str = "recording.webm") -> Tuple[BinaryIO, str, Dict[str, Any]]:
+    """
+    preprocess_for_stt를 전처리 워커 풀에서 실행합니다. (이벤트 루프 비차단)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, preprocess_for_stt, audio_file, file_name)
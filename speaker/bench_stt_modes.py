@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+bench_stt_modes.py
+
+SpeakerPipeline의 두 가지 STT 방식을 같은 녹음으로 비교하는 간단한 벤치마크입니다.
+
+- segment : 화자 분리 → 구간마다 STT (구간 수 N만큼 호출)
+- aligned : 화자 분리와 동시에 녹음 전체 1회 STT(단어 시각) → 단어를 구간에 배정
+
+민원 엔진(LLM)은 호출하지 않고 "화자 분리 + STT" 단계만 측정합니다.
+공정한 비교를 위해 STT / diarization 캐시는 끄고 실행합니다.
+
+사용 예:
+    python -m speaker.bench_stt_modes recording.wav --repeat 3
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+# 캐시가 켜져 있으면 두 번째 실행부터 측정이 무의미하므로 import 전에 끔
+os.environ["STT_CACHE_ENABLED"] = "false"
+os.environ["DIARIZATION_CACHE_ENABLED"] = "false"
+
+from speaker.pcm_audio import load_pcm
+from speaker.session_state import SessionState
+from speaker.speaker import SpeakerPipeline
+from speaker.stt_backends import get_backend
+
+
+def _count_backend_calls():
+    """현재 STT 백엔드의 호출 횟수를 세도록 감쌉니다."""
+    backend = get_backend()
+    counter = {"calls": 0}
+
+    for name in ("transcribe", "transcribe_timestamped"):
+        original = getattr(backend, name)
+
+        def wrapped(*args, _original=original, **kwargs):
+            counter["calls"] += 1
+            return _original(*args, **kwargs)
+
+        setattr(backend, name, wrapped)
+
+    return backend, counter
+
+
+def run_once(pipeline: SpeakerPipeline, pcm, language: str):
+    t0 = time.perf_counter()
+    segments, futures = pipeline._start_transcription(pcm, language)
+    texts = [f.result() for f in futures]
+    elapsed = time.perf_counter() - t0
+    return elapsed, segments, texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="segment vs aligned STT 벤치마크")
+    parser.add_argument("audio_path")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--language", default="ko")
+    args = parser.parse_args()
+
+    pcm = load_pcm(args.audio_path)
+    backend, counter = _count_backend_calls()
+    print(f"[INFO] 파일: {args.audio_path} ({pcm.duration:.1f}초), STT 백엔드: {backend.model_id}")
+
+    state = SessionState()
+    pipeline = SpeakerPipeline(state=state)
+    print("[INFO] 화자 분리 모델 로드 중...")
+    pipeline.warm_up()
+
+    for mode in ("segment", "aligned"):
+        pipeline.stt_mode = mode
+        times = []
+        calls_before = counter["calls"]
+        segments, texts = [], []
+
+        for _ in range(max(1, args.repeat)):
+            elapsed, segments, texts = run_once(pipeline, pcm, args.language)
+            times.append(elapsed)
+
+        calls = (counter["calls"] - calls_before) / max(1, args.repeat)
+        filled = sum(1 for t in texts if t.strip())
+        print(f"\n=== {mode} ===")
+        print(f"- 소요 시간: 평균 {statistics.mean(times):.2f}s / 최소 {min(times):.2f}s")
+        print(f"- STT 호출 수(회당): {calls:.0f}")
+        print(f"- 구간 수: {len(segments)} (텍스트 있음 {filled})")
+        print(f"- 전체 글자 수: {sum(len(t) for t in texts)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,31 +9,42 @@ diarization_pyannote.py
 --------------------------------------
 1. .env 에서 HUGGINGFACE_TOKEN (pyannote용) 읽기
 2. pyannote/speaker-diarization 파이프라인 로드
-3. 오디오 파일 경로를 입력받아,
+   - pyannote.audio import와 모델 로드는 처음 쓸 때 한 번만 (프로세스 전역 공유)
+   - 서버 시작 시 미리 올려두려면 warm_up() 호출
+3. 오디오 파일 경로(diarize_file) 또는 디코딩된 PCM(diarize_pcm / diarize_waveform)을 입력받아,
    시간 구간별 화자 라벨 목록을 반환
    [
      {"speaker": "SPEAKER_00", "start": 0.00, "end": 3.21},
      {"speaker": "SPEAKER_01", "start": 3.21, "end": 7.80},
      ...
    ]
+4. 같은 오디오 + 모델의 결과는 캐시(core/file_cache: 메모리 LRU + 디스크 JSON)에서 재사용
+5. STT 전 구간 정리 (merge_segments)
+   - 같은 화자의 가까운 구간 합치기 / 짧은 조각 버리기 / 너무 긴 구간 나누기
 
 👉 이 모듈은 '누가 언제 말했는지'만 담당합니다.
    - "무슨 말을 했는지" → stt_whisper.py (STT)
    - "그 말이 어떤 민원인지" → brain/minwon_engine.py
 """
 
+import hashlib
 import os
-from typing import List, Dict, Any
+import threading
+from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
-from pyannote.audio import Pipeline
 
-# pyannote.audio는 별도 설치가 필요합니다.
-# pip install pyannote.audio torch --extra-index-url https://download.pytorch.org/whl/cu118
-try:
-    from pyannote.audio import Pipeline
-except ImportError:
-    Pipeline = None  # 타입만 맞춰두고, 실행 시 체크
+from core.config import (
+    SPEAKER_MERGE_GAP_SEC,
+    SPEAKER_MIN_SEGMENT_SEC,
+    SPEAKER_MAX_SEGMENT_SEC,
+    DIARIZATION_MODEL,
+    DIARIZATION_CACHE_ENABLED,
+    DIARIZATION_CACHE_DIR,
+    DIARIZATION_CACHE_MAX_ENTRIES,
+    DIARIZATION_CACHE_MAX_BYTES,
+)
+from core.file_cache import FileCache, decode_json, encode_json
 
 
 # -------------------------------------------------------------------
@@ -46,23 +57,38 @@ load_dotenv()
 # - https://huggingface.co/settings/tokens 에서 발급
 HF_TOKEN = os.getenv("HUGGINGFACE_TOKEN") or os.getenv("PYANNOTE_TOKEN")
 
+# 해시 계산 시 한 번에 읽을 크기
+_READ_CHUNK = 1024 * 1024
 
-class PyannoteDiarizer:
+
+# -------------------------------------------------------------------
+# 파이프라인 싱글턴 (지연 로드)
+# -------------------------------------------------------------------
+
+_pipelines: Dict[str, Any] = {}
+_pipeline_lock = threading.Lock()
+
+
+def get_pipeline(model_name: str = DIARIZATION_MODEL, hf_token: Optional[str] = None):
     """
-    pyannote.audio 기반 화자 분리 래퍼 클래스.
+    pyannote 파이프라인을 프로세스 전역에서 한 번만 로드해서 반환합니다.
 
-    한 번 인스턴스를 만들면 내부에서 파이프라인을 로드해두고,
-    여러 오디오 파일에 대해 반복 사용 가능합니다.
+    - pyannote.audio(및 torch) import도 이때 처음 일어납니다.
     """
+    pipeline = _pipelines.get(model_name)
+    if pipeline is not None:
+        return pipeline
 
-    def __init__(self,
-                 hf_token: str | None = None,
-                 model_name: str = "pyannote/speaker-diarization"):
-        """
-        :param hf_token: Hugging Face 토큰 (없으면 .env에서 HUGGINGFACE_TOKEN 사용)
-        :param model_name: 사용할 diarization 모델 이름
-        """
-        if Pipeline is None:
+    with _pipeline_lock:
+        pipeline = _pipelines.get(model_name)
+        if pipeline is not None:
+            return pipeline
+
+        # pyannote.audio는 별도 설치가 필요합니다.
+        # pip install pyannote.audio torch --extra-index-url https://download.pytorch.org/whl/cu118
+        try:
+            from pyannote.audio import Pipeline
+        except ImportError:
             raise ImportError(
                 "pyannote.audio가 설치되어 있지 않습니다. "
                 "pip install pyannote.audio 로 설치해 주세요."
@@ -75,12 +101,168 @@ class PyannoteDiarizer:
                 "Hugging Face 토큰을 발급받아 .env에 추가해 주세요."
             )
 
-        # pyannote 파이프라인 로드
         # (처음 한 번 로드할 때 시간이 다소 걸릴 수 있음)
-        self.pipeline = Pipeline.from_pretrained(
-            model_name,
-            use_auth_token=token,
-        )
+        pipeline = Pipeline.from_pretrained(model_name, use_auth_token=token)
+        _pipelines[model_name] = pipeline
+        return pipeline
+
+
+def warm_up(model_name: str = DIARIZATION_MODEL, hf_token: Optional[str] = None) -> bool:
+    """
+    서버 시작 시 등에 미리 파이프라인을 로드해 둡니다.
+    (실패해도 예외 대신 False 반환, 실제 요청 때 다시 시도)
+    """
+    try:
+        get_pipeline(model_name, hf_token)
+        return True
+    except Exception as e:
+        print(f"[WARN] pyannote 파이프라인 warm-up 실패: {e}")
+        return False
+
+
+# -------------------------------------------------------------------
+# diarization 결과 캐시 (오디오 해시 + 모델)
+# -------------------------------------------------------------------
+
+_cache = FileCache(
+    "diarization",
+    DIARIZATION_CACHE_DIR,
+    ".json",
+    max_bytes=DIARIZATION_CACHE_MAX_BYTES,
+    memory_entries=DIARIZATION_CACHE_MAX_ENTRIES,
+    encode=encode_json,
+    decode=decode_json,
+    enabled=DIARIZATION_CACHE_ENABLED,
+)
+
+
+def _file_key(path: str, model_name: str) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"file\0{model_name}\0".encode("utf-8"))
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(_READ_CHUNK)
+            if not chunk:
+                break
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _pcm_key(samples, sample_rate: int, model_name: str) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"pcm\0{model_name}\0{sample_rate}\0".encode("utf-8"))
+    h.update(memoryview(samples).cast("B"))
+    return h.hexdigest()
+
+
+def _cache_get(key: str) -> Optional[List[Dict[str, Any]]]:
+    data = _cache.get(key)
+    segments = data.get("segments") if isinstance(data, dict) else None
+    if segments is None:
+        return None
+    return [dict(seg) for seg in segments]
+
+
+def _cache_put(key: str, segments: List[Dict[str, Any]], model_name: str) -> None:
+    # 빈 결과(오류/무음)는 저장하지 않음
+    if not segments:
+        return
+    _cache.put(key, {"model": model_name, "segments": [dict(seg) for seg in segments]})
+
+
+# -------------------------------------------------------------------
+# STT 전 구간 정리
+# -------------------------------------------------------------------
+
+def _merge_adjacent(segments: List[Dict[str, Any]],
+                    max_gap: float,
+                    max_duration: float) -> List[Dict[str, Any]]:
+    merged: List[Dict[str, Any]] = []
+    for seg in segments:
+        start, end = float(seg["start"]), float(seg["end"])
+        if merged:
+            last = merged[-1]
+            if (last["speaker"] == seg["speaker"]
+                    and start - last["end"] <= max_gap
+                    and (not max_duration or max(end, last["end"]) - last["start"] <= max_duration)):
+                last["end"] = max(last["end"], end)
+                continue
+        merged.append({**seg, "start": start, "end": end})
+    return merged
+
+
+def merge_segments(segments: List[Dict[str, Any]],
+                   max_gap: float = SPEAKER_MERGE_GAP_SEC,
+                   min_duration: float = SPEAKER_MIN_SEGMENT_SEC,
+                   max_duration: float = SPEAKER_MAX_SEGMENT_SEC) -> List[Dict[str, Any]]:
+    """
+    pyannote가 잘게 쪼갠 구간을 STT/엔진 호출 단위로 정리합니다.
+
+    1) 시간순으로 보면서 직전 구간과 화자가 같고 간격이 max_gap 이하이면 합침
+       (합친 길이가 max_duration을 넘으면 합치지 않음)
+    2) min_duration보다 짧은 조각은 버리고, 그 사이로 다시 붙게 된 같은 화자 구간을 한 번 더 합침
+       (숨소리/맞장구 등)
+    3) 그래도 max_duration보다 긴 구간은 같은 길이로 나눔
+
+    :return: 정리된 구간 리스트 (원본은 수정하지 않음)
+    """
+    ordered = sorted(segments, key=lambda s: (float(s["start"]), float(s["end"])))
+
+    merged = _merge_adjacent(ordered, max_gap, max_duration)
+    kept = [seg for seg in merged if seg["end"] - seg["start"] >= min_duration]
+    kept = _merge_adjacent(kept, max_gap, max_duration)
+
+    results: List[Dict[str, Any]] = []
+    for seg in kept:
+        length = seg["end"] - seg["start"]
+        if not max_duration or length <= max_duration:
+            results.append(seg)
+            continue
+        pieces = int(-(-length // max_duration))
+        step = length / pieces
+        for i in range(pieces):
+            results.append({
+                **seg,
+                "start": seg["start"] + i * step,
+                "end": seg["end"] if i == pieces - 1 else seg["start"] + (i + 1) * step,
+            })
+
+    print(
+        f"[INFO] 화자 구간 정리: 원본 {len(segments)} → 병합 {len(merged)}"
+        f" → 짧은 조각 제거·재병합 {len(kept)} → 최종 {len(results)}"
+    )
+    return results
+
+
+# -------------------------------------------------------------------
+# 화자 분리 래퍼
+# -------------------------------------------------------------------
+
+class PyannoteDiarizer:
+    """
+    pyannote.audio 기반 화자 분리 래퍼 클래스.
+
+    인스턴스 생성은 가볍고, 파이프라인은 처음 diarization을 할 때
+    프로세스 전역 싱글턴(get_pipeline)으로 로드되어 모든 인스턴스가 공유합니다.
+    """
+
+    def __init__(self,
+                 hf_token: str | None = None,
+                 model_name: str = DIARIZATION_MODEL):
+        """
+        :param hf_token: Hugging Face 토큰 (없으면 .env에서 HUGGINGFACE_TOKEN 사용)
+        :param model_name: 사용할 diarization 모델 이름
+        """
+        self.hf_token = hf_token
+        self.model_name = model_name
+
+    @property
+    def pipeline(self):
+        return get_pipeline(self.model_name, self.hf_token)
+
+    def warm_up(self) -> bool:
+        """이 인스턴스의 모델을 미리 로드합니다."""
+        return warm_up(self.model_name, self.hf_token)
 
     # -------------------------------------------------------------
     # 공용 메인 함수
@@ -101,6 +283,11 @@ class PyannoteDiarizer:
             print(f"[WARN] diarize_file: 파일을 찾을 수 없습니다: {path}")
             return []
 
+        key = _file_key(path, self.model_name)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
         # pyannote 파이프라인 실행
         try:
             diarization = self.pipeline(path)
@@ -108,6 +295,42 @@ class PyannoteDiarizer:
             print(f"[WARN] pyannote diarization 호출 중 오류 발생: {e}")
             return []
 
+        segments = self._to_segments(diarization)
+        _cache_put(key, segments, self.model_name)
+        return segments
+
+    def diarize_pcm(self, pcm) -> List[Dict[str, Any]]:
+        """
+        speaker.pcm_audio.PcmAudio 버퍼로 화자 분리를 수행합니다.
+        (캐시에 있으면 float 변환/모델 실행 없이 바로 반환)
+        """
+        key = _pcm_key(pcm.samples, pcm.sample_rate, self.model_name)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+        segments = self.diarize_waveform(pcm.as_waveform())
+        _cache_put(key, segments, self.model_name)
+        return segments
+
+    def diarize_waveform(self, audio_input: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        이미 디코딩된 오디오로 화자 분리를 수행합니다. (파일 재디코딩 없음, 캐시 없음)
+
+        :param audio_input: {"waveform": (channel, time) 텐서, "sample_rate": int}
+                            (speaker.pcm_audio.PcmAudio.as_waveform() 결과)
+        :return: diarize_file과 같은 형식의 구간 리스트
+        """
+        try:
+            diarization = self.pipeline(audio_input)
+        except Exception as e:
+            print(f"[WARN] pyannote diarization 호출 중 오류 발생: {e}")
+            return []
+
+        return self._to_segments(diarization)
+
+    @staticmethod
+    def _to_segments(diarization) -> List[Dict[str, Any]]:
         segments: List[Dict[str, Any]] = []
 
         # diarization 결과는 "timeline" 형식으로 나옴
@@ -134,10 +357,9 @@ if __name__ == "__main__":
     print("pyannote.audio 화자 분리 테스트 모드입니다.")
     print("오디오 파일 경로를 입력하면, 화자별 구간을 출력합니다. (종료: 빈 줄)")
 
-    try:
-        diarizer = PyannoteDiarizer()
-    except Exception as e:
-        print(f"[ERROR] PyannoteDiarizer 초기화 실패: {e}")
+    diarizer = PyannoteDiarizer()
+    if not diarizer.warm_up():
+        print("[ERROR] PyannoteDiarizer 초기화 실패")
         raise SystemExit(1)
 
     while True:
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+pcm_audio.py
+
+녹음 파일을 "한 번만" 디코딩해서 NumPy PCM 버퍼로 들고 다니기 위한 모듈입니다.
+
+🎯 역할 요약
+--------------------------------------
+1. load_pcm(path) : pydub(ffmpeg)로 한 번 디코딩 → 16kHz / mono / int16 NumPy 배열
+2. PcmAudio.slice(start, end) : 복사 없는 NumPy 뷰로 구간 자르기
+3. PcmAudio.wav_bytes(start, end) : 뷰를 바로 WAV(STT 전송용)로 감싸기
+4. PcmAudio.as_waveform() : pyannote에 파일 경로 대신 넘길 {"waveform", "sample_rate"} 입력
+
+👉 speaker.SpeakerPipeline은 이 버퍼 하나로
+   화자 분리(pyannote)와 구간 STT를 모두 처리합니다.
+   (파일을 두 번 디코딩하거나, 구간마다 AudioSegment.export를 하지 않음)
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict
+
+import numpy as np
+from pydub import AudioSegment
+
+from speaker.stt_whisper import pcm16_to_wav_bytes
+
+# 화자 분리 / STT 모두에 충분한 공통 포맷
+PCM_SAMPLE_RATE = 16000
+
+
+@dataclass
+class PcmAudio:
+    """디코딩된 mono int16 PCM 버퍼."""
+
+    samples: np.ndarray
+    sample_rate: int = PCM_SAMPLE_RATE
+
+    @property
+    def duration(self) -> float:
+        """전체 길이(초)."""
+        return len(self.samples) / float(self.sample_rate)
+
+    def slice(self, start_sec: float, end_sec: float) -> np.ndarray:
+        """[start_sec, end_sec] 구간을 복사 없이 NumPy 뷰로 반환합니다."""
+        n = len(self.samples)
+        start = min(max(int(round(start_sec * self.sample_rate)), 0), n)
+        end = min(max(int(round(end_sec * self.sample_rate)), start), n)
+        return self.samples[start:end]
+
+    def wav_bytes(self, start_sec: float, end_sec: float) -> bytes:
+        """구간 뷰를 그대로 WAV 컨테이너로 감싸서 반환합니다. (STT 전송용)"""
+        view = self.slice(start_sec, end_sec)
+        return pcm16_to_wav_bytes(memoryview(view), sample_rate=self.sample_rate, channels=1)
+
+    def as_waveform(self) -> Dict[str, Any]:
+        """
+        pyannote Pipeline에 파일 경로 대신 넘길 입력을 만듭니다.
+        (torch는 pyannote 설치 시 함께 설치되므로 여기서만 import)
+        """
+        import torch
+
+        waveform = torch.from_numpy(self.samples.astype(np.float32) / 32768.0).unsqueeze(0)
+        return {"waveform": waveform, "sample_rate": self.sample_rate}
+
+
+def load_pcm(path: str, sample_rate: int = PCM_SAMPLE_RATE) -> PcmAudio:
+    """
+    오디오 파일을 한 번 디코딩해서 mono int16 PCM 버퍼로 반환합니다.
+
+    :param path: 오디오 파일 경로 (.wav, .mp3, .m4a, .webm 등 ffmpeg 지원 포맷)
+    :param sample_rate: 변환할 샘플레이트 (기본 16kHz)
+    :raises Exception: 디코딩 실패 시 (호출 측에서 처리)
+    """
+    audio = (
+        AudioSegment.from_file(path)
+        .set_channels(1)
+        .set_frame_rate(sample_rate)
+        .set_sample_width(2)
+    )
+    # raw_data(bytes)를 그대로 감싸는 읽기 전용 뷰 (추가 복사 없음)
+    samples = np.frombuffer(audio.raw_data, dtype=np.int16)
+    return PcmAudio(samples=samples, sample_rate=sample_rate)
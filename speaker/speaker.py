@@ -6,6 +6,11 @@ speaker.py
 
 1) pyannote.audio 로 화자 구분 (diarization)
 2) 각 화자 구간별로 오디오를 잘라서 STT(Whisper) 수행
+   - 구간 STT는 stt_whisper.transcribe_batch로 한 번에 넘김
+     (기본 백엔드는 공용 워커 풀(SPEAKER_STT_WORKERS)에서 동시에 요청하고
+      초당 요청 수(SPEAKER_STT_MAX_RPS)를 제한, local은 로드한 모델 하나로 처리)
+   - stt_mode="aligned" 이면 녹음 전체를 단어 시각과 함께 1회 전사하고
+     (화자 분리와 동시에 실행) 단어를 화자 구간에 배정 (speaker/alignment.py)
 3) minwon_engine 텍스트 엔진에 전달하여 민원 분류/요약 수행
 4) SessionState 에 화자별 상태를 갱신
 
@@ -15,7 +20,7 @@ speaker.py
 --------------------------------------
 - input : audio_path (녹음 파일), session_id
 - process:
-    diarization → segment 단위 STT → 민원 엔진 호출
+    diarization → segment 단위 STT(병렬) → 민원 엔진 호출(타임스탬프 순서대로)
 - output:
     [
       {
@@ -34,19 +39,28 @@ speaker.py
 """
 
 import io
-from typing import List, Dict, Any
-
-# 오디오 자르기를 위한 라이브러리
-# pip install pydub
-# 그리고 ffmpeg 가 시스템에 설치되어 있어야 합니다.
-from pydub import AudioSegment
-
-from speaker.diarization_pyannote import PyannoteDiarizer
-from speaker.stt_whisper import transcribe_bytes
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple
+
+from core.config import SPEAKER_STT_MODE
+from speaker.alignment import align_words_to_turns
+from speaker.diarization_pyannote import PyannoteDiarizer, merge_segments
+from speaker.pcm_audio import PcmAudio, load_pcm
+from speaker.stt_backends import stt_limiter
+from speaker.stt_whisper import transcribe_batch, transcribe_timestamped
 from speaker.session_state import SessionState
 from brain.minwon_engine import run_pipeline_once
 
 
+# ----------------------------------------------------------------------
+# 화자 분리 전용 워커
+# ----------------------------------------------------------------------
+
+# aligned 모드에서 STT와 동시에 돌릴 화자 분리 전용 워커
+# (모델 하나를 공유하므로 한 번에 하나씩)
+_diarization_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="speaker-diarize")
+
+
 class SpeakerPipeline:
     """
     하나의 녹음 파일을 기준으로
@@ -58,37 +72,74 @@ class SpeakerPipeline:
 
     def __init__(self,
                  state: SessionState,
-                 diarizer: PyannoteDiarizer | None = None):
+                 diarizer: PyannoteDiarizer | None = None,
+                 stt_mode: str = SPEAKER_STT_MODE):
         """
         :param state: SessionState 인스턴스 (세션/화자 상태 관리)
         :param diarizer: PyannoteDiarizer 인스턴스 (없으면 내부에서 생성)
+        :param stt_mode: "segment"(구간별 STT) 또는 "aligned"(전체 1회 STT + 단어 정렬)
         """
         self.state = state
+        self.stt_mode = stt_mode
+        # 생성은 가볍고, pyannote 모델은 처음 diarization 때(또는 warm_up) 로드
         self.diarizer = diarizer or PyannoteDiarizer()
 
+    def warm_up(self) -> bool:
+        """서버 시작 시 호출하면 첫 요청 전에 화자 분리 모델을 미리 로드합니다."""
+        return self.diarizer.warm_up()
+
     # ------------------------------------------------------------------
-    # 내부 유틸: 오디오 구간 자르기
+    # 내부: 화자 분리 + STT (모드별)
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _slice_audio(audio: AudioSegment,
-                     start_sec: float,
-                     end_sec: float) -> bytes:
+    def _segment_stt(self,
+                     pcm: PcmAudio,
+                     segments: List[Dict[str, Any]],
+                     language: str) -> List[str]:
+        """구간별 STT를 transcribe_batch로 한 번에 요청합니다. (결과는 구간 순서대로)"""
+        items = [
+            (
+                io.BytesIO(pcm.wav_bytes(float(seg["start"]), float(seg["end"]))),
+                language,
+                "segment.wav",
+            )
+            for seg in segments
+        ]
+        return transcribe_batch(items)
+
+    def _start_transcription(self,
+                             pcm: PcmAudio,
+                             language: str) -> Tuple[List[Dict[str, Any]], List[str]]:
         """
-        AudioSegment 객체에서 [start_sec, end_sec] 구간을 잘라
-        WAV 포맷의 bytes 로 반환합니다.
+        화자 분리 + STT를 수행하고 (시간순 구간 리스트, 구간별 텍스트 리스트)를 반환합니다.
+        화자 분리 결과는 merge_segments로 정리한 뒤 사용합니다. (STT/엔진 호출 수 감소)
 
-        Whisper STT에 전달하기 위해 BytesIO에 export하는 용도입니다.
+        - segment : 화자 분리 후 구간들을 transcribe_batch로 한 번에 STT (N개 항목)
+        - aligned : 화자 분리(워커)와 전체 1회 STT(현재 스레드)를 동시에 실행 후
+                    단어를 구간에 배정. 단어 시각을 못 얻으면 segment 방식으로 대체
         """
-        start_ms = int(start_sec * 1000)
-        end_ms = int(end_sec * 1000)
-        segment = audio[start_ms:end_ms]
+        if self.stt_mode != "aligned":
+            segments = merge_segments(self.diarizer.diarize_pcm(pcm))
+            return segments, self._segment_stt(pcm, segments, language)
+
+        diar_future = _diarization_executor.submit(self.diarizer.diarize_pcm, pcm)
+
+        stt_limiter.acquire()
+        stt = transcribe_timestamped(
+            io.BytesIO(pcm.wav_bytes(0.0, pcm.duration)),
+            language=language,
+            file_name="recording.wav",
+        )
 
-        buf = io.BytesIO()
-        # Whisper가 안정적으로 읽을 수 있도록 WAV 형태로 export
-        segment.export(buf, format="wav")
-        buf.seek(0)
-        return buf.read()
+        segments = merge_segments(diar_future.result())
+        if not segments:
+            return [], []
+
+        if not stt["words"]:
+            print("[WARN] 단어 시각 전사 결과가 없어 구간별 STT로 대체합니다.")
+            return segments, self._segment_stt(pcm, segments, language)
+
+        return segments, align_words_to_turns(stt["words"], segments)
 
     # ------------------------------------------------------------------
     # 메인: 파일 하나 전체 처리
@@ -101,54 +152,53 @@ class SpeakerPipeline:
         """
         하나의 음성 파일을 전체 처리합니다.
 
-        1) diarization 으로 화자/구간 리스트 얻기
-        2) 파일을 AudioSegment로 로드
-        3) 각 구간마다:
-            - 오디오 자르기
-            - STT 수행
+        1) 파일을 한 번만 디코딩해서 PCM 버퍼(PcmAudio)로 로드
+        2) 같은 버퍼로 diarization 수행 → 화자/구간 리스트 (merge_segments로 병합/필터링)
+        3) STT (속도 제한 적용)
+            - segment : 구간 뷰를 WAV로 감싸 transcribe_batch로 한 번에 전사
+            - aligned : 화자 분리와 동시에 전체 1회 전사 후 단어를 구간에 배정
+        4) 타임스탬프 순서대로 각 구간마다:
+            - STT 결과 확인
             - SessionState에서 turn/history 조회
             - (화자별 TextSessionState에서 effective_text 생성)
             - minwon_engine.run_pipeline_once 호출
             - TextSessionState.register_turn + SessionState.update_state 반영
-        4) 전체 타임라인 리스트 반환
+        5) 전체 타임라인 리스트 반환
 
         :param audio_path: 입력 음성 파일 경로
         :param session_id: SessionState에서 관리하는 세션 ID
         :param language: STT 언어 코드 (기본값 'ko' = 한국어)
         :return: segment별 처리 결과 리스트
         """
-        # 1) 화자 구분
-        segments = self.diarizer.diarize_file(audio_path)
-        if not segments:
-            print("[WARN] process_audio_file: diarization 결과가 비어 있습니다.")
-            return []
-
-        # 2) 오디오 파일 로드
+        # 1) 오디오 파일을 한 번만 디코딩 (16kHz mono int16 NumPy 버퍼)
         try:
-            audio = AudioSegment.from_file(audio_path)
+            pcm = load_pcm(audio_path)
         except Exception as e:
             print(f"[WARN] 오디오 파일 로드 실패: {e}")
             return []
 
+        # 2) 화자 구분 + 3) STT (같은 버퍼 사용, 같은 오디오면 diarization/STT 캐시 재사용)
+        #    (엔진/상태 갱신은 아래에서 타임스탬프 순서대로)
+        segments, stt_texts = self._start_transcription(pcm, language)
+        if not segments:
+            print("[WARN] process_audio_file: diarization 결과가 비어 있습니다.")
+            return []
+
         results: List[Dict[str, Any]] = []
 
-        # 3) 각 segment 처리
-        for seg in segments:
+        # 4) 각 segment 처리
+        for seg, text in zip(segments, stt_texts):
             speaker_id = seg["speaker"]
             start = float(seg["start"])
             end = float(seg["end"])
 
-            # 3-1) 오디오 자르기
-            audio_bytes = self._slice_audio(audio, start, end)
-
-            # 3-2) STT
-            text = transcribe_bytes(audio_bytes, language=language, file_name="segment.wav")
+            # 4-1) STT 결과 확인 (실패한 구간은 빈 문자열)
             if not text.strip():
                 # STT가 비어 있으면 이 구간은 스킵 (노이즈/무음 등)
                 print(f"[INFO] STT 결과 비어 있음: {speaker_id} {start:.2f}~{end:.2f}")
                 continue
 
-            # 3-3) SessionState에서 TextSessionState / turn / history 가져오기
+            # 4-2) SessionState에서 TextSessionState / turn / history 가져오기
             text_state = self.state.get_text_state(session_id, speaker_id)
             # 텍스트 모드와 동일하게: 직전 턴이 clarification이면 문장 합치기
             effective_text = text_state.build_effective_text(text)
@@ -156,17 +206,17 @@ class SpeakerPipeline:
             turn = self.state.next_turn(session_id, speaker_id)
             history = self.state.get_history(session_id, speaker_id)
 
-            # 3-4) 민원 텍스트 엔진 호출 (effective_text 기준)
+            # 4-3) 민원 텍스트 엔진 호출 (effective_text 기준)
             engine_result = run_pipeline_once(effective_text, history)
 
-            # 3-5) TextSessionState 멀티턴 상태 갱신 (이슈 A/B/C, clarification 등)
+            # 4-4) TextSessionState 멀티턴 상태 갱신 (이슈 A/B/C, clarification 등)
             text_state.register_turn(
                 user_raw=text,
                 effective_text=effective_text,
                 engine_result=engine_result,
             )
 
-            # 3-6) SessionState 갱신 (화자별 history/last_location/last_category)
+            # 4-5) SessionState 갱신 (화자별 history/last_location/last_category)
             self.state.update_state(
                 session_id=session_id,
                 speaker_id=speaker_id,
@@ -174,7 +224,7 @@ class SpeakerPipeline:
                 user_text=text,
             )
 
-            # 3-7) 이 segment에 대한 결과 기록
+            # 4-6) 이 segment에 대한 결과 기록
             results.append({
                 "speaker": speaker_id,
                 "turn": turn,
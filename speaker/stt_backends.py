@@ -0,0 +1,527 @@
+# -*- coding: utf-8 -*-
+"""
+stt_backends.py
+
+STT(음성 → 텍스트) 엔진을 갈아 끼울 수 있게 해 주는 백엔드 레지스트리입니다.
+
+🎯 역할 요약
+--------------------------------------
+1. 공통 인터페이스(STTBackend)
+   - transcribe(file_obj, language, file_name) → 텍스트 (백엔드마다 반드시 구현)
+   - transcribe_batch([(file_obj, language, file_name), ...]) → 텍스트 리스트
+     (기본: 공용 STT 워커 풀에 나눠 동시 호출 + 초당 요청 수 제한,
+      local: 한 번 로드한 모델 하나로 모두 처리)
+   - transcribe_detect(file_obj, file_name) → {"text", "language"} (언어 자동 감지 + 감지 언어)
+   - transcribe_timestamped(...) → {"text", "language", "words": [{start, end, text}, ...]}
+     (녹음 전체를 한 번에 전사하고 화자 구간에 단어를 맞출 때 사용)
+   - model_id : 캐시 키 등에 쓰는 "백엔드:모델" 식별자
+2. 기본 제공 백엔드
+   - "openai" : OpenAI 전사 API (WHISPER_MODEL)
+   - "local"  : faster-whisper(CTranslate2) CPU 엔진
+                (프로세스당 한 번만 로드해서 모든 요청이 공유)
+   - "fake"   : 테스트용 결정적 가짜 엔진 (같은 오디오 → 항상 같은 텍스트)
+3. 설정(STT_BACKEND)으로 선택, get_backend()로 싱글턴 획득
+4. 프로세스 전체가 공유하는 STT 워커 풀(stt_executor) + 속도 제한기(stt_limiter)
+   (SPEAKER_STT_WORKERS / SPEAKER_STT_MAX_RPS)
+
+👉 업링크가 느린 마을회관에서는 STT_BACKEND=local 로 두면
+   WAN 왕복 없이 키오스크 서버 안에서 전사할 수 있습니다.
+   (pip install faster-whisper 필요)
+"""
+
+import hashlib
+import os
+import threading
+import time
+import wave
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from dotenv import load_dotenv
+
+from core.config import (
+    STT_BACKEND,
+    LOCAL_STT_MODEL,
+    LOCAL_STT_COMPUTE_TYPE,
+    LOCAL_STT_CPU_THREADS,
+    LOCAL_STT_NUM_WORKERS,
+    SPEAKER_STT_MAX_RPS,
+    SPEAKER_STT_WORKERS,
+    STT_FAKE_TEXT,
+    STT_MULTILANG_VERBOSE,
+    STT_TIMESTAMP_MODEL,
+    WHISPER_MODEL,
+)
+
+# faster-whisper는 선택 설치입니다.
+# pip install faster-whisper
+try:
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None  # 로컬 백엔드를 쓸 때만 체크
+
+load_dotenv()
+
+# (파일 객체, 언어 코드 또는 None(자동 감지), 파일명)
+BatchItem = Tuple[object, Optional[str], Optional[str]]
+
+# whisper verbose_json은 언어를 "korean" 같은 이름으로 돌려줌 → ISO 639-1 코드로 변환
+_LANGUAGE_NAMES = {
+    "korean": "ko",
+    "english": "en",
+    "japanese": "ja",
+    "chinese": "zh",
+    "vietnamese": "vi",
+    "thai": "th",
+    "russian": "ru",
+    "mongolian": "mn",
+    "indonesian": "id",
+    "tagalog": "tl",
+    "uzbek": "uz",
+    "nepali": "ne",
+    "khmer": "km",
+}
+
+
+def normalize_language(value: Optional[str]) -> Optional[str]:
+    """STT가 돌려준 언어(이름 또는 코드)를 소문자 ISO 639-1 코드로 맞춥니다."""
+    if not value:
+        return None
+    value = value.strip().lower()
+    if value in _LANGUAGE_NAMES:
+        return _LANGUAGE_NAMES[value]
+    if len(value) == 2 and value.isalpha():
+        return value
+    return None
+
+
+# -------------------------------------------------------------------
+# 공용 STT 워커 풀 + 속도 제한
+# -------------------------------------------------------------------
+
+class _RateLimiter:
+    """
+    초당 최대 요청 수를 넘지 않도록 요청 시작 간격을 벌려 주는 간단한 제한기.
+    (여러 스레드에서 동시에 acquire 해도 안전)
+    """
+
+    def __init__(self, max_per_sec: float):
+        self.interval = 1.0 / max_per_sec if max_per_sec > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+# 프로세스 전체에서 공유 (동시 요청이 여러 개여도 STT 호출 수는 이 한도 안에서)
+stt_executor = ThreadPoolExecutor(
+    max_workers=max(1, SPEAKER_STT_WORKERS),
+    thread_name_prefix="stt-batch",
+)
+stt_limiter = _RateLimiter(SPEAKER_STT_MAX_RPS)
+
+
+def _fan_out(fn: Callable[[BatchItem], str], items: Sequence[BatchItem]) -> List[str]:
+    """items를 공용 워커 풀에 나눠 실행하고 입력 순서대로 결과를 모읍니다. (실패 항목은 빈 문자열)"""
+    futures = [stt_executor.submit(fn, item) for item in items]
+    results: List[str] = []
+    for i, future in enumerate(futures):
+        try:
+            results.append(future.result())
+        except Exception as e:
+            print(f"[WARN] 일괄 STT 항목 처리 중 오류 발생 ({i}): {e}")
+            results.append("")
+    return results
+
+
+# -------------------------------------------------------------------
+# 공통 인터페이스
+# -------------------------------------------------------------------
+
+class STTBackend(ABC):
+    """STT 백엔드 공통 인터페이스."""
+
+    name = "base"
+
+    @property
+    def model_id(self) -> str:
+        return self.name
+
+    @property
+    def detect_model_id(self) -> str:
+        """transcribe_detect 결과의 캐시 키용 식별자 (실제 쓰는 모델 + 방식)."""
+        return f"{self.model_id}+detect"
+
+    @abstractmethod
+    def transcribe(self,
+                   file_obj,
+                   language: Optional[str] = "ko",
+                   file_name: Optional[str] = None) -> str:
+        """
+        :param file_obj: read()/seek() 가능한 바이너리 파일 객체
+        :param language: 언어 코드 (None이면 자동 감지)
+        :param file_name: 포맷 힌트용 파일명
+        :return: 인식된 텍스트 (실패 시 빈 문자열)
+        """
+
+    def transcribe_batch(self, items: Sequence[BatchItem]) -> List[str]:
+        """
+        여러 오디오를 한 번에 전사합니다.
+        기본 구현은 공용 워커 풀(stt_executor)에 나눠 동시에 호출하고,
+        호출마다 stt_limiter로 초당 요청 수를 제한합니다.
+
+        ⚠️ stt_executor 워커 안에서 호출하면 풀이 막힐 수 있으므로 일반 스레드에서 호출할 것
+
+        :param items: [(파일 객체, 언어 코드 또는 None, 파일명), ...]
+        :return: 입력 순서대로 인식된 텍스트 리스트 (실패한 항목은 빈 문자열)
+        """
+        def run(item: BatchItem) -> str:
+            file_obj, language, file_name = item
+            stt_limiter.acquire()
+            return self.transcribe(file_obj, language=language, file_name=file_name)
+
+        return _fan_out(run, items)
+
+    def transcribe_detect(self, file_obj, file_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        언어를 자동 감지하며 전사하고, 감지된 언어 코드도 함께 반환합니다.
+        기본 구현은 언어 정보 없이 텍스트만 돌려줍니다.
+
+        :return: {"text": str, "language": "ko"/"en"/... 또는 None}
+                 detect_model_id와 다른 방식으로 대체 전사했으면 "fallback": True
+        """
+        return {"text": self.transcribe(file_obj, language=None, file_name=file_name), "language": None}
+
+    def transcribe_timestamped(self,
+                               file_obj,
+                               language: Optional[str] = "ko",
+                               file_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        단어(또는 문장 조각) 단위 시각이 붙은 전사 결과를 반환합니다.
+
+        :return: {
+            "text": "전체 텍스트",
+            "language": "ko" 또는 None,
+            "words": [{"start": 0.12, "end": 0.48, "text": "안녕하세요"}, ...],
+        }
+        :raises NotImplementedError: 시각 정보를 지원하지 않는 백엔드
+        """
+        raise NotImplementedError(f"{self.name} 백엔드는 시각 정보 전사를 지원하지 않습니다.")
+
+
+# -------------------------------------------------------------------
+# 1) OpenAI 전사 API
+# -------------------------------------------------------------------
+
+class OpenAISTTBackend(STTBackend):
+    """OpenAI audio.transcriptions API 백엔드."""
+
+    name = "openai"
+
+    def __init__(self, model: Optional[str] = None):
+        from openai import OpenAI
+
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise RuntimeError(".env에 OPENAI_API_KEY가 없습니다. 음성 인식을 위해 API 키를 설정해 주세요.")
+
+        self.client = OpenAI(api_key=api_key)
+        self.model = model or WHISPER_MODEL
+
+    @property
+    def model_id(self) -> str:
+        return f"openai:{self.model}"
+
+    @property
+    def detect_model_id(self) -> str:
+        if STT_MULTILANG_VERBOSE:
+            return f"openai:{STT_TIMESTAMP_MODEL}+detect:verbose_json"
+        return f"{self.model_id}+detect:text"
+
+    def transcribe(self, file_obj, language="ko", file_name=None) -> str:
+        kwargs = {
+            "model": self.model,
+            "file": (file_name, file_obj) if file_name else file_obj,
+            "response_format": "text",  # 순수 텍스트만 반환
+        }
+        if language:
+            kwargs["language"] = language
+
+        try:
+            file_obj.seek(0)
+            resp = self.client.audio.transcriptions.create(**kwargs)
+            # response_format="text" 이면 resp 자체가 문자열이거나,
+            # 일부 버전에서는 resp.text 속성에 텍스트가 들어갈 수 있음
+            if isinstance(resp, str):
+                return resp.strip()
+            text = getattr(resp, "text", "") or str(resp)
+            return text.strip()
+        except Exception as e:
+            print(f"[WARN] OpenAI STT 호출 중 오류 발생: {e}")
+            return ""
+
+    def transcribe_detect(self, file_obj, file_name=None) -> Dict[str, Any]:
+        if not STT_MULTILANG_VERBOSE:
+            return super().transcribe_detect(file_obj, file_name=file_name)
+
+        # 감지 언어(verbose_json)는 whisper 계열 모델만 지원 → STT_TIMESTAMP_MODEL 사용
+        try:
+            file_obj.seek(0)
+            resp = self.client.audio.transcriptions.create(
+                model=STT_TIMESTAMP_MODEL,
+                file=(file_name, file_obj) if file_name else file_obj,
+                response_format="verbose_json",
+            )
+        except Exception as e:
+            print(f"[WARN] OpenAI verbose_json STT 실패, 텍스트 전사로 대체: {e}")
+            return {**super().transcribe_detect(file_obj, file_name=file_name), "fallback": True}
+
+        return {
+            "text": (getattr(resp, "text", "") or "").strip(),
+            "language": normalize_language(getattr(resp, "language", None)),
+        }
+
+    def transcribe_timestamped(self, file_obj, language="ko", file_name=None) -> Dict[str, Any]:
+        # 시각 정보(verbose_json)는 whisper 계열 모델만 지원 → STT_TIMESTAMP_MODEL 사용
+        kwargs = {
+            "model": STT_TIMESTAMP_MODEL,
+            "file": (file_name, file_obj) if file_name else file_obj,
+            "response_format": "verbose_json",
+            "timestamp_granularities": ["word", "segment"],
+        }
+        if language:
+            kwargs["language"] = language
+
+        file_obj.seek(0)
+        resp = self.client.audio.transcriptions.create(**kwargs)
+
+        # 단어 시각이 있으면 단어, 없으면 문장 조각(segment) 시각 사용
+        items = getattr(resp, "words", None) or getattr(resp, "segments", None) or []
+        words = []
+        for item in items:
+            get = item.get if isinstance(item, dict) else (lambda k, o=item: getattr(o, k, None))
+            text = (get("word") or get("text") or "").strip()
+            if text:
+                words.append({"start": float(get("start")), "end": float(get("end")), "text": text})
+
+        return {
+            "text": (getattr(resp, "text", "") or "").strip(),
+            "language": normalize_language(getattr(resp, "language", None)),
+            "words": words,
+        }
+
+
+# -------------------------------------------------------------------
+# 2) 로컬 CPU 엔진 (faster-whisper / CTranslate2)
+# -------------------------------------------------------------------
+
+class LocalWhisperBackend(STTBackend):
+    """
+    faster-whisper 기반 로컬 CPU 백엔드.
+
+    모델은 처음 transcribe가 호출될 때 한 번만 로드되고,
+    이후 모든 요청이 같은 모델을 공유합니다.
+    """
+
+    name = "local"
+
+    def __init__(self,
+                 model_size: str = LOCAL_STT_MODEL,
+                 compute_type: str = LOCAL_STT_COMPUTE_TYPE,
+                 cpu_threads: int = LOCAL_STT_CPU_THREADS,
+                 num_workers: int = LOCAL_STT_NUM_WORKERS):
+        if WhisperModel is None:
+            raise ImportError(
+                "faster-whisper가 설치되어 있지 않습니다. "
+                "pip install faster-whisper 로 설치해 주세요."
+            )
+        self.model_size = model_size
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.num_workers = max(1, num_workers)
+        self._model = None
+        self._load_lock = threading.Lock()
+
+    @property
+    def model_id(self) -> str:
+        return f"local:{self.model_size}:{self.compute_type}"
+
+    def _get_model(self):
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    self._model = WhisperModel(
+                        self.model_size,
+                        device="cpu",
+                        compute_type=self.compute_type,
+                        cpu_threads=self.cpu_threads,
+                        num_workers=self.num_workers,
+                    )
+        return self._model
+
+    def _transcribe_with(self, model, file_obj, language) -> str:
+        try:
+            file_obj.seek(0)
+            segments, _info = model.transcribe(
+                file_obj,
+                language=language,
+                beam_size=1,
+                vad_filter=True,
+            )
+            return "".join(seg.text for seg in segments).strip()
+        except Exception as e:
+            print(f"[WARN] 로컬 STT 처리 중 오류 발생: {e}")
+            return ""
+
+    def transcribe(self, file_obj, language="ko", file_name=None) -> str:
+        try:
+            model = self._get_model()
+        except Exception as e:
+            print(f"[WARN] 로컬 STT 모델 로드 실패: {e}")
+            return ""
+        return self._transcribe_with(model, file_obj, language)
+
+    def transcribe_batch(self, items: Sequence[BatchItem]) -> List[str]:
+        """
+        한 번 로드한 모델 하나로 모든 항목을 전사합니다. (네트워크 호출이 아니므로 속도 제한 없음)
+        num_workers가 2 이상이면 같은 모델로 동시에, 아니면 현재 스레드에서 순서대로 처리합니다.
+        """
+        try:
+            model = self._get_model()
+        except Exception as e:
+            print(f"[WARN] 로컬 STT 모델 로드 실패: {e}")
+            return [""] * len(items)
+
+        if self.num_workers <= 1 or len(items) <= 1:
+            return [self._transcribe_with(model, f, lang) for f, lang, _name in items]
+        return _fan_out(lambda item: self._transcribe_with(model, item[0], item[1]), items)
+
+    def transcribe_detect(self, file_obj, file_name=None) -> Dict[str, Any]:
+        try:
+            file_obj.seek(0)
+            segments, info = self._get_model().transcribe(file_obj, beam_size=1, vad_filter=True)
+            text = "".join(seg.text for seg in segments).strip()
+        except Exception as e:
+            print(f"[WARN] 로컬 STT 처리 중 오류 발생: {e}")
+            return {"text": "", "language": None}
+        return {"text": text, "language": normalize_language(getattr(info, "language", None))}
+
+    def transcribe_timestamped(self, file_obj, language="ko", file_name=None) -> Dict[str, Any]:
+        file_obj.seek(0)
+        segments, info = self._get_model().transcribe(
+            file_obj,
+            language=language,
+            beam_size=1,
+            vad_filter=True,
+            word_timestamps=True,
+        )
+
+        texts: List[str] = []
+        words: List[Dict[str, Any]] = []
+        for seg in segments:
+            texts.append(seg.text)
+            for w in seg.words or []:
+                text = w.word.strip()
+                if text:
+                    words.append({"start": float(w.start), "end": float(w.end), "text": text})
+
+        return {
+            "text": "".join(texts).strip(),
+            "language": normalize_language(getattr(info, "language", None)),
+            "words": words,
+        }
+
+
+# -------------------------------------------------------------------
+# 3) 테스트용 가짜 엔진
+# -------------------------------------------------------------------
+
+class FakeSTTBackend(STTBackend):
+    """
+    네트워크/모델 없이 동작하는 결정적 가짜 백엔드.
+
+    - STT_FAKE_TEXT가 있으면 항상 그 문장을 반환
+    - 없으면 오디오 해시 앞 8자리로 "[fake:xxxxxxxx]" 반환
+    """
+
+    name = "fake"
+
+    def __init__(self, fixed_text: str = STT_FAKE_TEXT):
+        self.fixed_text = fixed_text
+
+    def transcribe(self, file_obj, language="ko", file_name=None) -> str:
+        if self.fixed_text:
+            return self.fixed_text
+        file_obj.seek(0)
+        digest = hashlib.blake2b(file_obj.read(), digest_size=4).hexdigest()
+        file_obj.seek(0)
+        return f"[fake:{digest}]"
+
+    def transcribe_timestamped(self, file_obj, language="ko", file_name=None) -> Dict[str, Any]:
+        """WAV면 전체 길이에 단어를 고르게 배치합니다. (정렬 로직 테스트용)"""
+        text = self.transcribe(file_obj, language=language, file_name=file_name)
+        try:
+            with wave.open(file_obj, "rb") as wf:
+                duration = wf.getnframes() / float(wf.getframerate())
+        except Exception:
+            duration = 0.0
+        file_obj.seek(0)
+
+        tokens = text.split()
+        step = duration / len(tokens) if tokens else 0.0
+        words = [
+            {"start": i * step, "end": (i + 1) * step, "text": tok}
+            for i, tok in enumerate(tokens)
+        ]
+        return {"text": text, "language": language, "words": words}
+
+
+# -------------------------------------------------------------------
+# 레지스트리
+# -------------------------------------------------------------------
+
+_FACTORIES: Dict[str, Callable[[], STTBackend]] = {
+    "openai": OpenAISTTBackend,
+    "local": LocalWhisperBackend,
+    "fake": FakeSTTBackend,
+}
+_instances: Dict[str, STTBackend] = {}
+_instances_lock = threading.Lock()
+
+
+def register_backend(name: str, factory: Callable[[], STTBackend]) -> None:
+    """새 STT 백엔드를 이름으로 등록합니다. (같은 이름이면 교체)"""
+    with _instances_lock:
+        _FACTORIES[name] = factory
+        _instances.pop(name, None)
+
+
+def get_backend(name: Optional[str] = None) -> STTBackend:
+    """
+    설정(STT_BACKEND) 또는 지정한 이름의 백엔드 싱글턴을 반환합니다.
+    """
+    key = (name or STT_BACKEND).lower()
+    backend = _instances.get(key)
+    if backend is not None:
+        return backend
+
+    with _instances_lock:
+        backend = _instances.get(key)
+        if backend is None:
+            factory = _FACTORIES.get(key)
+            if factory is None:
+                raise ValueError(
+                    f"알 수 없는 STT_BACKEND: {key} (사용 가능: {', '.join(_FACTORIES)})"
+                )
+            backend = factory()
+            _instances[key] = backend
+    return backend
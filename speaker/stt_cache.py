@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+stt_cache.py
+
+같은 오디오를 다시 STT에 보내지 않도록 하는 "내용 기반" 전사 결과 캐시입니다.
+
+🎯 역할 요약
+--------------------------------------
+1. 오디오 바이트 + 언어 + STT 모델 이름으로 해시 키 생성 (make_key)
+2. 저장은 공용 2단 캐시(core/file_cache.FileCache)
+   - 1단: 프로세스 메모리 LRU (최근 STT_CACHE_MAX_ENTRIES개)
+   - 2단: 디스크 JSON 파일 (STT_CACHE_DIR/ab/abcdef....json)
+   - 서버 재시작 후에도, 로그 리플레이/QA 때도 재사용
+   - 전체 크기가 STT_CACHE_MAX_BYTES를 넘으면 가장 오래 안 쓴 파일부터 삭제 (LRU)
+3. 빈 결과(STT 실패)는 저장하지 않음
+4. 언어 자동 감지 전사(language=None)는 STT가 감지한 언어(detected_language)도 함께 저장
+
+👉 키오스크가 타임아웃 후 같은 녹음을 다시 올리거나,
+   uploads/*.webm을 반복 재생하는 경우 API 호출 대신 해시 계산만 하게 됩니다.
+"""
+
+import hashlib
+from typing import Any, BinaryIO, Dict, Optional
+
+from core.config import (
+    STT_CACHE_ENABLED,
+    STT_CACHE_DIR,
+    STT_CACHE_MAX_ENTRIES,
+    STT_CACHE_MAX_BYTES,
+)
+from core.file_cache import FileCache, decode_json, encode_json
+
+# 해시 계산 시 한 번에 읽을 크기
+_READ_CHUNK = 1024 * 1024
+
+_cache = FileCache(
+    "STT",
+    STT_CACHE_DIR,
+    ".json",
+    max_bytes=STT_CACHE_MAX_BYTES,
+    memory_entries=STT_CACHE_MAX_ENTRIES,
+    encode=encode_json,
+    decode=decode_json,
+    enabled=STT_CACHE_ENABLED,
+)
+
+
+# -------------------------------------------------------------------
+# 키 생성
+# -------------------------------------------------------------------
+
+def make_key(file_obj: BinaryIO, language: Optional[str], model: str) -> str:
+    """
+    파일 객체 내용 + 언어 + 모델로 캐시 키를 만듭니다.
+    (파일 위치는 처음으로 되돌려 둡니다)
+    """
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{model}\0{language or 'auto'}\0".encode("utf-8"))
+
+    file_obj.seek(0)
+    while True:
+        chunk = file_obj.read(_READ_CHUNK)
+        if not chunk:
+            break
+        h.update(chunk)
+    file_obj.seek(0)
+
+    return h.hexdigest()
+
+
+# -------------------------------------------------------------------
+# 조회 / 저장
+# -------------------------------------------------------------------
+
+def get_entry(key: str) -> Optional[Dict[str, Any]]:
+    """
+    캐시에 있으면 {"text": ..., "detected_language": ...}, 없으면 None.
+    """
+    data = _cache.get(key)
+    if not isinstance(data, dict) or not data.get("text"):
+        return None
+    return {"text": data["text"], "detected_language": data.get("detected_language")}
+
+
+def get(key: str) -> Optional[str]:
+    """캐시에 있으면 전사 텍스트, 없으면 None."""
+    entry = get_entry(key)
+    return entry["text"] if entry is not None else None
+
+
+def put(key: str,
+        text: str,
+        language: Optional[str] = None,
+        model: str = "",
+        detected_language: Optional[str] = None) -> None:
+    """
+    전사 결과를 메모리 + 디스크에 저장합니다. 빈 텍스트는 저장하지 않습니다.
+    디스크 전체 크기가 STT_CACHE_MAX_BYTES를 넘으면 오래된 것부터 삭제합니다.
+    """
+    if not text:
+        return
+    _cache.put(key, {
+        "text": text,
+        "language": language or "auto",
+        "detected_language": detected_language,
+        "model": model,
+    })
+
+
+def stats() -> Dict[str, Any]:
+    """디버그/모니터링용 캐시 적중 통계."""
+    return _cache.stats()
@@ -2,15 +2,21 @@
 """
 stt_whisper.py
 
-이 모듈은 음성 파일(또는 바이트)을 OpenAI Whisper(STT) API로 보내서
+이 모듈은 음성 파일(또는 바이트)을 STT 엔진(기본: OpenAI Whisper API)으로 보내서
 '한국어 텍스트'로 변환하는 역할을 합니다.
 
 🎯 역할 요약
 --------------------------------------
-1. .env 에서 OPENAI_API_KEY, WHISPER_MODEL 읽기
-2. 음성 파일 경로를 받아 텍스트로 변환 (transcribe_file)
-3. 메모리 상의 바이트(녹음 버퍼 등)를 받아 텍스트로 변환 (transcribe_bytes)
-4. 모든 예외는 잡아서 경고 로그를 남기고, 호출 측이 판단하도록 빈 문자열 반환
+1. 음성 파일 경로를 받아 텍스트로 변환 (transcribe_file)
+2. 메모리 상의 바이트(녹음 버퍼 등)를 받아 텍스트로 변환 (transcribe_bytes)
+   - 스트리밍으로 받은 raw PCM은 pcm16_to_wav_bytes로 WAV로 감싸서 전달
+3. 이미 열린 파일 객체(업로드 임시 파일 등)를 복사 없이 그대로 전달 (transcribe_fileobj)
+4. 여러 오디오를 한 번에 전사 (transcribe_batch, 캐시에 없는 것만 백엔드 transcribe_batch로 전달)
+5. 단어 시각이 붙은 전체 전사 (transcribe_timestamped, 화자 구간 정렬용)
+6. 언어 자동 감지 전사 + 감지 언어 코드 (transcribe_detect_language)
+7. 같은 오디오(+언어, 모델)는 speaker.stt_cache 결과를 재사용 (API 재호출 없음)
+8. 실제 전사는 speaker.stt_backends의 백엔드(STT_BACKEND: openai/local/fake)가 수행
+9. 모든 예외는 잡아서 경고 로그를 남기고, 호출 측이 판단하도록 빈 문자열 반환
 
 👉 이 모듈은 "오디오 → 텍스트"만 담당하며,
    텍스트를 민원 엔진(minwon_engine)에 넘기는 작업은 main.py/speaker.py 쪽에서 처리합니다.
@@ -18,60 +24,53 @@ stt_whisper.py
 
 import os
 import io
-from typing import Optional
+import wave
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from dotenv import load_dotenv
-from openai import OpenAI
-
-# -------------------------------------------------------------------
-# 환경 설정
-# -------------------------------------------------------------------
-
-load_dotenv()
-
-API_KEY = os.getenv("OPENAI_API_KEY")
-if not API_KEY:
-    raise RuntimeError(".env에 OPENAI_API_KEY가 없습니다. 음성 인식을 위해 API 키를 설정해 주세요.")
-
-# OpenAI 클라이언트
-client = OpenAI(api_key=API_KEY)
-
-# Whisper 모델 이름 (필요하면 .env에서 덮어쓰기)
-# - 기본값은 최신 소형 STT 전용 모델(gpt-4o-mini-transcribe 등)을 가정
-WHISPER_MODEL = os.getenv("WHISPER_MODEL", "gpt-4o-mini-transcribe")
+from speaker import stt_cache
+from speaker.stt_backends import BatchItem, get_backend
 
 # -------------------------------------------------------------------
 # 공통 STT 로직
 # -------------------------------------------------------------------
 
-def _call_whisper(file_obj, language: str = "ko") -> str:
+def _call_stt(file_obj, language: Optional[str] = "ko", file_name: Optional[str] = None) -> str:
     """
-    실제로 OpenAI Whisper API를 호출하는 내부 함수.
+    설정된 STT 백엔드(STT_BACKEND)를 호출하는 내부 함수.
 
     :param file_obj: 바이너리 모드로 연 열린 파일 객체 (또는 BytesIO)
-    :param language: 음성 언어 코드 (기본값 'ko' = 한국어)
+    :param language: 음성 언어 코드 (기본값 'ko', None이면 자동 감지)
+    :param file_name: 포맷 힌트용 파일명
     :return: 변환된 텍스트 (실패 시 빈 문자열)
     """
     try:
-        # OpenAI Audio Transcription API 호출
-        resp = client.audio.transcriptions.create(
-            model=WHISPER_MODEL,
-            file=file_obj,
-            language=language,
-            response_format="text",  # 순수 텍스트만 반환
-        )
-        # response_format="text" 이면 resp 자체가 문자열이거나,
-        # 일부 버전에서는 resp.text 속성에 텍스트가 들어갈 수 있음
-        if isinstance(resp, str):
-            return resp.strip()
-        # 안전하게 처리
-        text = getattr(resp, "text", "") or str(resp)
-        return text.strip()
+        return get_backend().transcribe(file_obj, language=language, file_name=file_name)
     except Exception as e:
-        print(f"[WARN] Whisper STT 호출 중 오류 발생: {e}")
+        print(f"[WARN] STT 백엔드 호출 중 오류 발생: {e}")
         return ""
 
 
+def _transcribe_cached(file_obj, language: Optional[str] = "ko", file_name: Optional[str] = None) -> str:
+    """
+    오디오 내용 해시로 캐시를 먼저 보고, 없을 때만 STT 백엔드를 호출합니다.
+    (캐시 키에는 백엔드+모델 식별자가 들어가므로 엔진을 바꾸면 새로 전사)
+    """
+    try:
+        model_id = get_backend().model_id
+        key = stt_cache.make_key(file_obj, language, model_id)
+    except Exception as e:
+        print(f"[WARN] STT 준비 중 오류 발생: {e}")
+        return ""
+
+    cached = stt_cache.get(key)
+    if cached is not None:
+        return cached
+
+    text = _call_stt(file_obj, language=language, file_name=file_name)
+    stt_cache.put(key, text, language=language, model=model_id)
+    return text
+
+
 # -------------------------------------------------------------------
 # 외부에서 사용할 공개 함수들
 # -------------------------------------------------------------------
@@ -94,7 +93,7 @@ def transcribe_file(path: str,
 
     try:
         with open(path, "rb") as f:
-            return _call_whisper(f, language=language)
+            return _transcribe_cached(f, language=language)
     except Exception as e:
         print(f"[WARN] 음성 파일 열기 실패: {e}")
         return ""
@@ -125,7 +124,158 @@ def transcribe_bytes(audio_bytes: bytes,
     if file_name:
         bio.name = file_name  # type: ignore[attr-defined]
 
-    return _call_whisper(bio, language=language)
+    return _transcribe_cached(bio, language=language)
+
+
+def transcribe_fileobj(file_obj,
+                       language: Optional[str] = "ko",
+                       file_name: Optional[str] = None) -> str:
+    """
+    이미 열린 바이너리 파일 객체를 그대로 STT에 넘깁니다.
+
+    - 업로드된 SpooledTemporaryFile 등을 bytes로 다시 읽어 복사하지 않기 위함
+    - 처음부터 읽도록 seek(0) 후 전달합니다.
+
+    :param file_obj: read()/seek()가 가능한 바이너리 파일 객체
+    :param language: 음성 언어 코드 (None이면 언어 자동 감지)
+    :param file_name: 포맷 힌트용 파일명 (예: "recording.webm")
+    :return: 인식된 텍스트 (실패 시 빈 문자열)
+    """
+    try:
+        file_obj.seek(0)
+    except Exception as e:
+        print(f"[WARN] transcribe_fileobj: 파일 위치 초기화 실패: {e}")
+        return ""
+
+    return _transcribe_cached(file_obj, language=language, file_name=file_name)
+
+
+def transcribe_detect_language(file_obj,
+                               file_name: Optional[str] = None) -> Tuple[str, Optional[str]]:
+    """
+    언어를 자동 감지하며 전사하고, STT가 감지한 언어 코드도 함께 반환합니다.
+    (다국어 STT에서 별도 언어 감지 LLM 호출을 줄이기 위함)
+
+    - 같은 오디오는 stt_cache에서 텍스트 + 감지 언어를 함께 재사용
+    - 백엔드가 언어를 알려주지 않으면 언어는 None
+
+    :return: (텍스트, "ko"/"en"/... 또는 None). 실패 시 ("", None)
+    """
+    try:
+        file_obj.seek(0)
+        backend = get_backend()
+        model_id = backend.detect_model_id
+        key = stt_cache.make_key(file_obj, None, model_id)
+    except Exception as e:
+        print(f"[WARN] transcribe_detect_language: 준비 중 오류: {e}")
+        return "", None
+
+    cached = stt_cache.get_entry(key)
+    if cached is not None:
+        return cached["text"], cached.get("detected_language")
+
+    try:
+        result = backend.transcribe_detect(file_obj, file_name=file_name)
+    except Exception as e:
+        print(f"[WARN] STT 백엔드 호출 중 오류 발생: {e}")
+        return "", None
+
+    text = (result.get("text") or "").strip()
+    detected = result.get("language")
+    # 대체 전사 결과는 다른 모델/방식이므로 이 키로 저장하지 않음
+    if not result.get("fallback"):
+        stt_cache.put(key, text, language=None, model=model_id, detected_language=detected)
+    return text, detected
+
+
+def transcribe_timestamped(file_obj,
+                           language: Optional[str] = "ko",
+                           file_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    오디오 전체를 단어(또는 문장 조각) 시각과 함께 전사합니다.
+
+    - 녹음 전체를 한 번만 STT에 보내고, 화자 분리 구간에 단어를 맞출 때 사용
+    - 백엔드가 지원하지 않거나 실패하면 words가 빈 리스트
+
+    :return: {"text": str, "language": str | None, "words": [{"start", "end", "text"}, ...]}
+    """
+    try:
+        return get_backend().transcribe_timestamped(file_obj, language=language, file_name=file_name)
+    except NotImplementedError as e:
+        print(f"[INFO] {e}")
+    except Exception as e:
+        print(f"[WARN] 시각 정보 STT 호출 중 오류 발생: {e}")
+    return {"text": "", "language": None, "words": []}
+
+
+def transcribe_batch(items: Sequence[BatchItem]) -> List[str]:
+    """
+    여러 오디오를 한 번에 전사합니다.
+
+    - 캐시에 있는 항목은 바로 채우고, 나머지만 백엔드 transcribe_batch로 묶어서 호출
+      (기본 백엔드는 공용 STT 워커 풀에서 동시에, local은 로드한 모델 하나로 처리)
+    - 캐시 키를 못 만든 항목도 전사는 하고, 캐시에만 저장하지 않음
+    - 결과 순서는 입력 순서와 같습니다.
+
+    :param items: [(파일 객체, 언어 코드 또는 None, 파일명), ...]
+    :return: 인식된 텍스트 리스트 (실패한 항목은 빈 문자열)
+    """
+    results: List[str] = [""] * len(items)
+    if not items:
+        return results
+
+    try:
+        backend = get_backend()
+    except Exception as e:
+        print(f"[WARN] STT 준비 중 오류 발생: {e}")
+        return results
+    model_id = backend.model_id
+
+    keys: List[Optional[str]] = [None] * len(items)
+    pending: List[int] = []
+    for i, (file_obj, language, _name) in enumerate(items):
+        try:
+            keys[i] = stt_cache.make_key(file_obj, language, model_id)
+        except Exception as e:
+            print(f"[WARN] transcribe_batch: 캐시 키 생성 실패 ({i}): {e}")
+            pending.append(i)
+            continue
+        cached = stt_cache.get(keys[i])
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending.append(i)
+
+    if not pending:
+        return results
+
+    try:
+        texts = backend.transcribe_batch([items[i] for i in pending])
+    except Exception as e:
+        print(f"[WARN] STT 백엔드 일괄 호출 중 오류 발생: {e}")
+        return results
+
+    for i, text in zip(pending, texts):
+        results[i] = text
+        if keys[i] is not None:
+            stt_cache.put(keys[i], text, language=items[i][1], model=model_id)
+    return results
+
+
+def pcm16_to_wav_bytes(pcm: bytes,
+                       sample_rate: int = 16000,
+                       channels: int = 1) -> bytes:
+    """
+    16bit little-endian raw PCM을 WAV 컨테이너로 감싸서 반환합니다.
+    (WebSocket 등으로 받은 PCM을 Whisper에 그대로 넘기기 위함)
+    """
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm)
+    return buf.getvalue()
 
 
 # -------------------------------------------------------------------
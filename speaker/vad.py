@@ -9,18 +9,25 @@ vad.py
 🎯 역할 요약
 --------------------------------------
 1. 음성 파일에서 앞·뒤 무음 제거 (trim_silence)
-2. 음성 파일을 여러 발화(chunk)로 나누기 (split_into_chunks)
-3. 각 chunk의 시작/끝 시각(sec)을 함께 반환
+2. 전체 신호의 프레임 에너지를 NumPy 한 번에 계산 (frame_dbfs)
+3. 히스테리시스(시작/유지 기준 분리)로 발화 구간 검출 (detect_speech_segments)
+   - 원본 기준 절대 시작/끝(ms)을 반환
+4. 음성 파일을 여러 발화(chunk)로 나누기 (split_into_chunks)
+   - 각 chunk의 시작/끝 시각(sec)은 원본 파일 기준 실제 위치
+5. 실시간으로 들어오는 PCM 조각 처리
+   - StreamingVAD : 여러 발화의 시작/끝을 절대 시각으로 계속 알려줌
+   - StreamingEndpointer : StreamingVAD 위에서 발화 PCM까지 잘라 주는 래퍼
+     (WebSocket STT(/ws/stt/multi)에서 "말이 끝난 순간"을 잡는 용도)
 
 👉 pyannote.audio의 고급 diarization과는 별도로,
    단순히 "무음 기준으로 발화 단위 나누기"가 필요할 때 사용합니다.
 """
 
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
+import numpy as np
 from pydub import AudioSegment
-from pydub.silence import split_on_silence
 
 
 # -------------------------------------------------------------------
@@ -39,103 +46,498 @@ def load_audio(path: str) -> AudioSegment:
     return AudioSegment.from_file(path)
 
 
+def frame_dbfs(samples: np.ndarray,
+               frame_len: int,
+               max_amplitude: float = 32768.0) -> np.ndarray:
+    """
+    샘플 배열 전체를 frame_len 샘플 단위 프레임으로 나눠
+    프레임별 dBFS를 NumPy 한 번에 계산합니다.
+    (마지막 자투리 프레임도 포함, 완전 무음 프레임은 -inf)
+
+    :param samples: 1차원 샘플 배열 (스테레오면 interleaved 그대로)
+    :param frame_len: 프레임 하나의 샘플 수
+    :param max_amplitude: 샘플 최대 진폭 (16bit → 32768)
+    :return: 길이 ceil(len(samples) / frame_len)의 dBFS 배열
+    """
+    if samples.size == 0 or frame_len <= 0:
+        return np.empty(0, dtype=np.float64)
+
+    x = samples.astype(np.float64)
+    n_frames = -(-x.size // frame_len)
+    pad = n_frames * frame_len - x.size
+
+    sq = np.pad(x * x, (0, pad)).reshape(n_frames, frame_len)
+    counts = np.full(n_frames, frame_len, dtype=np.float64)
+    if pad:
+        counts[-1] = frame_len - pad
+
+    rms = np.sqrt(sq.sum(axis=1) / counts)
+    with np.errstate(divide="ignore"):
+        return 20.0 * np.log10(rms / max_amplitude)
+
+
+def detect_voiced_range(samples: np.ndarray,
+                        sample_rate: int,
+                        silence_thresh: int = -40,
+                        padding_ms: int = 200,
+                        frame_ms: int = 10,
+                        channels: int = 1,
+                        max_amplitude: float = 32768.0) -> tuple[int, int] | None:
+    """
+    앞/뒤 무음을 뺀 발화 구간을 ms 단위 (start_ms, end_ms)로 반환합니다.
+    소리가 전혀 없으면 None.
+    """
+    frame_len = int(sample_rate * frame_ms / 1000) * channels
+    db = frame_dbfs(samples, frame_len, max_amplitude=max_amplitude)
+
+    voiced = np.flatnonzero(db > silence_thresh)
+    if voiced.size == 0:
+        return None
+
+    total_ms = int(samples.size / channels * 1000 / sample_rate)
+    start = max(int(voiced[0]) * frame_ms - padding_ms, 0)
+    end = min(int(voiced[-1]) * frame_ms + padding_ms, total_ms)
+    return start, end
+
+
+def _hysteresis_runs(db: np.ndarray,
+                     on_thresh: float,
+                     off_thresh: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    프레임 dBFS 배열에서 히스테리시스 발화 구간을 찾습니다.
+
+    - off_thresh보다 큰 프레임이 연속된 구간 중
+      on_thresh를 넘는 프레임이 하나라도 있는 구간만 발화로 인정
+    - 반환: (시작 프레임 배열, 끝 프레임 배열(미포함))
+    """
+    weak = db > off_thresh
+    if not weak.any():
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    edges = np.diff(np.concatenate(([0], weak.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    # strong ⊂ weak 이므로 reduceat 구간에 섞인 무음 프레임은 영향 없음
+    strong = (db > on_thresh).astype(np.int8)
+    keep = np.maximum.reduceat(strong, starts).astype(bool)
+    return starts[keep], ends[keep]
+
+
+def detect_speech_segments(samples: np.ndarray,
+                           sample_rate: int,
+                           silence_thresh: int = -40,
+                           hysteresis_db: float = 6.0,
+                           min_silence_ms: int = 500,
+                           min_speech_ms: int = 200,
+                           padding_ms: int = 200,
+                           frame_ms: int = 10,
+                           channels: int = 1,
+                           max_amplitude: float = 32768.0) -> List[Tuple[int, int]]:
+    """
+    전체 신호에서 발화 구간들을 원본 기준 절대 ms로 반환합니다.
+
+    - 발화 시작: silence_thresh 초과
+    - 발화 유지: silence_thresh - hysteresis_db 초과 (잠깐 작아져도 끊기지 않음)
+    - min_silence_ms보다 짧은 무음으로 나뉜 구간은 하나로 합침
+    - min_speech_ms보다 짧은 구간은 버림
+    - 앞/뒤로 padding_ms 여유를 붙임 (겹치면 합침)
+
+    :return: [(start_ms, end_ms), ...] (시간 순)
+    """
+    frame_len = int(sample_rate * frame_ms / 1000) * channels
+    db = frame_dbfs(samples, frame_len, max_amplitude=max_amplitude)
+    starts, ends = _hysteresis_runs(db, silence_thresh, silence_thresh - hysteresis_db)
+    if starts.size == 0:
+        return []
+
+    # 짧은 무음 사이 구간 합치기
+    gap_frames = max(1, min_silence_ms // frame_ms)
+    split = np.flatnonzero((starts[1:] - ends[:-1]) >= gap_frames) + 1
+    starts = starts[np.concatenate(([0], split))]
+    ends = ends[np.concatenate((split - 1, [ends.size - 1]))]
+
+    # 너무 짧은 구간 버리기
+    long_enough = (ends - starts) * frame_ms >= min_speech_ms
+    starts, ends = starts[long_enough], ends[long_enough]
+
+    total_ms = int(samples.size / channels * 1000 / sample_rate)
+    segments: List[Tuple[int, int]] = []
+    for s_frame, e_frame in zip(starts.tolist(), ends.tolist()):
+        start = max(s_frame * frame_ms - padding_ms, 0)
+        end = min(e_frame * frame_ms + padding_ms, total_ms)
+        if segments and start <= segments[-1][1]:
+            segments[-1] = (segments[-1][0], end)
+        else:
+            segments.append((start, end))
+    return segments
+
+
 def trim_silence(audio: AudioSegment,
                  silence_thresh: int = -40,
                  padding_ms: int = 200) -> AudioSegment:
     """
     오디오 앞/뒤의 무음을 제거합니다.
 
+    10ms 프레임마다 AudioSegment를 새로 만들던 예전 루프 대신
+    전체 샘플의 프레임 에너지를 NumPy로 한 번에 계산합니다.
+
     :param audio: AudioSegment 객체
     :param silence_thresh: 이 dBFS 이하를 '무음'으로 간주 (예: -40dBFS)
     :param padding_ms: 잘라낸 후 앞/뒤에 남길 여유(ms)
     :return: 앞/뒤 무음이 제거된 AudioSegment
     """
-    # AudioSegment.dBFS 기준으로 상대값 사용
-    # 너무 조용한 녹음의 경우 전체 dBFS가 작을 수 있으므로
-    # 필요하면 호출 측에서 값을 조정해야 합니다.
-    # 여기서는 간단히 split_on_silence 기준을 재사용하지 않고,
     # 앞/뒤만 간단히 잘라주는 버전이므로 정밀 VAD는 아닙니다.
     # (실제 프로덕션에서는 webrtcvad 등 고려 가능)
-    # 일단은 "앞/뒤 긴 무음 제거" 용도로 충분.
 
     # 전체 길이가 너무 짧으면 그냥 반환
     if len(audio) < 2 * padding_ms:
         return audio
 
-    # 앞쪽 무음 찾기: 처음 non-silence 샘플 위치
-    start = 0
-    for ms in range(0, len(audio), 10):
-        if audio[ms:ms + 10].dBFS > silence_thresh:
-            start = max(ms - padding_ms, 0)
-            break
-
-    # 뒤쪽 무음 찾기: 끝에서부터 non-silence
-    end = len(audio)
-    for ms in range(len(audio) - 10, 0, -10):
-        if audio[ms:ms + 10].dBFS > silence_thresh:
-            end = min(ms + padding_ms, len(audio))
-            break
+    samples = np.array(audio.get_array_of_samples())
+    voiced = detect_voiced_range(
+        samples,
+        sample_rate=audio.frame_rate,
+        silence_thresh=silence_thresh,
+        padding_ms=padding_ms,
+        channels=audio.channels,
+        max_amplitude=float(audio.max_possible_amplitude),
+    )
+    if voiced is None:
+        return audio
 
+    start, end = voiced
     return audio[start:end]
 
 
 def split_into_chunks(path: str,
                       min_silence_len: int = 700,
                       silence_thresh: int = -40,
-                      keep_silence: int = 300) -> List[Dict[str, Any]]:
+                      keep_silence: int = 300,
+                      hysteresis_db: float = 6.0,
+                      min_speech_len: int = 200) -> List[Dict[str, Any]]:
     """
     음성 파일을 무음 기준으로 여러 chunk로 나눕니다.
 
-    내부적으로 pydub.silence.split_on_silence를 사용하며,
-    각 chunk의 시작/끝 시각(sec)과 AudioSegment를 함께 반환합니다.
+    detect_speech_segments로 전체 신호의 발화 구간을 한 번에 찾고,
+    각 chunk의 (원본 기준) 시작/끝 시각(sec)과 AudioSegment를 함께 반환합니다.
+    (예전처럼 chunk 길이를 누적하지 않으므로 잘려 나간 무음만큼 시각이 밀리지 않음)
 
     :param path: 오디오 파일 경로
     :param min_silence_len: 이 길이(ms) 이상이면서
                             silence_thresh보다 조용하면 '무음'으로 간주
     :param silence_thresh: 이 dBFS 이하를 무음으로 간주
     :param keep_silence: 분리된 chunk 양 끝에 남겨둘 무음(ms)
+    :param hysteresis_db: 발화 중에는 silence_thresh보다 이만큼 작아져도 발화로 유지
+    :param min_speech_len: 이보다 짧은 발화(ms)는 버림 (클릭/잡음 등)
     :return: [
         {"index": 0, "start": 0.0, "end": 2.34, "audio": AudioSegment(...)},
-        {"index": 1, "start": 2.34, "end": 5.80, "audio": AudioSegment(...)},
+        {"index": 1, "start": 3.10, "end": 5.80, "audio": AudioSegment(...)},
         ...
     ]
     """
     audio = load_audio(path)
-    chunks = split_on_silence(
-        audio,
-        min_silence_len=min_silence_len,
+    samples = np.array(audio.get_array_of_samples())
+
+    spans = detect_speech_segments(
+        samples,
+        sample_rate=audio.frame_rate,
         silence_thresh=silence_thresh,
-        keep_silence=keep_silence,
+        hysteresis_db=hysteresis_db,
+        min_silence_ms=min_silence_len,
+        min_speech_ms=min_speech_len,
+        padding_ms=keep_silence,
+        channels=audio.channels,
+        max_amplitude=float(audio.max_possible_amplitude),
     )
 
     results: List[Dict[str, Any]] = []
-
-    # split_on_silence는 chunk의 절대 시간 정보를 주지 않기 때문에
-    # 단순히 chunk 길이를 누적하면서 start/end를 계산합니다.
-    cursor_ms = 0
-    for idx, chunk in enumerate(chunks):
-        duration_ms = len(chunk)
-        start_sec = cursor_ms / 1000.0
-        end_sec = (cursor_ms + duration_ms) / 1000.0
-
+    for idx, (start_ms, end_ms) in enumerate(spans):
         results.append({
             "index": idx,
-            "start": start_sec,
-            "end": end_sec,
-            "audio": chunk,
+            "start": start_ms / 1000.0,
+            "end": end_ms / 1000.0,
+            "audio": audio[start_ms:end_ms],
         })
 
-        cursor_ms += duration_ms
-
     return results
 
 
+# -------------------------------------------------------------------
+# 실시간 발화 구간 감지 (스트리밍 입력용)
+# -------------------------------------------------------------------
+
+class StreamingVAD:
+    """
+    16bit mono PCM 조각을 계속 받아서
+    여러 발화의 시작/끝을 "스트림 시작 기준 절대 ms"로 알려주는 VAD.
+
+    - 조각마다 완성된 프레임들의 dBFS를 frame_dbfs로 한 번에 계산
+    - detect_speech_segments와 같은 히스테리시스 기준
+      (시작: silence_thresh 초과, 유지: silence_thresh - hysteresis_db 초과)
+    - min_silence_ms 이상 무음이 이어지면 발화 끝
+
+    사용 예:
+        vad = StreamingVAD(sample_rate=16000)
+        for chunk in chunks:
+            for ev in vad.feed(chunk):
+                if ev["type"] == "speech_end":
+                    print(ev["start_ms"], ev["end_ms"])
+        vad.flush()
+    """
+
+    def __init__(self,
+                 sample_rate: int = 16000,
+                 frame_ms: int = 20,
+                 silence_thresh: int = -40,
+                 hysteresis_db: float = 6.0,
+                 min_speech_ms: int = 200,
+                 min_silence_ms: int = 500,
+                 padding_ms: int = 200):
+        self.sample_rate = sample_rate
+        self.frame_ms = frame_ms
+        self.on_thresh = silence_thresh
+        self.off_thresh = silence_thresh - hysteresis_db
+        self.padding_ms = padding_ms
+
+        self.frame_bytes = int(sample_rate * frame_ms / 1000) * 2
+        self.min_speech_frames = max(1, min_speech_ms // frame_ms)
+        self.min_silence_frames = max(1, min_silence_ms // frame_ms)
+
+        self._pending = bytearray()
+        self._frame_idx = 0
+        self._candidate_start: int | None = None  # 유지 기준을 넘기 시작한 프레임
+        self._confirmed = False                   # 시작 기준까지 넘었는지
+        self._last_voiced = 0                     # 마지막 유성 프레임 번호
+        self._speech_start: int | None = None     # 확정된 발화 시작 프레임
+
+    @property
+    def in_speech(self) -> bool:
+        return self._speech_start is not None
+
+    @property
+    def position_ms(self) -> int:
+        """지금까지 분석한 길이(ms, 스트림 시작 기준)."""
+        return self._frame_idx * self.frame_ms
+
+    @property
+    def speech_start_ms(self) -> Optional[int]:
+        """진행 중인 발화의 시작 시각(ms, padding 제외). 발화 중이 아니면 None."""
+        if self._speech_start is None:
+            return None
+        return self._speech_start * self.frame_ms
+
+    def _emit_end(self, end_frame: int) -> Dict[str, Any]:
+        start_ms = max(self._speech_start * self.frame_ms - self.padding_ms, 0)
+        end_ms = min(end_frame * self.frame_ms + self.padding_ms, self._frame_idx * self.frame_ms)
+        self._speech_start = None
+        self._candidate_start = None
+        self._confirmed = False
+        return {"type": "speech_end", "start_ms": start_ms, "end_ms": end_ms}
+
+    def feed(self, pcm: bytes) -> List[Dict[str, Any]]:
+        """
+        PCM 조각을 넣고, 이번 조각에서 발생한 이벤트 목록을 반환합니다.
+
+        :return: [{"type": "speech_start", "start_ms": ...},
+                  {"type": "speech_end", "start_ms": ..., "end_ms": ...}, ...]
+        """
+        events: List[Dict[str, Any]] = []
+        self._pending.extend(pcm)
+
+        n_frames = len(self._pending) // self.frame_bytes
+        if not n_frames:
+            return events
+
+        usable = n_frames * self.frame_bytes
+        samples = np.frombuffer(bytes(self._pending[:usable]), dtype=np.int16)
+        del self._pending[:usable]
+        frame_len = self.frame_bytes // 2
+        db = frame_dbfs(samples, frame_len)
+
+        for value in db.tolist():
+            idx = self._frame_idx
+            self._frame_idx += 1
+
+            if value > self.off_thresh:
+                self._last_voiced = idx
+                if self._candidate_start is None:
+                    self._candidate_start = idx
+                if value > self.on_thresh:
+                    self._confirmed = True
+                if (self._speech_start is None and self._confirmed
+                        and idx - self._candidate_start + 1 >= self.min_speech_frames):
+                    self._speech_start = self._candidate_start
+                    events.append({
+                        "type": "speech_start",
+                        "start_ms": max(self._speech_start * self.frame_ms - self.padding_ms, 0),
+                    })
+                continue
+
+            # 유지 기준 아래 (무음 프레임)
+            if self._speech_start is not None:
+                if idx - self._last_voiced >= self.min_silence_frames:
+                    events.append(self._emit_end(self._last_voiced + 1))
+            elif self._candidate_start is not None:
+                # 발화로 확정되기 전에 끊긴 짧은 소리는 버림
+                self._candidate_start = None
+                self._confirmed = False
+
+        return events
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """입력이 끝났을 때 진행 중인 발화를 끝으로 처리합니다."""
+        if self._speech_start is not None:
+            return [self._emit_end(self._last_voiced + 1)]
+        return []
+
+
+# -------------------------------------------------------------------
+# 실시간 발화 끝 감지 (스트리밍 입력용)
+# -------------------------------------------------------------------
+
+class StreamingEndpointer:
+    """
+    16bit mono PCM 조각을 계속 받아서
+    "발화 시작"과 "발화 끝(endpoint)"을 알려주고, 끝난 발화의 PCM을 잘라 주는 래퍼.
+
+    - 발화 구간 판정은 StreamingVAD(히스테리시스)에 맡김
+      (split_into_chunks / detect_speech_segments와 같은 기준)
+    - end_silence_ms 이상 무음이 이어지면 발화 끝
+    - max_utterance_ms를 넘기면 강제로 발화 끝 처리
+    - PCM은 발화 시작 전에는 최근 preroll_ms만, 발화 중에는 발화 시작부터 보관
+      (대기 중인 키오스크 연결이 무음을 끝없이 쌓지 않도록)
+    - 발화 끝 뒤에 이미 받은 소리/이벤트는 reset() 후 다음 발화로 넘김
+
+    사용 예:
+        ep = StreamingEndpointer(sample_rate=16000)
+        for chunk in chunks:
+            for event in ep.feed(chunk):
+                if event == "speech_end":
+                    wav_pcm = ep.utterance_pcm()
+                    ep.reset()
+    """
+
+    def __init__(self,
+                 sample_rate: int = 16000,
+                 frame_ms: int = 20,
+                 silence_thresh: int = -40,
+                 hysteresis_db: float = 6.0,
+                 min_speech_ms: int = 200,
+                 end_silence_ms: int = 800,
+                 padding_ms: int = 200,
+                 max_utterance_ms: int = 30000,
+                 preroll_ms: int = 1000):
+        self.sample_rate = sample_rate
+        self.max_utterance_ms = max_utterance_ms
+        # 히스테리시스 때문에 발화 시작이 시작 판정 시점보다 앞설 수 있어 padding보다 넉넉히 보관
+        self.preroll_ms = max(preroll_ms, padding_ms + min_speech_ms)
+
+        self._vad = StreamingVAD(
+            sample_rate=sample_rate,
+            frame_ms=frame_ms,
+            silence_thresh=silence_thresh,
+            hysteresis_db=hysteresis_db,
+            min_speech_ms=min_speech_ms,
+            min_silence_ms=end_silence_ms,
+            padding_ms=padding_ms,
+        )
+
+        self._buf = bytearray()   # 보관 중인 PCM (스트림 기준 _buf_start 바이트부터)
+        self._buf_start = 0
+        self._received = 0        # 지금까지 받은 전체 바이트 수
+        self._queue: List[Dict[str, Any]] = []   # 아직 알리지 않은 VAD 이벤트 (발화 끝 뒤)
+        self._active_start_ms: Optional[int] = None
+        self._utterance: Optional[Tuple[int, int]] = None   # 끝난 발화 (start_ms, end_ms)
+
+    @property
+    def in_speech(self) -> bool:
+        return self._active_start_ms is not None
+
+    @property
+    def ended(self) -> bool:
+        return self._utterance is not None
+
+    def _ms_to_bytes(self, ms: int) -> int:
+        return int(ms * self.sample_rate / 1000) * 2
+
+    def _trim(self) -> None:
+        """지금 보관할 필요가 없는 앞부분 PCM을 버린다."""
+        starts = [ev["start_ms"] for ev in self._queue]
+        if self._utterance is not None:
+            starts.append(self._utterance[0])
+        if self._active_start_ms is not None:
+            starts.append(self._active_start_ms)
+
+        if starts:
+            keep_from = self._ms_to_bytes(min(starts))
+        else:
+            keep_from = self._received - self._ms_to_bytes(self.preroll_ms)
+        drop = keep_from - self._buf_start
+        if drop > 0:
+            del self._buf[:drop]
+            self._buf_start += drop
+
+    def _drain(self) -> List[str]:
+        """쌓인 VAD 이벤트를 발화 하나가 끝날 때까지 꺼내서 문자열 이벤트로 바꾼다."""
+        events: List[str] = []
+        while self._queue and self._utterance is None:
+            ev = self._queue.pop(0)
+            if ev["type"] == "speech_start":
+                self._active_start_ms = ev["start_ms"]
+                events.append("speech_start")
+            else:
+                self._utterance = (ev["start_ms"], ev["end_ms"])
+                self._active_start_ms = None
+                events.append("speech_end")
+        self._trim()
+        return events
+
+    def feed(self, pcm: bytes) -> List[str]:
+        """
+        PCM 조각을 넣고, 이번 조각에서 발생한 이벤트 목록을 반환합니다.
+        발화 끝 이후 reset() 전까지 생긴 이벤트는 reset() 뒤의 feed()에서 알려줍니다.
+
+        :return: ["speech_start"], ["speech_end"], [] 등
+        """
+        if pcm:
+            self._buf.extend(pcm)
+            self._received += len(pcm)
+            self._queue.extend(self._vad.feed(pcm))
+
+        start_ms = self._vad.speech_start_ms
+        if start_ms is not None and self._vad.position_ms - start_ms >= self.max_utterance_ms:
+            self._queue.extend(self._vad.flush())
+
+        return self._drain()
+
+    def finish(self) -> List[str]:
+        """입력이 끊겼을 때(클라이언트 종료 등) 진행 중인 발화를 끝으로 처리합니다."""
+        self._queue.extend(self._vad.flush())
+        return self._drain()
+
+    def utterance_pcm(self) -> bytes:
+        """끝난 발화 구간(앞/뒤 padding_ms 포함)의 PCM 바이트를 반환합니다."""
+        if self._utterance is None:
+            return b""
+        start_ms, end_ms = self._utterance
+        start = max(self._ms_to_bytes(start_ms), self._buf_start)
+        end = min(self._ms_to_bytes(end_ms), self._received)
+        return bytes(self._buf[start - self._buf_start:end - self._buf_start])
+
+    def reset(self):
+        """다음 발화를 받을 준비를 합니다. (끝난 발화 뒤에 받은 소리와 이벤트는 유지)"""
+        self._utterance = None
+        self._trim()
+
+
 # -------------------------------------------------------------------
 # CLI 테스트용
 # -------------------------------------------------------------------
 
 if __name__ == "__main__":
-    print("VAD(split_on_silence) 테스트 모드입니다.")
+    print("VAD(히스테리시스 발화 구간) 테스트 모드입니다.")
     print("음성 파일 경로를 입력하면, 무음 기준으로 chunk를 나눕니다. (종료: 빈 줄)")
 
     while True: